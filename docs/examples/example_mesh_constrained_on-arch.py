@@ -5,7 +5,8 @@ from compas.geometry import NurbsCurve
 from compas.geometry import Point
 from compas.geometry import Sphere
 from compas.geometry import Vector
-from compas_dr.constraints import Constraint
+from compas_dr.constraints import ConstraintSet
+from compas_dr.constraints import MultiConstraint
 from compas_dr.numdata import InputData
 from compas_dr.solvers import dr_constrained_numpy
 from compas_viewer import Viewer
@@ -31,15 +32,18 @@ inputdata = InputData.from_mesh(mesh, fixed, loads, qpre)
 # =============================================================================
 
 arch = NurbsCurve.from_points([[5, 0, 0], [5, 5, 5], [5, 10, 0]])
-constraint = Constraint(arch)
+constraint = MultiConstraint(arch)
 
-constraints = [None] * mesh.number_of_vertices()
+vertices = []
 for vertex in mesh.vertices_where(x=5):
     if vertex in fixed:
         continue
-    constraints[vertex] = constraint
+    vertices.append(vertex)
     fixed.append(vertex)
 
+constraints = ConstraintSet()
+constraints.add(constraint, vertices)
+
 # =============================================================================
 # Solve and Update
 # =============================================================================
@@ -67,7 +71,7 @@ for vertex in fixed:
 
     ball = Sphere(radius=0.1, point=point).to_brep()
     line = Line(point, point - residual)
-    ballcolor = Color.blue() if constraints[vertex] else Color.red()
+    ballcolor = Color.blue() if vertex in constraints else Color.red()
 
     viewer.scene.add(ball, surfacecolor=ballcolor, show_points=False)
     viewer.scene.add(line, linecolor=forcecolor, lineswidth=3, show_points=False)
@@ -114,7 +114,7 @@ for a, b in zip(bottom_ring[:-1], top_ring[:-1]):
 # Constraints
 # =============================================================================
 
-constraint = Constraint(outer)
+constraint = Constraint(Ellipse(major=20, minor=0.75 * 20))
 
 graph.nodes_attribute(
     name="anchor",
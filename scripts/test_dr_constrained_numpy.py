@@ -5,7 +5,8 @@ from compas.geometry import NurbsCurve
 from compas.geometry import Point
 from compas.geometry import Sphere
 from compas.geometry import Vector
-from compas_dr.constraints import Constraint
+from compas_dr.constraints import ConstraintSet
+from compas_dr.constraints import MultiConstraint
 from compas_dr.numdata import InputData
 from compas_dr.solvers import dr_constrained_numpy
 from compas_view2.app import App
@@ -36,12 +37,13 @@ inputdata = InputData.from_mesh(mesh, fixed, loads, qpre)
 # constraints
 
 arch = NurbsCurve.from_points([[5, 0, 0], [5, 5, 5], [5, 10, 0]])
-constraint = Constraint(arch)
+constraint = MultiConstraint(arch)
 
-constraints = [None] * mesh.number_of_vertices()
-for vertex in mesh.vertices_where(x=5):
-    constraints[vertex] = constraint
-    fixed.append(vertex)
+vertices = list(mesh.vertices_where(x=5))
+fixed += vertices
+
+constraints = ConstraintSet()
+constraints.add(constraint, vertices)
 
 # =============================================================================
 # Solve and Update
@@ -66,7 +68,7 @@ for vertex in mesh.vertices():
     if vertex in fixed:
         ball = Sphere(radius=0.1, point=point)
 
-        if constraints[vertex]:
+        if vertex in constraints:
             viewer.add(ball.to_brep(), facecolor=Color.blue())
         else:
             viewer.add(ball.to_brep(), facecolor=Color.red())
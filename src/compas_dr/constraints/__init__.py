@@ -4,22 +4,70 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import compas
 from compas.geometry import Line
 from compas.geometry import Plane
 from compas.geometry import Circle
+from compas.geometry import Ellipse
 from compas.geometry import NurbsCurve
 from compas.geometry import NurbsSurface
+from compas.geometry import Pointcloud
+from compas.geometry import Box
+from compas.geometry import Cylinder
+from compas.datastructures import Mesh
 
 from .constraint import Constraint
 
 from .lineconstraint import LineConstraint
 from .planeconstraint import PlaneConstraint
 from .circleconstraint import CircleConstraint
+from .ellipseconstraint import EllipseConstraint
 from .curveconstraint import CurveConstraint
 from .surfaceconstraint import SurfaceConstraint
+from .meshconstraint import MeshConstraint
+from .pointcloudconstraint import PointcloudConstraint
+
+from .constraintset import ConstraintSet
+
+if not compas.IPY:
+    from .multiconstraint import MultiConstraint
+
+    from .contact import Contact
+    from .planecontact import PlaneContact
+    from .boxcontact import BoxContact
+    from .cylindercontact import CylinderContact
+
+    Contact.register(Plane, PlaneContact)
+    Contact.register(Box, BoxContact)
+    Contact.register(Cylinder, CylinderContact)
 
 Constraint.register(Line, LineConstraint)
 Constraint.register(Plane, PlaneConstraint)
 Constraint.register(Circle, CircleConstraint)
+Constraint.register(Ellipse, EllipseConstraint)
 Constraint.register(NurbsCurve, CurveConstraint)
 Constraint.register(NurbsSurface, SurfaceConstraint)
+Constraint.register(Mesh, MeshConstraint)
+Constraint.register(Pointcloud, PointcloudConstraint)
+
+__all__ = [
+    "Constraint",
+    "LineConstraint",
+    "PlaneConstraint",
+    "CircleConstraint",
+    "EllipseConstraint",
+    "CurveConstraint",
+    "SurfaceConstraint",
+    "MeshConstraint",
+    "PointcloudConstraint",
+    "ConstraintSet",
+]
+
+if not compas.IPY:
+    __all__ += [
+        "MultiConstraint",
+        "Contact",
+        "PlaneContact",
+        "BoxContact",
+        "CylinderContact",
+    ]
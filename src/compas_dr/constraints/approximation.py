@@ -0,0 +1,258 @@
+import numpy
+
+from .bvh import BVH
+
+
+class PolylineApproximation:
+    """Class representing a polyline approximation of a curve, for fast closest point queries.
+
+    The curve is sampled at uniformly spaced parameters,
+    and segments of which the midpoint deviates more than the chord tolerance from the curve are split,
+    until all segments are within the tolerance.
+
+    Parameters
+    ----------
+    curve : :class:`compas.geometry.Curve`
+        The curve.
+    chord_tolerance : float
+        The maximum distance between the curve and the midpoints of the segments.
+    samples : int, optional
+        The number of initial segments.
+    max_points : int, optional
+        The maximum number of points of the polyline.
+
+    Attributes
+    ----------
+    points : array
+        The points of the polyline.
+    params : array
+        The parameters of the points on the curve.
+
+    """
+
+    def __init__(self, curve, chord_tolerance, samples=16, max_points=100000):
+        start, end = curve.domain
+        params = numpy.linspace(start, end, samples + 1)
+        points = numpy.array([curve.point_at(t) for t in params], dtype=float)
+
+        while len(params) < max_points:
+            mid = 0.5 * (params[:-1] + params[1:])
+            midpoints = numpy.array([curve.point_at(t) for t in mid], dtype=float)
+            deviation = numpy.linalg.norm(midpoints - 0.5 * (points[:-1] + points[1:]), axis=1)
+            split = numpy.flatnonzero(deviation > chord_tolerance)
+            if not len(split):
+                break
+            params = numpy.insert(params, split + 1, mid[split])
+            points = numpy.insert(points, split + 1, midpoints[split], axis=0)
+
+        self.points = points
+        self.params = params
+        self._start = points[:-1]
+        self._vectors = points[1:] - points[:-1]
+        self._lengths = numpy.einsum("ij,ij->i", self._vectors, self._vectors)
+        self._lengths[self._lengths == 0] = 1.0
+
+    def closest_point(self, point):
+        """Compute the closest point on the polyline.
+
+        Parameters
+        ----------
+        point : [float, float, float] | :class:`compas.geometry.Point`
+            The point.
+
+        Returns
+        -------
+        tuple[array, float, array]
+            The closest point,
+            the interpolated parameter of the closest point on the curve,
+            and the unit direction of the closest segment.
+
+        """
+        point = numpy.asarray(point, dtype=float)
+        t = numpy.einsum("ij,ij->i", point - self._start, self._vectors) / self._lengths
+        t = numpy.clip(t, 0.0, 1.0)
+        closest = self._start + t[:, None] * self._vectors
+        distances = numpy.einsum("ij,ij->i", closest - point, closest - point)
+        i = numpy.argmin(distances)
+        param = self.params[i] + t[i] * (self.params[i + 1] - self.params[i])
+        direction = self._vectors[i] / self._lengths[i] ** 0.5
+        return closest[i], param, direction
+
+    def closest_points(self, points, chunksize=1000000):
+        """Compute the closest points on the polyline for multiple points at once.
+
+        Parameters
+        ----------
+        points : array
+            The points, as an array of shape ``(n, 3)``.
+        chunksize : int, optional
+            The maximum number of point-segment pairs that are evaluated at once.
+
+        Returns
+        -------
+        tuple[array, array, array]
+            The closest points,
+            the interpolated parameters of the closest points on the curve,
+            and the unit directions of the closest segments.
+
+        """
+        points = numpy.asarray(points, dtype=float)
+        closest = numpy.empty_like(points)
+        params = numpy.empty(len(points))
+        directions = numpy.empty_like(points)
+        n = max(1, chunksize // len(self._start))
+
+        for i in range(0, len(points), n):
+            chunk = points[i : i + n, None, :]
+            t = numpy.einsum("ijk,jk->ij", chunk - self._start, self._vectors) / self._lengths
+            t = numpy.clip(t, 0.0, 1.0)
+            candidates = self._start + t[:, :, None] * self._vectors
+            distances = numpy.einsum("ijk,ijk->ij", candidates - chunk, candidates - chunk)
+            j = numpy.argmin(distances, axis=1)
+            k = numpy.arange(len(j))
+            closest[i : i + n] = candidates[k, j]
+            params[i : i + n] = self.params[j] + t[k, j] * (self.params[j + 1] - self.params[j])
+            directions[i : i + n] = self._vectors[j] / self._lengths[j, None] ** 0.5
+
+        return closest, params, directions
+
+
+class MeshApproximation:
+    """Class representing a triangle mesh approximation of a surface, for fast closest point queries.
+
+    The surface is sampled on a grid of uniformly spaced parameters,
+    and rows and columns of the grid are inserted in between rows or columns with cells
+    of which the center or the midpoints of the sides deviate more than the chord tolerance from the surface,
+    until all cells are within the tolerance.
+    Every cell of the grid is split in two triangles.
+
+    Parameters
+    ----------
+    surface : :class:`compas.geometry.Surface`
+        The surface.
+    chord_tolerance : float
+        The maximum distance between the surface and the midpoints of the cells.
+    samples : int, optional
+        The number of initial rows and columns.
+    max_points : int, optional
+        The maximum number of points of the grid.
+
+    Attributes
+    ----------
+    points : array
+        The vertices of the triangles.
+    params : array
+        The parameters of the vertices on the surface.
+    triangles : array
+        The vertex indices of the triangles.
+
+    """
+
+    def __init__(self, surface, chord_tolerance, samples=8, max_points=250000):
+        u = numpy.linspace(*surface.domain_u, samples + 1)
+        v = numpy.linspace(*surface.domain_v, samples + 1)
+
+        def evaluate(u, v):
+            return numpy.array([[surface.point_at(a, b) for b in v] for a in u], dtype=float)
+
+        points = evaluate(u, v)
+
+        while len(u) * len(v) < max_points:
+            um = 0.5 * (u[:-1] + u[1:])
+            vm = 0.5 * (v[:-1] + v[1:])
+
+            # the midpoints of the sides along u and v, and the centers of the cells
+
+            du = numpy.linalg.norm(evaluate(um, v) - 0.5 * (points[:-1] + points[1:]), axis=2)
+            dv = numpy.linalg.norm(evaluate(u, vm) - 0.5 * (points[:, :-1] + points[:, 1:]), axis=2)
+            center = 0.25 * (points[:-1, :-1] + points[1:, :-1] + points[:-1, 1:] + points[1:, 1:])
+            dc = numpy.linalg.norm(evaluate(um, vm) - center, axis=2)
+
+            rows = numpy.flatnonzero((du > chord_tolerance).any(axis=1) | (dc > chord_tolerance).any(axis=1))
+            columns = numpy.flatnonzero((dv > chord_tolerance).any(axis=0) | (dc > chord_tolerance).any(axis=0))
+            if not len(rows) and not len(columns):
+                break
+            u = numpy.insert(u, rows + 1, um[rows])
+            v = numpy.insert(v, columns + 1, vm[columns])
+            points = evaluate(u, v)
+
+        nu = len(u)
+        nv = len(v)
+        index = numpy.arange(nu * nv).reshape((nu, nv))
+        a = index[:-1, :-1].ravel()
+        b = index[1:, :-1].ravel()
+        c = index[1:, 1:].ravel()
+        d = index[:-1, 1:].ravel()
+
+        self.points = points.reshape((-1, 3))
+        self.params = numpy.stack(numpy.meshgrid(u, v, indexing="ij"), axis=-1).reshape((-1, 2))
+        self.triangles = numpy.concatenate([numpy.column_stack([a, b, c]), numpy.column_stack([a, c, d])])
+
+        A, B, C = (self.points[self.triangles[:, i]] for i in range(3))
+        self._a = A
+        self._ab = B - A
+        self._ac = C - A
+
+        # a bounding volume hierarchy of the triangles
+        # for the closest point queries
+
+        self._bvh = BVH(self.points, self.triangles)
+
+        # the inverse of the metric tensor of every triangle
+        # for the barycentric coordinates of the closest points
+
+        d00 = numpy.einsum("ij,ij->i", self._ab, self._ab)
+        d01 = numpy.einsum("ij,ij->i", self._ab, self._ac)
+        d11 = numpy.einsum("ij,ij->i", self._ac, self._ac)
+        det = d00 * d11 - d01 * d01
+        det[det == 0] = 1.0
+        self._metric = numpy.stack([d11, -d01, d00], axis=1) / det[:, None]
+
+    def closest_point(self, point):
+        """Compute the closest point on the triangles.
+
+        Parameters
+        ----------
+        point : [float, float, float] | :class:`compas.geometry.Point`
+            The point.
+
+        Returns
+        -------
+        tuple[array, tuple[float, float], array]
+            The closest point,
+            the interpolated parameters of the closest point on the surface,
+            and the unit normal of the closest triangle.
+
+        """
+        closest, params, normals = self.closest_points(numpy.asarray(point, dtype=float).reshape((1, 3)))
+        return closest[0], tuple(params[0]), normals[0]
+
+    def closest_points(self, points):
+        """Compute the closest points on the triangles for multiple points.
+
+        Parameters
+        ----------
+        points : array
+            The points, as an array of shape ``(n, 3)``.
+
+        Returns
+        -------
+        tuple[array, array, array]
+            The closest points,
+            the interpolated parameters of the closest points on the surface,
+            and the unit normals of the closest triangles.
+
+        """
+        closest, triangles = self._bvh.closest_points(points)
+
+        # the parameters are interpolated with the barycentric coordinates of the closest points
+
+        w = closest - self._a[triangles]
+        e0 = numpy.einsum("ij,ij->i", w, self._ab[triangles])
+        e1 = numpy.einsum("ij,ij->i", w, self._ac[triangles])
+        metric = self._metric[triangles]
+        s = metric[:, 0] * e0 + metric[:, 1] * e1
+        t = metric[:, 1] * e0 + metric[:, 2] * e1
+        a, b, c = (self.params[self.triangles[triangles, i]] for i in range(3))
+        params = a + s[:, None] * (b - a) + t[:, None] * (c - a)
+        return closest, params, self._bvh.normals[triangles]
@@ -0,0 +1,42 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy
+from compas.geometry import Box
+
+from .contact import Contact
+
+
+class BoxContact(Contact):
+    """Contact for keeping vertices inside a box.
+
+    The points are evaluated in the local coordinate system of the box.
+
+    """
+
+    DATASCHEMA = {
+        "type": "object",
+        "properties": {
+            "geometry": Box.DATASCHEMA,
+        },
+        "required": ["geometry"],
+    }
+
+    @classmethod
+    def __from_data__(cls, data):
+        return cls(Box.__from_data__(data["geometry"]))
+
+    def _half(self):
+        return 0.5 * numpy.array([self.geometry.xsize, self.geometry.ysize, self.geometry.zsize])
+
+    def distances(self, points):
+        excess = numpy.abs(self._to_local(points)) - self._half()
+        outside = numpy.linalg.norm(numpy.maximum(excess, 0.0), axis=1)
+        return numpy.where(outside > 0, -outside, -excess.max(axis=1))
+
+    def closest_points(self, points):
+        local = self._to_local(points)
+        half = self._half()
+        closest = numpy.clip(local, -half, half)
+        return self._to_world(closest, closest - local)
@@ -0,0 +1,258 @@
+import numpy
+
+
+def closest_points_on_triangles(points, a, b, c):
+    """Compute the closest points on triangles, for pairs of points and triangles.
+
+    The closest points are computed by identifying the Voronoi region of every point
+    with respect to the vertices, sides and interior of its triangle.
+
+    Parameters
+    ----------
+    points : array
+        The points, as an array of shape ``(n, 3)``.
+    a : array
+        The first vertices of the triangles, as an array of shape ``(n, 3)``.
+    b : array
+        The second vertices of the triangles, as an array of shape ``(n, 3)``.
+    c : array
+        The third vertices of the triangles, as an array of shape ``(n, 3)``.
+
+    Returns
+    -------
+    array
+        The closest points.
+
+    """
+    ab = b - a
+    ac = c - a
+    ap = points - a
+    bp = points - b
+    cp = points - c
+
+    d1 = numpy.einsum("ij,ij->i", ab, ap)
+    d2 = numpy.einsum("ij,ij->i", ac, ap)
+    d3 = numpy.einsum("ij,ij->i", ab, bp)
+    d4 = numpy.einsum("ij,ij->i", ac, bp)
+    d5 = numpy.einsum("ij,ij->i", ab, cp)
+    d6 = numpy.einsum("ij,ij->i", ac, cp)
+
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+
+    # the barycentric coordinates along AB and AC in every region
+    # the first region that contains the point is used
+
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        regions = [
+            (d1 <= 0) & (d2 <= 0),
+            (d3 >= 0) & (d4 <= d3),
+            (vc <= 0) & (d1 >= 0) & (d3 <= 0),
+            (d6 >= 0) & (d5 <= d6),
+            (vb <= 0) & (d2 >= 0) & (d6 <= 0),
+            (va <= 0) & (d4 >= d3) & (d5 >= d6),
+        ]
+        ab_bc = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        denom = va + vb + vc
+        denom[denom == 0] = 1.0
+        v = numpy.select(regions, [0.0, 1.0, d1 / (d1 - d3), 0.0, 0.0, 1.0 - ab_bc], vb / denom)
+        w = numpy.select(regions, [0.0, 0.0, 0.0, 1.0, d2 / (d2 - d6), ab_bc], vc / denom)
+
+    return a + v[:, None] * ab + w[:, None] * ac
+
+
+class BVH:
+    """Class representing a bounding volume hierarchy of axis-aligned boxes over triangles, for closest point queries.
+
+    The hierarchy is a binary tree, of which the triangles of every node are split in two halves
+    at the median of their centroids along the largest dimension of the node,
+    until the nodes contain at most ``leaf_size`` triangles.
+
+    Parameters
+    ----------
+    vertices : array
+        The vertices of the triangles, as an array of shape ``(n, 3)``.
+    triangles : array
+        The vertex indices of the triangles, as an array of shape ``(m, 3)``.
+    leaf_size : int, optional
+        The maximum number of triangles of a leaf of the tree.
+
+    Attributes
+    ----------
+    vertices : array
+        The vertices of the triangles.
+    triangles : array
+        The vertex indices of the triangles.
+    normals : array
+        The unit normals of the triangles.
+
+    """
+
+    def __init__(self, vertices, triangles, leaf_size=8):
+        self.vertices = numpy.asarray(vertices, dtype=float)
+        self.triangles = numpy.asarray(triangles, dtype=int)
+
+        a, b, c = (self.vertices[self.triangles[:, i]] for i in range(3))
+        normals = numpy.cross(b - a, c - a)
+        lengths = numpy.linalg.norm(normals, axis=1)
+        lengths[lengths == 0] = 1.0
+        self.normals = normals / lengths[:, None]
+        self._a = a
+        self._b = b
+        self._c = c
+
+        lower = numpy.minimum(numpy.minimum(a, b), c)
+        upper = numpy.maximum(numpy.maximum(a, b), c)
+        centroids = (a + b + c) / 3
+
+        # the tree is stored in flat arrays, and built level by level
+        # the triangles of a node are a contiguous range of the reordered triangle indices
+        # the children of a leaf are -1
+
+        order = numpy.arange(len(self.triangles))
+        ranges = [numpy.array([[0, len(order)]])]
+        children = []
+        count = 1
+
+        while True:
+            level = ranges[-1]
+            sizes = level[:, 1] - level[:, 0]
+            split = numpy.flatnonzero(sizes > leaf_size)
+            links = numpy.full((len(level), 2), -1)
+            children.append(links)
+            if not len(split):
+                break
+
+            # the triangles of every split node are sorted along the largest dimension of their centroids
+            # with one sort for all nodes of the level
+
+            starts = level[split, 0]
+            sizes = sizes[split]
+            segments = numpy.repeat(numpy.arange(len(split)), sizes)
+            positions = numpy.arange(sizes.sum()) - numpy.repeat(numpy.cumsum(sizes) - sizes, sizes) + numpy.repeat(starts, sizes)
+            points = centroids[order[positions]]
+            offsets = numpy.cumsum(sizes) - sizes
+            extent = numpy.maximum.reduceat(points, offsets) - numpy.minimum.reduceat(points, offsets)
+            axis = numpy.argmax(extent, axis=1)
+            keys = points[numpy.arange(len(points)), axis[segments]]
+            order[positions] = order[positions][numpy.lexsort((keys, segments))]
+
+            half = starts + sizes // 2
+            links[split, 0] = count + 2 * numpy.arange(len(split))
+            links[split, 1] = links[split, 0] + 1
+            count += 2 * len(split)
+            ranges.append(numpy.column_stack([numpy.column_stack([starts, half]), numpy.column_stack([half, starts + sizes])]).reshape((-1, 2)))
+
+        self._order = order
+        self._ranges = numpy.concatenate(ranges)
+        self._children = numpy.concatenate(children)
+
+        # the boxes of the leaves contain their triangles
+        # the boxes of the other nodes are merged from the boxes of their children, bottom-up
+
+        self._lower = numpy.empty((count, 3))
+        self._upper = numpy.empty((count, 3))
+        leaves = numpy.flatnonzero(self._children[:, 0] < 0)
+        leaves = leaves[numpy.argsort(self._ranges[leaves, 0])]
+        starts = self._ranges[leaves, 0]
+        self._lower[leaves] = numpy.minimum.reduceat(lower[order], starts)
+        self._upper[leaves] = numpy.maximum.reduceat(upper[order], starts)
+        first = count
+        for links in reversed(children):
+            first -= len(links)
+            internal = numpy.flatnonzero(links[:, 0] >= 0)
+            left, right = links[internal].T
+            self._lower[first + internal] = numpy.minimum(self._lower[left], self._lower[right])
+            self._upper[first + internal] = numpy.maximum(self._upper[left], self._upper[right])
+
+    def _box_distances(self, points, nodes):
+        d = numpy.maximum(numpy.maximum(self._lower[nodes] - points, points - self._upper[nodes]), 0.0)
+        return numpy.einsum("ij,ij->i", d, d)
+
+    def _leaf_triangles(self, pairs, nodes):
+        start = self._ranges[nodes, 0]
+        counts = self._ranges[nodes, 1] - start
+        offsets = numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+        return numpy.repeat(pairs, counts), self._order[numpy.repeat(start, counts) + offsets]
+
+    def _update(self, points, pairs, triangles, closest, best, result):
+        if not len(pairs):
+            return
+        candidates = closest_points_on_triangles(points[pairs], self._a[triangles], self._b[triangles], self._c[triangles])
+        distances = numpy.einsum("ij,ij->i", candidates - points[pairs], candidates - points[pairs])
+
+        # the nearest candidate of every point
+        # replaces the current closest point if it is nearer
+
+        order = numpy.lexsort((distances, pairs))
+        first = numpy.ones(len(order), dtype=bool)
+        first[1:] = pairs[order][1:] != pairs[order][:-1]
+        nearest = order[first]
+        nearer = distances[nearest] < best[pairs[nearest]]
+        nearest = nearest[nearer]
+        best[pairs[nearest]] = distances[nearest]
+        closest[pairs[nearest]] = candidates[nearest]
+        result[pairs[nearest]] = triangles[nearest]
+
+    def closest_points(self, points, hints=None):
+        """Compute the closest points on the triangles.
+
+        The closest triangle of every point is searched in two stages.
+        First, an upper bound of the distance is computed with the triangle provided as hint,
+        or with the triangles of the leaf that is reached by descending the tree towards the nearest box.
+        Then, the tree is traversed breadth-first for all points at once,
+        skipping the nodes of which the box is further away than the upper bound.
+
+        Parameters
+        ----------
+        points : array
+            The points, as an array of shape ``(n, 3)``.
+        hints : array, optional
+            The indices of triangles that are close to the points, for example the closest triangles of a previous query.
+
+        Returns
+        -------
+        tuple[array, array]
+            The closest points, and the indices of the closest triangles.
+
+        """
+        points = numpy.asarray(points, dtype=float).reshape((-1, 3))
+        n = len(points)
+        closest = numpy.empty_like(points)
+        best = numpy.full(n, numpy.inf)
+        result = numpy.zeros(n, dtype=int)
+
+        if hints is not None:
+            hints = numpy.asarray(hints, dtype=int)
+            self._update(points, numpy.arange(n), hints, closest, best, result)
+            descend = numpy.zeros(0, dtype=int)
+        else:
+            descend = numpy.arange(n)
+
+        # greedy descent
+
+        nodes = numpy.zeros(len(descend), dtype=int)
+        while True:
+            internal = numpy.flatnonzero(self._children[nodes, 0] >= 0)
+            if not len(internal):
+                break
+            left, right = self._children[nodes[internal]].T
+            p = points[descend[internal]]
+            nodes[internal] = numpy.where(self._box_distances(p, left) <= self._box_distances(p, right), left, right)
+        self._update(points, *self._leaf_triangles(descend, nodes), closest, best, result)
+
+        # breadth-first traversal
+
+        pairs = numpy.arange(n)
+        nodes = numpy.zeros(n, dtype=int)
+        while len(pairs):
+            keep = self._box_distances(points[pairs], nodes) < best[pairs]
+            pairs = pairs[keep]
+            nodes = nodes[keep]
+            leaf = self._children[nodes, 0] < 0
+            self._update(points, *self._leaf_triangles(pairs[leaf], nodes[leaf]), closest, best, result)
+            pairs = numpy.repeat(pairs[~leaf], 2)
+            nodes = self._children[nodes[~leaf]].ravel()
+
+        return closest, result
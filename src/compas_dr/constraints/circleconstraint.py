@@ -2,9 +2,12 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from math import atan2
+from math import cos
+from math import pi
+from math import sin
+
 from compas.geometry import Circle
-from compas.geometry import NurbsCurve
-from compas.geometry import Point
 from compas.geometry import Vector
 from compas.geometry import vector_component
 
@@ -12,13 +15,22 @@ from .constraint import Constraint
 
 
 class CircleConstraint(Constraint):
-    """Constraint for limiting the movement of a vertex to a circle."""
+    """Constraint for limiting the movement of a vertex to a circle.
+
+    The vertex is projected analytically on the circle, in the local coordinate system of the circle.
+    The parameter of the projection is the angle with the X axis of the circle, divided by ``2 * pi``,
+    as in :meth:`compas.geometry.Circle.point_at`.
+
+    """
+
+    DIMENSION = 1
 
     DATASCHEMA = {
         "type": "object",
         "properties": {
             "geometry": Circle.DATASCHEMA,
             "rhino_guid": {"type": "string"},
+            "tolerance": {"type": "number"},
         },
         "required": ["geometry"],
     }
@@ -26,42 +38,50 @@ class CircleConstraint(Constraint):
     @classmethod
     def __from_data__(cls, data):
         circle = Circle.__from_data__(data["geometry"])
-        curve = NurbsCurve.from_circle(circle)
-        constraint = cls(curve)
+        constraint = cls(circle, tolerance=data.get("tolerance", 1e-3))
         if "rhino_guid" in data:
             constraint._rhino_guid = str(data["rhino_guid"])
         return constraint
 
-    @property
-    def location(self):
-        return self._location
-
-    @location.setter
-    def location(self, point):
-        self._tangent = None
-        self._normal = None
-        self._location = Point(*point)
-        self.project()
-
     def compute_tangent(self):
-        direction = self.geometry.tangent_at(self._param)
-        self._tangent = Vector(*vector_component(self.residual, direction))
+        self._tangent = Vector(*vector_component(self.residual, self._frame))
 
     def compute_normal(self):
         self._normal = self.residual - self.tangent
 
     def update(self, damping=0.1):
         self._location = self.location + self.tangent * damping
-        pt_on_curve = self.geometry.closest_point(self._location, return_parameter=False)
-        if self._location.distance_to_point(pt_on_curve) > 0.001:
-            self.project()
+        self.project()
 
     def project(self):
-        xyz, self._param = self.geometry.closest_point(self._location, return_parameter=True)
-        self._location = Point(*xyz)
+        self.compute_param()
+        self.update_location_at_param()
 
     def compute_param(self):
-        _, self._param = self.geometry.closest_point(self._location, return_parameter=True)
+        frame = self.geometry.frame
+        vector = self._location - frame.point
+        angle = atan2(vector.dot(frame.yaxis), vector.dot(frame.xaxis))
+        self._param = (angle / (2 * pi)) % 1.0
 
     def update_location_at_param(self):
-        self._location = self.geometry.point_at(self._param)
+        frame = self.geometry.frame
+        angle = 2 * pi * self._param
+        c = cos(angle)
+        s = sin(angle)
+        self._location = frame.point + frame.xaxis * (self.geometry.radius * c) + frame.yaxis * (self.geometry.radius * s)
+        self._anchor = self._location
+        self._frame = frame.xaxis * -s + frame.yaxis * c
+
+    def project_points(self, points, params=None):
+        import numpy
+
+        frame = self.geometry.frame
+        origin = numpy.asarray(frame.point, dtype=float)
+        xaxis = numpy.asarray(frame.xaxis, dtype=float)
+        yaxis = numpy.asarray(frame.yaxis, dtype=float)
+        vectors = numpy.asarray(points, dtype=float) - origin
+        angles = numpy.arctan2(vectors.dot(yaxis), vectors.dot(xaxis))
+        c = numpy.cos(angles)[:, None]
+        s = numpy.sin(angles)[:, None]
+        points = origin + self.geometry.radius * (c * xaxis + s * yaxis)
+        return points, (angles / (2 * pi)) % 1.0, -s * xaxis + c * yaxis
@@ -20,11 +20,17 @@ class Constraint(Data):
         The geometry of the constraint.
     name : str, optional
         The name of the constraint.
+    tolerance : float, optional
+        The distance over which the constrained vertex can move from its last projection on the geometry,
+        before it is projected again.
 
     Attributes
     ----------
     geometry : :class:`compas.geometry.Geometry`
         The geometry of the constraint.
+    tolerance : float
+        The distance over which the constrained vertex can move from its last projection on the geometry,
+        before it is projected again.
     location : :class:`compas.geometry.Point`
         The location of the constrained vertex.
     residual : :class:`compas.geometry.Vector`
@@ -55,6 +61,16 @@ class Constraint(Data):
 
     GEOMETRY_CONSTRAINT = {}
 
+    # the dimension of the geometry
+    # the frame of a projection is the unit tangent of a geometry of dimension 1
+    # and the unit normal of a geometry of dimension 2
+    # a geometry of dimension 0 has no tangent space
+    DIMENSION = None
+
+    # the location is moved in the tangent space of the last projection
+    # and only projected again if it moved further than the tolerance
+    LINEARIZED = False
+
     @staticmethod
     def register(gtype, ctype):
         Constraint.GEOMETRY_CONSTRAINT[gtype] = ctype
@@ -78,12 +94,12 @@ class Constraint(Data):
 
     @property
     def __data__(self):
-        data = {"geometry": self.geometry.__data__}
+        data = {"geometry": self.geometry.__data__, "tolerance": self.tolerance}
         if self._rhino_guid:
             data["rhino_guid"] = str(self._rhino_guid)
         return data
 
-    def __init__(self, geometry, name=None):
+    def __init__(self, geometry, name=None, tolerance=1e-3):
         super(Constraint, self).__init__(name=name)
         self._geometry = None
         self._location = None
@@ -92,6 +108,9 @@ class Constraint(Data):
         self._normal = None
         self._rhino_guid = None
         self._param = None
+        self._anchor = None
+        self._frame = None
+        self.tolerance = tolerance
         self.geometry = geometry
 
     def __repr__(self):
@@ -110,6 +129,8 @@ class Constraint(Data):
         self._residual = None
         self._tangent = None
         self._normal = None
+        self._anchor = None
+        self._frame = None
         self._geometry = geometry
 
     @property
@@ -151,6 +172,37 @@ class Constraint(Data):
             self.compute_param()
         return self._param
 
+    # =============================================================================
+    # Projection caching
+    # =============================================================================
+
+    def is_drifted(self):
+        """Verify that the location has moved further from the last projected location than the tolerance.
+
+        In between projections, the location is moved in the tangent space of the geometry at the last projection,
+        with the local frame of the geometry at the parameter of the projection.
+        The projection is only repeated if the location has moved further than the tolerance.
+
+        Returns
+        -------
+        bool
+
+        """
+        if self._anchor is None:
+            return True
+        return self._location.distance_to_point(self._anchor) > self.tolerance
+
+    def reset(self):
+        """Discard the last projected location, such that the next location is projected on the geometry.
+
+        Returns
+        -------
+        None
+
+        """
+        self._anchor = None
+        self._frame = None
+
     # =============================================================================
     # "Abstract" methods
     # =============================================================================
@@ -172,3 +224,24 @@ class Constraint(Data):
 
     def update_location_at_param(self):
         raise NotImplementedError
+
+    def project_points(self, points, params=None):
+        """Project multiple points on the geometry of the constraint.
+
+        Parameters
+        ----------
+        points : array
+            The points, as an array of shape ``(n, 3)``.
+        params : array, optional
+            The parameters of previous projections of the points, as initial estimates.
+            Constraints that project without initial estimates ignore them.
+
+        Returns
+        -------
+        tuple[array, array | None, array]
+            The projected points,
+            the parameters of the projected points, or None if the geometry has no parameterization,
+            and the frames of the geometry at the projected points.
+
+        """
+        raise NotImplementedError
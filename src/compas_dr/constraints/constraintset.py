@@ -0,0 +1,200 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from array import array
+
+from compas.data import Data
+
+
+class ConstraintSet(Data):
+    """Class representing the constraints of the vertices of a network, grouped per constraint.
+
+    Only the constrained vertices are stored,
+    as arrays of vertex indices per constraint,
+    such that the solvers never have to scan the unconstrained vertices.
+
+    Parameters
+    ----------
+    name : str, optional
+        The name of the constraint set.
+
+    Attributes
+    ----------
+    constraints : list[:class:`compas_dr.constraints.Constraint`]
+        The constraints, without duplicates.
+    vertices : array
+        The indices of all constrained vertices, grouped per constraint, in the order of the constraints.
+
+    Notes
+    -----
+    A constraint that is shared by several vertices stores the projection of one vertex at a time.
+    The solvers therefore reset a shared constraint before projecting every vertex,
+    such that the projection of one vertex is never reused for the next.
+
+    Examples
+    --------
+    >>> from compas.geometry import Line
+    >>> from compas_dr.constraints import Constraint
+    >>> from compas_dr.constraints import ConstraintSet
+    >>> constraint = Constraint(Line([0, 0, 0], [1, 0, 0]))
+    >>> constraints = ConstraintSet()
+    >>> constraints.add(constraint, [0, 3, 7])
+    >>> len(constraints)
+    3
+    >>> constraints[3] is constraint
+    True
+
+    """
+
+    @property
+    def __data__(self):
+        return {
+            "constraints": self._constraints,
+            "vertices": [list(vertices) for vertices in self._vertices],
+        }
+
+    @classmethod
+    def __from_data__(cls, data):
+        constraints = cls()
+        for constraint, vertices in zip(data["constraints"], data["vertices"]):
+            constraints.add(constraint, vertices)
+        return constraints
+
+    def __init__(self, name=None):
+        super(ConstraintSet, self).__init__(name=name)
+        self._constraints = []
+        self._vertices = []
+        self._group = {}
+        self._constraint = {}
+
+    def __repr__(self):
+        return "{}(constraints={}, vertices={})".format(self.__class__.__name__, len(self._constraints), len(self))
+
+    def __len__(self):
+        return len(self._constraint)
+
+    def __iter__(self):
+        return iter(zip(self._constraints, self._vertices))
+
+    def __contains__(self, vertex):
+        return vertex in self._constraint
+
+    def __getitem__(self, vertex):
+        return self._constraint[vertex]
+
+    # =============================================================================
+    # Constructors
+    # =============================================================================
+
+    @classmethod
+    def from_list(cls, constraints):
+        """Construct a constraint set from a list with a constraint or None per vertex.
+
+        Parameters
+        ----------
+        constraints : list[:class:`compas_dr.constraints.Constraint` | None]
+            The constraint of every vertex, or None if the vertex is not constrained.
+
+        Returns
+        -------
+        :class:`ConstraintSet`
+
+        """
+        constraintset = cls()
+        for vertex, constraint in enumerate(constraints):
+            if constraint is not None:
+                constraintset.add(constraint, [vertex])
+        return constraintset
+
+    # =============================================================================
+    # Properties
+    # =============================================================================
+
+    @property
+    def constraints(self):
+        return list(self._constraints)
+
+    @property
+    def vertices(self):
+        vertices = array("i")
+        for group in self._vertices:
+            vertices.extend(group)
+        return vertices
+
+    # =============================================================================
+    # Methods
+    # =============================================================================
+
+    def add(self, constraint, vertices):
+        """Add a constraint to vertices.
+
+        Parameters
+        ----------
+        constraint : :class:`compas_dr.constraints.Constraint`
+            The constraint.
+        vertices : list[int]
+            The indices of the vertices.
+            If the constraint is already in the set, the vertices are added to the vertices of the constraint.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If one of the vertices already has a constraint.
+
+        """
+        vertices = [int(vertex) for vertex in vertices]
+        for vertex in vertices:
+            if vertex in self._constraint:
+                raise ValueError("Vertex {} already has a constraint.".format(vertex))
+
+        key = id(constraint)
+        if key not in self._group:
+            self._group[key] = len(self._constraints)
+            self._constraints.append(constraint)
+            self._vertices.append(array("i"))
+        self._vertices[self._group[key]].extend(vertices)
+
+        for vertex in vertices:
+            self._constraint[vertex] = constraint
+
+    def items(self):
+        """Iterate over the constrained vertices and their constraints.
+
+        Yields
+        ------
+        tuple[int, :class:`compas_dr.constraints.Constraint`]
+            The index of a vertex and its constraint,
+            in the order of :attr:`vertices`.
+
+        """
+        for constraint, vertices in zip(self._constraints, self._vertices):
+            for vertex in vertices:
+                yield vertex, constraint
+
+    def remapped(self, mapping):
+        """Construct a constraint set with the vertex indices replaced by new indices.
+
+        Parameters
+        ----------
+        mapping : list[int]
+            The new index of every vertex,
+            for example :attr:`compas_dr.numdata.InputData.vertex_rank`.
+            Vertices with a negative new index are removed.
+
+        Returns
+        -------
+        :class:`ConstraintSet`
+
+        """
+        constraintset = self.__class__(name=self._name)
+        for constraint, vertices in zip(self._constraints, self._vertices):
+            vertices = [mapping[vertex] for vertex in vertices]
+            vertices = [vertex for vertex in vertices if vertex >= 0]
+            if vertices:
+                constraintset.add(constraint, vertices)
+        return constraintset
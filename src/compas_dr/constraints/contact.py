@@ -0,0 +1,195 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import inspect
+
+import numpy
+from compas.data import Data
+
+from .exceptions import GeometryNotRegisteredAsContact
+
+
+class Contact(Data):
+    """Base class for all one-sided contacts.
+
+    A contact only acts on the vertices that violate it.
+    These vertices are projected on the boundary of the feasible region of the contact,
+    and the components of their velocities and residual forces towards the violated side are removed.
+    All vertices are evaluated at once.
+
+    Parameters
+    ----------
+    geometry : :class:`compas.geometry.Geometry`
+        The geometry of the contact.
+    name : str, optional
+        The name of the contact.
+
+    Attributes
+    ----------
+    geometry : :class:`compas.geometry.Geometry`
+        The geometry of the contact.
+    vertices : array
+        The indices of the vertices in contact, at the last resolution of the contact.
+    normals : array
+        The unit normals of the boundary at the vertices in contact, pointing towards the feasible region.
+
+    Notes
+    -----
+    Like the constraint class, the contact class uses a registration mechanism to
+    determine the type of contact object for a given contact geometry.
+
+    Examples
+    --------
+    >>> from compas.geometry import Plane
+    >>> from compas_dr.constraints import Contact
+    >>> contact = Contact(Plane([0, 0, 0], [0, 0, 1]))
+    >>> contact
+    PlaneContact(Plane(point=Point(x=0.0, y=0.0, z=0.0), normal=Vector(x=0.0, y=0.0, z=1.0)), name=None)
+
+    """
+
+    GEOMETRY_CONTACT = {}
+
+    @staticmethod
+    def register(gtype, ctype):
+        Contact.GEOMETRY_CONTACT[gtype] = ctype
+
+    @staticmethod
+    def get_contact_cls(geometry, **kwargs):
+        gtype = type(geometry)
+        cls = None
+        for type_ in inspect.getmro(gtype):
+            cls = Contact.GEOMETRY_CONTACT.get(type_)
+            if cls is not None:
+                break
+        if cls is None:
+            raise GeometryNotRegisteredAsContact("No contact is registered for this geometry type: {}".format(gtype))
+        return cls
+
+    def __new__(cls, *args, **kwargs):
+        geometry = args[0]
+        cls = Contact.get_contact_cls(geometry)
+        return super(Contact, cls).__new__(cls)
+
+    @property
+    def __data__(self):
+        return {"geometry": self.geometry.__data__}
+
+    def __init__(self, geometry, name=None):
+        super(Contact, self).__init__(name=name)
+        self.geometry = geometry
+        self.vertices = numpy.zeros(0, dtype=int)
+        self.normals = numpy.zeros((0, 3))
+
+    def __repr__(self):
+        return "{}({}, name={})".format(self.__class__.__name__, repr(self.geometry), self._name)
+
+    # =============================================================================
+    # Methods
+    # =============================================================================
+
+    def resolve(self, x, v=None, vertices=None):
+        """Project the vertices that violate the contact on the boundary of the feasible region.
+
+        Parameters
+        ----------
+        x : array
+            The coordinates of all vertices, which are updated in place.
+        v : array, optional
+            The velocities of all vertices.
+            The components towards the violated side are removed in place.
+        vertices : array, optional
+            The indices of the vertices that are evaluated.
+            Default is all vertices.
+
+        Returns
+        -------
+        array
+            The indices of the vertices in contact.
+
+        """
+        if vertices is None:
+            vertices = numpy.arange(len(x))
+        vertices = numpy.asarray(vertices, dtype=int)
+        points = x[vertices]
+        violated = numpy.flatnonzero(self.distances(points) < 0)
+        self.vertices = vertices[violated]
+        points, self.normals = self.closest_points(points[violated])
+        x[self.vertices] = points
+        if v is not None:
+            self._remove_inward(v)
+        return self.vertices
+
+    def react(self, r):
+        """Remove the components of the residual forces of the vertices in contact towards the violated side.
+
+        The removed components are the reaction forces of the contact.
+
+        Parameters
+        ----------
+        r : array
+            The residual forces of all vertices, which are updated in place.
+
+        Returns
+        -------
+        None
+
+        """
+        self._remove_inward(r)
+
+    def _axes(self):
+        frame = self.geometry.frame
+        return numpy.array([frame.xaxis, frame.yaxis, frame.zaxis], dtype=float)
+
+    def _to_local(self, points):
+        origin = numpy.asarray(self.geometry.frame.point, dtype=float)
+        return (numpy.asarray(points, dtype=float) - origin).dot(self._axes().T)
+
+    def _to_world(self, points, vectors):
+        origin = numpy.asarray(self.geometry.frame.point, dtype=float)
+        axes = self._axes()
+        vectors = vectors.dot(axes)
+        vectors /= numpy.linalg.norm(vectors, axis=1)[:, None]
+        return origin + points.dot(axes), vectors
+
+    def _remove_inward(self, vectors):
+        components = numpy.einsum("ij,ij->i", vectors[self.vertices], self.normals)
+        vectors[self.vertices] -= numpy.minimum(components, 0.0)[:, None] * self.normals
+
+    # =============================================================================
+    # "Abstract" methods
+    # =============================================================================
+
+    def distances(self, points):
+        """Compute the signed distances of points to the boundary of the feasible region.
+
+        Parameters
+        ----------
+        points : array
+            The points, as an array of shape ``(n, 3)``.
+
+        Returns
+        -------
+        array
+            The distances, which are negative for points that violate the contact.
+
+        """
+        raise NotImplementedError
+
+    def closest_points(self, points):
+        """Compute the closest points on the boundary of the feasible region, for points that violate the contact.
+
+        Parameters
+        ----------
+        points : array
+            The points, as an array of shape ``(n, 3)``.
+
+        Returns
+        -------
+        tuple[array, array]
+            The closest points, and the unit normals of the boundary at the closest points,
+            pointing towards the feasible region.
+
+        """
+        raise NotImplementedError
@@ -11,25 +11,86 @@ from .constraint import Constraint
 
 
 class CurveConstraint(Constraint):
-    """Constraint for limiting the movement of a vertex to a Nurbs curve."""
+    """Constraint for limiting the movement of a vertex to a Nurbs curve.
+
+    Parameters
+    ----------
+    geometry : :class:`compas.geometry.NurbsCurve`
+        The curve.
+    name : str, optional
+        The name of the constraint.
+    tolerance : float, optional
+        The distance over which the constrained vertex can move from its last projection on the curve,
+        before it is projected again.
+    chord_tolerance : float, optional
+        If provided, the vertex is projected on a polyline approximation of the curve
+        that deviates less than this tolerance from the curve,
+        instead of on the curve itself.
+
+    """
+
+    DIMENSION = 1
+    LINEARIZED = True
 
     DATASCHEMA = {
         "type": "object",
         "properties": {
             "geometry": NurbsCurve.DATASCHEMA,
             "rhino_guid": {"type": "string"},
+            "tolerance": {"type": "number"},
+            "chord_tolerance": {"type": "number"},
         },
         "required": ["geometry"],
     }
 
+    def __init__(self, geometry, name=None, tolerance=1e-3, chord_tolerance=None):
+        super(CurveConstraint, self).__init__(geometry, name=name, tolerance=tolerance)
+        self._approximation = None
+        self._chord_tolerance = None
+        self.chord_tolerance = chord_tolerance
+
+    @property
+    def __data__(self):
+        data = super(CurveConstraint, self).__data__
+        if self.chord_tolerance:
+            data["chord_tolerance"] = self.chord_tolerance
+        return data
+
     @classmethod
     def __from_data__(cls, data):
         curve = NurbsCurve.__from_data__(data["geometry"])
-        constraint = cls(curve)
+        constraint = cls(curve, tolerance=data.get("tolerance", 1e-3), chord_tolerance=data.get("chord_tolerance"))
         if "rhino_guid" in data:
             constraint._rhino_guid = str(data["rhino_guid"])
         return constraint
 
+    @property
+    def geometry(self):
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, geometry):
+        Constraint.geometry.fset(self, geometry)
+        self._approximation = None
+
+    @property
+    def chord_tolerance(self):
+        return self._chord_tolerance
+
+    @chord_tolerance.setter
+    def chord_tolerance(self, chord_tolerance):
+        self._approximation = None
+        self._anchor = None
+        self._chord_tolerance = chord_tolerance
+
+    @property
+    def approximation(self):
+        if self._approximation is None and self.chord_tolerance:
+            from .approximation import PolylineApproximation
+
+            self._approximation = PolylineApproximation(self.geometry, self.chord_tolerance)
+        return self._approximation
+
     @property
     def location(self):
         return self._location
@@ -39,27 +100,103 @@ class CurveConstraint(Constraint):
         self._tangent = None
         self._normal = None
         self._location = Point(*point)
-        self.project()
+        if self._anchor is not None:
+            self._location = self._anchor + self._frame * self._frame.dot(self._location - self._anchor)
+        if self.is_drifted():
+            self.project()
 
     def compute_tangent(self):
-        direction = self.geometry.tangent_at(self._param)
-        self._tangent = Vector(*vector_component(self.residual, direction))
+        self._tangent = Vector(*vector_component(self.residual, self._frame))
 
     def compute_normal(self):
         self._normal = self.residual - self.tangent
 
     def update(self, damping=0.1):
         self._location = self.location + self.tangent * damping
-        pt_on_curve = self.geometry.closest_point(self._location, return_parameter=False)
-        if self._location.distance_to_point(pt_on_curve) > 0.001:
+        if self.is_drifted():
             self.project()
 
     def project(self):
+        if self.approximation:
+            xyz, self._param, direction = self.approximation.closest_point(self._location)
+            self._location = Point(*xyz)
+            self._anchor = self._location
+            self._frame = Vector(*direction)
+            return
         xyz, self._param = self.geometry.closest_point(self._location, return_parameter=True)
         self._location = Point(*xyz)
+        self._anchor = self._location
+        self._frame = Vector(*self.geometry.tangent_at(self._param)).unitized()
 
     def compute_param(self):
+        if self.approximation:
+            _, self._param, _ = self.approximation.closest_point(self._location)
+            return
         _, self._param = self.geometry.closest_point(self._location, return_parameter=True)
 
     def update_location_at_param(self):
         self._location = self.geometry.point_at(self._param)
+        self._anchor = self._location
+        self._frame = Vector(*self.geometry.tangent_at(self._param)).unitized()
+
+    def closest_parameter(self, point, param, tol=1e-9, maxiter=10):
+        """Compute the parameter of the closest point on the curve with Gauss-Newton iterations from an initial estimate.
+
+        The derivative of the curve is approximated with central differences.
+
+        Parameters
+        ----------
+        point : [float, float, float] | :class:`compas.geometry.Point`
+            The point.
+        param : float
+            The initial estimate of the parameter, for example the parameter of a previous projection.
+        tol : float, optional
+            The convergence tolerance for the change of the parameter, relative to the domain of the curve.
+        maxiter : int, optional
+            The maximum number of iterations.
+
+        Returns
+        -------
+        float | None
+            The parameter of the closest point, or None if the iterations did not converge.
+
+        """
+        point = Point(*point)
+        start, end = self.geometry.domain
+        h = 1e-6 * (end - start)
+        t = min(max(param, start), end)
+        for _ in range(maxiter):
+            a = min(t + h, end)
+            b = max(t - h, start)
+            derivative = (self.geometry.point_at(a) - self.geometry.point_at(b)) * (1.0 / (a - b))
+            length = derivative.dot(derivative)
+            if length == 0:
+                return None
+            step = (point - self.geometry.point_at(t)).dot(derivative) / length
+            t, previous = min(max(t + step, start), end), t
+            if abs(t - previous) < tol * (end - start):
+                return t
+        return None
+
+    def project_points(self, points, params=None):
+        import numpy
+
+        if self.approximation:
+            return self.approximation.closest_points(points)
+
+        # the projections start from the parameters of the previous projections if available
+        # and fall back to a global search if the local iterations do not converge
+
+        closest = numpy.empty((len(points), 3))
+        result = numpy.empty(len(points))
+        frames = numpy.empty((len(points), 3))
+        for i, point in enumerate(points):
+            param = None if params is None else self.closest_parameter(point, params[i])
+            if param is None:
+                xyz, param = self.geometry.closest_point(point, return_parameter=True)
+            else:
+                xyz = self.geometry.point_at(param)
+            closest[i] = xyz
+            result[i] = param
+            frames[i] = Vector(*self.geometry.tangent_at(param)).unitized()
+        return closest, result, frames
@@ -0,0 +1,44 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy
+from compas.geometry import Cylinder
+
+from .contact import Contact
+
+
+class CylinderContact(Contact):
+    """Contact for keeping vertices inside a cylinder.
+
+    The points are evaluated in the local coordinate system of the cylinder,
+    of which the Z axis is the axis of the cylinder.
+
+    """
+
+    DATASCHEMA = {
+        "type": "object",
+        "properties": {
+            "geometry": Cylinder.DATASCHEMA,
+        },
+        "required": ["geometry"],
+    }
+
+    @classmethod
+    def __from_data__(cls, data):
+        return cls(Cylinder.__from_data__(data["geometry"]))
+
+    def distances(self, points):
+        local = self._to_local(points)
+        radial = numpy.hypot(local[:, 0], local[:, 1]) - self.geometry.radius
+        axial = numpy.abs(local[:, 2]) - 0.5 * self.geometry.height
+        outside = numpy.hypot(numpy.maximum(radial, 0.0), numpy.maximum(axial, 0.0))
+        return numpy.where(outside > 0, -outside, -numpy.maximum(radial, axial))
+
+    def closest_points(self, points):
+        local = self._to_local(points)
+        rho = numpy.hypot(local[:, 0], local[:, 1])
+        scale = numpy.minimum(1.0, self.geometry.radius / numpy.maximum(rho, 1e-300))
+        closest = local * scale[:, None]
+        closest[:, 2] = numpy.clip(local[:, 2], -0.5 * self.geometry.height, 0.5 * self.geometry.height)
+        return self._to_world(closest, closest - local)
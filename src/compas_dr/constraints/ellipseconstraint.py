@@ -0,0 +1,211 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from math import atan2
+from math import copysign
+from math import cos
+from math import hypot
+from math import pi
+from math import sin
+
+from compas.geometry import Ellipse
+from compas.geometry import Vector
+from compas.geometry import vector_component
+
+from .constraint import Constraint
+
+
+def closest_point_on_ellipse(x, y, a, b, kmax=10, tol=1e-12):
+    """Compute the closest point on an ellipse in its local coordinate system.
+
+    The point is computed by iteratively approximating the ellipse with the circle of curvature
+    at the current estimate of the closest point, in the first quadrant.
+
+    Parameters
+    ----------
+    x : float
+        The X coordinate of the point.
+    y : float
+        The Y coordinate of the point.
+    a : float
+        The semi-axis along X.
+    b : float
+        The semi-axis along Y.
+    kmax : int, optional
+        The maximum number of iterations.
+    tol : float, optional
+        The tolerance for the change of the closest point in between iterations.
+
+    Returns
+    -------
+    tuple[float, float]
+        The coordinates of the closest point.
+
+    """
+    px = abs(x)
+    py = abs(y)
+    tx = ty = 2**-0.5
+
+    for _ in range(kmax):
+        ex = (a * a - b * b) * tx**3 / a
+        ey = (b * b - a * a) * ty**3 / b
+        rx = a * tx - ex
+        ry = b * ty - ey
+        qx = px - ex
+        qy = py - ey
+        r = hypot(rx, ry)
+        q = hypot(qx, qy)
+        if q == 0:
+            break
+        ux = min(1.0, max(0.0, (qx * r / q + ex) / a))
+        uy = min(1.0, max(0.0, (qy * r / q + ey) / b))
+        t = hypot(ux, uy)
+        ux /= t
+        uy /= t
+        done = abs(ux - tx) + abs(uy - ty) < tol
+        tx = ux
+        ty = uy
+        if done:
+            break
+
+    return copysign(a * tx, x), copysign(b * ty, y)
+
+
+def closest_points_on_ellipse(x, y, a, b, kmax=10, tol=1e-12):
+    """Compute the closest points on an ellipse in its local coordinate system.
+
+    This is the vectorized version of :func:`closest_point_on_ellipse`.
+
+    Parameters
+    ----------
+    x : array
+        The X coordinates of the points.
+    y : array
+        The Y coordinates of the points.
+    a : float
+        The semi-axis along X.
+    b : float
+        The semi-axis along Y.
+    kmax : int, optional
+        The maximum number of iterations.
+    tol : float, optional
+        The tolerance for the change of the closest points in between iterations.
+
+    Returns
+    -------
+    tuple[array, array]
+        The coordinates of the closest points.
+
+    """
+    import numpy
+
+    px = numpy.abs(x)
+    py = numpy.abs(y)
+    tx = numpy.full(px.shape, 2**-0.5)
+    ty = numpy.full(py.shape, 2**-0.5)
+
+    for _ in range(kmax):
+        ex = (a * a - b * b) * tx**3 / a
+        ey = (b * b - a * a) * ty**3 / b
+        rx = a * tx - ex
+        ry = b * ty - ey
+        qx = px - ex
+        qy = py - ey
+        r = numpy.hypot(rx, ry)
+        q = numpy.hypot(qx, qy)
+        center = q == 0
+        q[center] = 1.0
+        ux = numpy.clip((qx * r / q + ex) / a, 0.0, 1.0)
+        uy = numpy.clip((qy * r / q + ey) / b, 0.0, 1.0)
+        t = numpy.hypot(ux, uy)
+        ux = numpy.where(center, tx, ux / t)
+        uy = numpy.where(center, ty, uy / t)
+        done = numpy.all(numpy.abs(ux - tx) + numpy.abs(uy - ty) < tol)
+        tx = ux
+        ty = uy
+        if done:
+            break
+
+    return numpy.copysign(a * tx, x), numpy.copysign(b * ty, y)
+
+
+class EllipseConstraint(Constraint):
+    """Constraint for limiting the movement of a vertex to an ellipse.
+
+    The vertex is projected on the ellipse in the local coordinate system of the ellipse,
+    with :func:`closest_point_on_ellipse`.
+    The parameter of the projection is the eccentric anomaly, divided by ``2 * pi``,
+    as in :meth:`compas.geometry.Ellipse.point_at`.
+
+    """
+
+    DIMENSION = 1
+
+    DATASCHEMA = {
+        "type": "object",
+        "properties": {
+            "geometry": Ellipse.DATASCHEMA,
+            "rhino_guid": {"type": "string"},
+            "tolerance": {"type": "number"},
+        },
+        "required": ["geometry"],
+    }
+
+    @classmethod
+    def __from_data__(cls, data):
+        ellipse = Ellipse.__from_data__(data["geometry"])
+        constraint = cls(ellipse, tolerance=data.get("tolerance", 1e-3))
+        if "rhino_guid" in data:
+            constraint._rhino_guid = str(data["rhino_guid"])
+        return constraint
+
+    def compute_tangent(self):
+        self._tangent = Vector(*vector_component(self.residual, self._frame))
+
+    def compute_normal(self):
+        self._normal = self.residual - self.tangent
+
+    def update(self, damping=0.1):
+        self._location = self.location + self.tangent * damping
+        self.project()
+
+    def project(self):
+        self.compute_param()
+        self.update_location_at_param()
+
+    def compute_param(self):
+        ellipse = self.geometry
+        frame = ellipse.frame
+        vector = self._location - frame.point
+        x, y = closest_point_on_ellipse(vector.dot(frame.xaxis), vector.dot(frame.yaxis), ellipse.major, ellipse.minor)
+        angle = atan2(y / ellipse.minor, x / ellipse.major)
+        self._param = (angle / (2 * pi)) % 1.0
+
+    def update_location_at_param(self):
+        ellipse = self.geometry
+        frame = ellipse.frame
+        angle = 2 * pi * self._param
+        c = cos(angle)
+        s = sin(angle)
+        self._location = frame.point + frame.xaxis * (ellipse.major * c) + frame.yaxis * (ellipse.minor * s)
+        self._anchor = self._location
+        self._frame = (frame.xaxis * (-ellipse.major * s) + frame.yaxis * (ellipse.minor * c)).unitized()
+
+    def project_points(self, points, params=None):
+        import numpy
+
+        ellipse = self.geometry
+        frame = ellipse.frame
+        origin = numpy.asarray(frame.point, dtype=float)
+        xaxis = numpy.asarray(frame.xaxis, dtype=float)
+        yaxis = numpy.asarray(frame.yaxis, dtype=float)
+        vectors = numpy.asarray(points, dtype=float) - origin
+        x, y = closest_points_on_ellipse(vectors.dot(xaxis), vectors.dot(yaxis), ellipse.major, ellipse.minor)
+        angles = numpy.arctan2(y / ellipse.minor, x / ellipse.major)
+        c = numpy.cos(angles)[:, None]
+        s = numpy.sin(angles)[:, None]
+        points = origin + ellipse.major * c * xaxis + ellipse.minor * s * yaxis
+        frames = -ellipse.major * s * xaxis + ellipse.minor * c * yaxis
+        frames /= numpy.linalg.norm(frames, axis=1)[:, None]
+        return points, (angles / (2 * pi)) % 1.0, frames
@@ -1,2 +1,6 @@
 class GeometryNotRegisteredAsConstraint(Exception):
     pass
+
+
+class GeometryNotRegisteredAsContact(Exception):
+    pass
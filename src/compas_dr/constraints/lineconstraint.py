@@ -15,11 +15,14 @@ from .constraint import Constraint
 class LineConstraint(Constraint):
     """Constraint for limiting the movement of a vertex to a line."""
 
+    DIMENSION = 1
+
     DATASCHEMA = {
         "type": "object",
         "properties": {
             "geometry": Line.DATASCHEMA,
             "rhino_guid": {"type": "string"},
+            "tolerance": {"type": "number"},
         },
         "required": ["geometry"],
     }
@@ -27,7 +30,7 @@ class LineConstraint(Constraint):
     @classmethod
     def __from_data__(cls, data):
         line = Line.__from_data__(data["geometry"])
-        constraint = cls(line)
+        constraint = cls(line, tolerance=data.get("tolerance", 1e-3))
         if "rhino_guid" in data:
             constraint._rhino_guid = str(data["rhino_guid"])
         return constraint
@@ -58,3 +61,13 @@ class LineConstraint(Constraint):
     def update_location_at_param(self):
         d = self._geometry.direction
         self._location = self._geometry.start + d * self._param
+
+    def project_points(self, points, params=None):
+        import numpy
+
+        start = numpy.asarray(self.geometry.start, dtype=float)
+        vector = numpy.asarray(self.geometry.vector, dtype=float)
+        length = self.geometry.length
+        t = numpy.clip((numpy.asarray(points, dtype=float) - start).dot(vector) / length**2, 0.0, 1.0)
+        frames = numpy.tile(vector / length, (len(t), 1))
+        return start + t[:, None] * vector, t * length, frames
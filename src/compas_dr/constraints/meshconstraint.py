@@ -0,0 +1,121 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from compas.datastructures import Mesh
+from compas.geometry import Point
+from compas.geometry import Vector
+from compas.geometry import vector_component
+
+from .constraint import Constraint
+
+
+class MeshConstraint(Constraint):
+    """Constraint for limiting the movement of a vertex to a triangle mesh.
+
+    The faces of the mesh are triangulated,
+    and the vertex is projected on the triangles with a bounding volume hierarchy,
+    starting from the triangle of the last projection.
+    The parameter of the projection is the index of the closest triangle.
+
+    Parameters
+    ----------
+    geometry : :class:`compas.datastructures.Mesh`
+        The mesh.
+    name : str, optional
+        The name of the constraint.
+    tolerance : float, optional
+        The distance over which the constrained vertex can move from its last projection on the mesh,
+        before it is projected again.
+    leaf_size : int, optional
+        The maximum number of triangles of a leaf of the bounding volume hierarchy.
+
+    """
+
+    DIMENSION = 2
+    LINEARIZED = True
+
+    DATASCHEMA = {
+        "type": "object",
+        "properties": {
+            "geometry": Mesh.DATASCHEMA,
+            "rhino_guid": {"type": "string"},
+            "tolerance": {"type": "number"},
+        },
+        "required": ["geometry"],
+    }
+
+    def __init__(self, geometry, name=None, tolerance=1e-3, leaf_size=8):
+        super(MeshConstraint, self).__init__(geometry, name=name, tolerance=tolerance)
+        self._bvh = None
+        self.leaf_size = leaf_size
+
+    @classmethod
+    def __from_data__(cls, data):
+        mesh = Mesh.__from_data__(data["geometry"])
+        constraint = cls(mesh, tolerance=data.get("tolerance", 1e-3))
+        if "rhino_guid" in data:
+            constraint._rhino_guid = str(data["rhino_guid"])
+        return constraint
+
+    @property
+    def geometry(self):
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, geometry):
+        Constraint.geometry.fset(self, geometry)
+        self._param = None
+        self._bvh = None
+
+    @property
+    def bvh(self):
+        if self._bvh is None:
+            from .bvh import BVH
+
+            vertices, faces = self.geometry.to_vertices_and_faces()
+            triangles = [[face[0], face[i], face[i + 1]] for face in faces for i in range(1, len(face) - 1)]
+            self._bvh = BVH(vertices, triangles, leaf_size=self.leaf_size)
+        return self._bvh
+
+    @property
+    def location(self):
+        return self._location
+
+    @location.setter
+    def location(self, point):
+        self._tangent = None
+        self._normal = None
+        self._location = Point(*point)
+        if self._anchor is not None:
+            self._location = self._location + self._frame * -self._frame.dot(self._location - self._anchor)
+        if self.is_drifted():
+            self.project()
+
+    def compute_tangent(self):
+        self._tangent = self.residual - self.normal
+
+    def compute_normal(self):
+        self._normal = Vector(*vector_component(self.residual, self._frame))
+
+    def update(self, damping=0.1):
+        self._location = self.location + self.tangent * damping
+        if self.is_drifted():
+            self.project()
+
+    def project(self):
+        params = None if self._param is None else [self._param]
+        points, params, frames = self.project_points([self._location], params)
+        self._location = Point(*points[0])
+        self._param = int(params[0])
+        self._anchor = self._location
+        self._frame = Vector(*frames[0])
+
+    def compute_param(self):
+        params = None if self._param is None else [self._param]
+        _, params, _ = self.project_points([self._location], params)
+        self._param = int(params[0])
+
+    def project_points(self, points, params=None):
+        closest, triangles = self.bvh.closest_points(points, params)
+        return closest, triangles, self.bvh.normals[triangles]
@@ -0,0 +1,261 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy
+from compas.data import Data
+
+from .constraint import Constraint
+
+
+class MultiConstraint(Data):
+    """Constraint for limiting the movement of multiple vertices to the same geometry.
+
+    The locations, residuals and projections of the vertices are stored per vertex, in arrays,
+    and all vertices are projected at once with :meth:`compas_dr.constraints.Constraint.project_points`
+    of the constraint of the geometry, starting from the parameters of their last projections.
+
+    Parameters
+    ----------
+    geometry : :class:`compas.geometry.Geometry`
+        The geometry of the constraint.
+    name : str, optional
+        The name of the constraint.
+    **kwargs : dict, optional
+        Additional parameters of the constraint of the geometry,
+        for example ``tolerance`` or ``chord_tolerance``.
+
+    Attributes
+    ----------
+    constraint : :class:`compas_dr.constraints.Constraint`
+        The constraint of the geometry.
+    geometry : :class:`compas.geometry.Geometry`
+        The geometry of the constraint.
+    locations : array
+        The locations of the constrained vertices.
+    residuals : array
+        The residual vectors at the constrained vertices.
+    tangents : array
+        The tangent vectors of the residuals at the constrained vertices.
+    normals : array
+        The normal vectors of the residuals at the constrained vertices.
+    params : array | None
+        The parameters of the last projections of the constrained vertices on the geometry,
+        or None if the geometry has no parameterization.
+
+    Notes
+    -----
+    The projections of every vertex are kept in between updates.
+    If the constraint of the geometry moves locations in the tangent space of the last projection,
+    only the vertices that moved further than the tolerance from their last projection are projected again.
+
+    Examples
+    --------
+    >>> from compas.geometry import Line
+    >>> from compas_dr.constraints import MultiConstraint
+    >>> constraint = MultiConstraint(Line([0, 0, 0], [1, 0, 0]))
+    >>> constraint.locations = [[0.5, 1.0, 0.0], [2.0, 0.0, 1.0]]
+    >>> constraint.locations.tolist()
+    [[0.5, 0.0, 0.0], [1.0, 0.0, 0.0]]
+
+    """
+
+    # the additional parameters are serialized with their current values on the constraint of the geometry
+
+    @property
+    def __data__(self):
+        data = {"geometry": self.geometry}
+        for key in self._options:
+            data[key] = getattr(self._constraint, key)
+        return data
+
+    @classmethod
+    def __from_data__(cls, data):
+        return cls(**data)
+
+    def __init__(self, geometry, name=None, **kwargs):
+        super(MultiConstraint, self).__init__(name=name)
+        self._constraint = Constraint(geometry, **kwargs)
+        self._options = ["tolerance"] + [key for key in kwargs if key != "tolerance"]
+        self._locations = None
+        self._residuals = None
+        self._tangents = None
+        self._normals = None
+        self._params = None
+        self._anchors = None
+        self._frames = None
+
+    def __repr__(self):
+        return "{}({}, name={})".format(self.__class__.__name__, repr(self.geometry), self._name)
+
+    # =============================================================================
+    # Managed attributes
+    # =============================================================================
+
+    @property
+    def constraint(self):
+        return self._constraint
+
+    @property
+    def geometry(self):
+        return self._constraint.geometry
+
+    @geometry.setter
+    def geometry(self, geometry):
+        self._constraint.geometry = geometry
+        self.reset()
+
+    @property
+    def locations(self):
+        return self._locations
+
+    @locations.setter
+    def locations(self, points):
+        self._tangents = None
+        self._normals = None
+        self._locations = numpy.array(points, dtype=float)
+        if self._anchors is None or len(self._anchors) != len(self._locations):
+            self.reset()
+            self.project()
+            return
+        if not self._constraint.LINEARIZED:
+            self.project()
+            return
+        vectors = self._locations - self._anchors
+        components = numpy.einsum("ij,ij->i", vectors, self._frames)[:, None] * self._frames
+        if self._constraint.DIMENSION == 1:
+            self._locations = self._anchors + components
+        else:
+            self._locations -= components
+        self.project(self.drifted())
+
+    @property
+    def residuals(self):
+        return self._residuals
+
+    @residuals.setter
+    def residuals(self, residuals):
+        self._tangents = None
+        self._normals = None
+        self._residuals = numpy.array(residuals, dtype=float)
+
+    @property
+    def tangents(self):
+        if self._tangents is None:
+            self.compute_tangents()
+        return self._tangents
+
+    @property
+    def normals(self):
+        if self._normals is None:
+            self.compute_tangents()
+        return self._normals
+
+    @property
+    def params(self):
+        return self._params
+
+    # =============================================================================
+    # Methods
+    # =============================================================================
+
+    def reset(self):
+        """Discard the last projected locations, such that the next locations are projected on the geometry.
+
+        Returns
+        -------
+        None
+
+        """
+        self._anchors = None
+        self._frames = None
+        self._params = None
+
+    def drifted(self):
+        """Identify the vertices that moved further from their last projection than the tolerance.
+
+        Returns
+        -------
+        array
+            The indices of the drifted vertices.
+
+        """
+        distances = numpy.linalg.norm(self._locations - self._anchors, axis=1)
+        return numpy.flatnonzero(distances > self._constraint.tolerance)
+
+    def project(self, indices=None):
+        """Project the locations on the geometry.
+
+        Parameters
+        ----------
+        indices : array, optional
+            The indices of the locations that should be projected.
+            If None, all locations are projected.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._anchors is None:
+            self._anchors = numpy.zeros_like(self._locations)
+            self._frames = numpy.zeros_like(self._locations)
+            indices = None
+        if indices is None:
+            indices = slice(None)
+        elif not len(indices):
+            return
+
+        params = None if self._params is None else self._params[indices]
+        points, params, frames = self._constraint.project_points(self._locations[indices], params)
+        self._locations[indices] = points
+        self._anchors[indices] = points
+        self._frames[indices] = frames
+
+        if params is None:
+            self._params = None
+            return
+        if self._params is None:
+            self._params = numpy.zeros((len(self._locations),) + numpy.shape(params)[1:])
+        self._params[indices] = params
+
+    def compute_tangents(self):
+        """Compute the components of the residuals in the tangent space and normal to the geometry.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._constraint.DIMENSION == 0:
+            self._tangents = numpy.zeros_like(self._residuals)
+            self._normals = self._residuals
+            return
+        components = numpy.einsum("ij,ij->i", self._residuals, self._frames)[:, None] * self._frames
+        if self._constraint.DIMENSION == 1:
+            self._tangents = components
+            self._normals = self._residuals - components
+        else:
+            self._normals = components
+            self._tangents = self._residuals - components
+
+    def update(self, damping=0.1):
+        """Move the locations along the tangent components of the residuals.
+
+        Parameters
+        ----------
+        damping : float, optional
+            Damping factor for the movement.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._constraint.DIMENSION == 0:
+            return
+        self._locations = self._locations + self.tangents * damping
+        if self._constraint.LINEARIZED:
+            self.project(self.drifted())
+        else:
+            self.project()
@@ -14,11 +14,14 @@ from .constraint import Constraint
 class PlaneConstraint(Constraint):
     """Constraint for limiting the movement of a vertex to a plane."""
 
+    DIMENSION = 2
+
     DATASCHEMA = {
         "type": "object",
         "properties": {
             "geometry": Plane.DATASCHEMA,
             "rhino_guid": {"type": "string"},
+            "tolerance": {"type": "number"},
         },
         "required": ["geometry"],
     }
@@ -28,7 +31,7 @@ class PlaneConstraint(Constraint):
     @classmethod
     def __from_data__(cls, data):
         plane = Plane.__from_data__(data["geometry"])
-        constraint = cls(plane)
+        constraint = cls(plane, tolerance=data.get("tolerance", 1e-3))
         if "rhino_guid" in data:
             constraint._rhino_guid = str(data["rhino_guid"])
         return constraint
@@ -45,3 +48,13 @@ class PlaneConstraint(Constraint):
 
     def project(self):
         self._location = self.geometry.closest_point(self._location)
+
+    def project_points(self, points, params=None):
+        import numpy
+
+        points = numpy.asarray(points, dtype=float)
+        point = numpy.asarray(self.geometry.point, dtype=float)
+        normal = numpy.asarray(self.geometry.normal, dtype=float)
+        normal /= numpy.linalg.norm(normal)
+        frames = numpy.tile(normal, (len(points), 1))
+        return points - (points - point).dot(normal)[:, None] * normal, None, frames
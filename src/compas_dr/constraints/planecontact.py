@@ -0,0 +1,37 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy
+from compas.geometry import Plane
+
+from .contact import Contact
+
+
+class PlaneContact(Contact):
+    """Contact for keeping vertices on the side of a plane its normal points to."""
+
+    DATASCHEMA = {
+        "type": "object",
+        "properties": {
+            "geometry": Plane.DATASCHEMA,
+        },
+        "required": ["geometry"],
+    }
+
+    @classmethod
+    def __from_data__(cls, data):
+        return cls(Plane.__from_data__(data["geometry"]))
+
+    def _normal(self):
+        normal = numpy.asarray(self.geometry.normal, dtype=float)
+        return normal / numpy.linalg.norm(normal)
+
+    def distances(self, points):
+        return (numpy.asarray(points, dtype=float) - numpy.asarray(self.geometry.point, dtype=float)).dot(self._normal())
+
+    def closest_points(self, points):
+        normal = self._normal()
+        points = numpy.asarray(points, dtype=float)
+        normals = numpy.tile(normal, (len(points), 1))
+        return points - self.distances(points)[:, None] * normal, normals
@@ -0,0 +1,123 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from compas.geometry import Point
+from compas.geometry import Pointcloud
+from compas.geometry import Vector
+
+from .constraint import Constraint
+
+
+class PointcloudConstraint(Constraint):
+    """Constraint for pinning a vertex to, or attracting it towards, the nearest point of a point cloud.
+
+    The nearest points are found with a KD-tree of the cloud, which is built once.
+    The nearest point of a vertex is only searched again if the vertex moved further than the tolerance from it.
+    The parameter of the projection is the index of the nearest point.
+
+    Parameters
+    ----------
+    geometry : :class:`compas.geometry.Pointcloud`
+        The point cloud.
+    name : str, optional
+        The name of the constraint.
+    tolerance : float, optional
+        The distance over which the constrained vertex can move from its nearest point,
+        before the nearest point is searched again.
+    weight : float, optional
+        The fraction of the distance to the nearest point over which the vertex is moved at every projection.
+        With the default value of 1.0, the vertex is pinned to the nearest point.
+
+    Notes
+    -----
+    A point cloud has no tangent space.
+    The tangent component of the residual is zero, and the normal component is the full residual.
+
+    """
+
+    DIMENSION = 0
+
+    DATASCHEMA = {
+        "type": "object",
+        "properties": {
+            "geometry": Pointcloud.DATASCHEMA,
+            "rhino_guid": {"type": "string"},
+            "tolerance": {"type": "number"},
+        },
+        "required": ["geometry"],
+    }
+
+    def __init__(self, geometry, name=None, tolerance=1e-3, weight=1.0):
+        super(PointcloudConstraint, self).__init__(geometry, name=name, tolerance=tolerance)
+        self._tree = None
+        self.weight = weight
+
+    @classmethod
+    def __from_data__(cls, data):
+        cloud = Pointcloud.__from_data__(data["geometry"])
+        constraint = cls(cloud, tolerance=data.get("tolerance", 1e-3))
+        if "rhino_guid" in data:
+            constraint._rhino_guid = str(data["rhino_guid"])
+        return constraint
+
+    @property
+    def geometry(self):
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, geometry):
+        Constraint.geometry.fset(self, geometry)
+        self._param = None
+        self._tree = None
+
+    @property
+    def tree(self):
+        if self._tree is None:
+            from scipy.spatial import cKDTree
+
+            self._tree = cKDTree(self.geometry.points)
+        return self._tree
+
+    def compute_tangent(self):
+        self._tangent = Vector(0, 0, 0)
+
+    def compute_normal(self):
+        self._normal = self.residual - self.tangent
+
+    def update(self, damping=0.1):
+        pass
+
+    def project(self):
+        params = None if self._param is None else [self._param]
+        points, params, _ = self.project_points([self._location], params)
+        self._location = Point(*points[0])
+        self._param = int(params[0])
+
+    def compute_param(self):
+        _, self._param = self.tree.query(self._location)
+
+    def update_location_at_param(self):
+        self._location = Point(*self.geometry.points[self._param])
+
+    def project_points(self, points, params=None):
+        import numpy
+
+        points = numpy.asarray(points, dtype=float).reshape((-1, 3))
+        cloud = self.tree.data
+
+        # the nearest points are only searched again
+        # for the points that moved further than the tolerance from their previous nearest points
+
+        if params is None:
+            indices = numpy.zeros(len(points), dtype=int)
+            query = numpy.arange(len(points))
+        else:
+            indices = numpy.array(params, dtype=int)
+            distances = numpy.linalg.norm(points - cloud[indices], axis=1)
+            query = numpy.flatnonzero(distances > self.tolerance)
+        if len(query):
+            _, indices[query] = self.tree.query(points[query])
+
+        points = points + self.weight * (cloud[indices] - points)
+        return points, indices, numpy.zeros_like(points)
@@ -11,25 +11,86 @@ from .constraint import Constraint
 
 
 class SurfaceConstraint(Constraint):
-    """Constraint for limiting the movement of a vertex to a surface."""
+    """Constraint for limiting the movement of a vertex to a Nurbs surface.
+
+    Parameters
+    ----------
+    geometry : :class:`compas.geometry.NurbsSurface`
+        The surface.
+    name : str, optional
+        The name of the constraint.
+    tolerance : float, optional
+        The distance over which the constrained vertex can move from its last projection on the surface,
+        before it is projected again.
+    chord_tolerance : float, optional
+        If provided, the vertex is projected on a triangle mesh approximation of the surface
+        that deviates less than this tolerance from the surface,
+        instead of on the surface itself.
+
+    """
+
+    DIMENSION = 2
+    LINEARIZED = True
 
     DATASCHEMA = {
         "type": "object",
         "properties": {
             "geometry": NurbsSurface.DATASCHEMA,
             "rhino_guid": {"type": "string"},
+            "tolerance": {"type": "number"},
+            "chord_tolerance": {"type": "number"},
         },
         "required": ["geometry"],
     }
 
+    def __init__(self, geometry, name=None, tolerance=1e-3, chord_tolerance=None):
+        super(SurfaceConstraint, self).__init__(geometry, name=name, tolerance=tolerance)
+        self._approximation = None
+        self._chord_tolerance = None
+        self.chord_tolerance = chord_tolerance
+
+    @property
+    def __data__(self):
+        data = super(SurfaceConstraint, self).__data__
+        if self.chord_tolerance:
+            data["chord_tolerance"] = self.chord_tolerance
+        return data
+
     @classmethod
     def __from_data__(cls, data):
         srf = NurbsSurface.__from_data__(data["geometry"])
-        constraint = cls(srf)
+        constraint = cls(srf, tolerance=data.get("tolerance", 1e-3), chord_tolerance=data.get("chord_tolerance"))
         if "rhino_guid" in data:
             constraint._rhino_guid = str(data["rhino_guid"])
         return constraint
 
+    @property
+    def geometry(self):
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, geometry):
+        Constraint.geometry.fset(self, geometry)
+        self._approximation = None
+
+    @property
+    def chord_tolerance(self):
+        return self._chord_tolerance
+
+    @chord_tolerance.setter
+    def chord_tolerance(self, chord_tolerance):
+        self._approximation = None
+        self._anchor = None
+        self._chord_tolerance = chord_tolerance
+
+    @property
+    def approximation(self):
+        if self._approximation is None and self.chord_tolerance:
+            from .approximation import MeshApproximation
+
+            self._approximation = MeshApproximation(self.geometry, self.chord_tolerance)
+        return self._approximation
+
     @property
     def location(self):
         return self._location
@@ -39,27 +100,118 @@ class SurfaceConstraint(Constraint):
         self._tangent = None
         self._normal = None
         self._location = Point(*point)
-        self.project()
+        if self._anchor is not None:
+            self._location = self._location + self._frame * -self._frame.dot(self._location - self._anchor)
+        if self.is_drifted():
+            self.project()
 
     def compute_tangent(self):
         self._tangent = self.residual - self.normal
 
     def compute_normal(self):
-        _, _, _, normal = self.geometry.curvature_at(*self._param)
-        self._normal = Vector(*vector_component(self.residual, normal))
+        self._normal = Vector(*vector_component(self.residual, self._frame))
 
     def update(self, damping=0.1):
         self._location = self.location + self.tangent * damping
-        pt_on_srf = self.geometry.closest_point(self._location, return_parameters=False)
-        if self._location.distance_to_point(pt_on_srf) > 0.001:
+        if self.is_drifted():
             self.project()
 
     def project(self):
+        if self.approximation:
+            xyz, self._param, normal = self.approximation.closest_point(self._location)
+            self._location = Point(*xyz)
+            self._anchor = self._location
+            self._frame = Vector(*normal)
+            return
         xyz, self._param = self.geometry.closest_point(self._location, return_parameters=True)
         self._location = Point(*xyz)
+        self._anchor = self._location
+        _, _, _, normal = self.geometry.curvature_at(*self._param)
+        self._frame = Vector(*normal).unitized()
 
     def compute_param(self):
+        if self.approximation:
+            _, self._param, _ = self.approximation.closest_point(self._location)
+            return
         _, self._param = self.geometry.closest_point(self._location, return_parameters=True)
 
     def update_location_at_param(self):
         self._location = self.geometry.point_at(*self._param)
+        self._anchor = self._location
+        _, _, _, normal = self.geometry.curvature_at(*self._param)
+        self._frame = Vector(*normal).unitized()
+
+    def closest_parameters(self, point, params, tol=1e-9, maxiter=10):
+        """Compute the parameters of the closest point on the surface with Gauss-Newton iterations from an initial estimate.
+
+        The partial derivatives of the surface are approximated with central differences.
+
+        Parameters
+        ----------
+        point : [float, float, float] | :class:`compas.geometry.Point`
+            The point.
+        params : [float, float]
+            The initial estimate of the parameters, for example the parameters of a previous projection.
+        tol : float, optional
+            The convergence tolerance for the change of the parameters, relative to the domain of the surface.
+        maxiter : int, optional
+            The maximum number of iterations.
+
+        Returns
+        -------
+        tuple[float, float] | None
+            The parameters of the closest point, or None if the iterations did not converge.
+
+        """
+        point = Point(*point)
+        domain = [self.geometry.domain_u, self.geometry.domain_v]
+        spans = [end - start for start, end in domain]
+        uv = [min(max(x, start), end) for x, (start, end) in zip(params, domain)]
+        for _ in range(maxiter):
+            derivatives = []
+            for axis, (start, end) in enumerate(domain):
+                a = uv[:]
+                b = uv[:]
+                a[axis] = min(uv[axis] + 1e-6 * spans[axis], end)
+                b[axis] = max(uv[axis] - 1e-6 * spans[axis], start)
+                derivatives.append((self.geometry.point_at(*a) - self.geometry.point_at(*b)) * (1.0 / (a[axis] - b[axis])))
+            su, sv = derivatives
+            r = point - self.geometry.point_at(*uv)
+            guu = su.dot(su)
+            guv = su.dot(sv)
+            gvv = sv.dot(sv)
+            det = guu * gvv - guv * guv
+            if det == 0:
+                return None
+            ru = su.dot(r)
+            rv = sv.dot(r)
+            steps = [(gvv * ru - guv * rv) / det, (guu * rv - guv * ru) / det]
+            previous = uv
+            uv = [min(max(x + dx, start), end) for x, dx, (start, end) in zip(uv, steps, domain)]
+            if all(abs(x - y) < tol * span for x, y, span in zip(uv, previous, spans)):
+                return uv[0], uv[1]
+        return None
+
+    def project_points(self, points, params=None):
+        import numpy
+
+        if self.approximation:
+            return self.approximation.closest_points(points)
+
+        # the projections start from the parameters of the previous projections if available
+        # and fall back to a global search if the local iterations do not converge
+
+        closest = numpy.empty((len(points), 3))
+        result = numpy.empty((len(points), 2))
+        frames = numpy.empty((len(points), 3))
+        for i, point in enumerate(points):
+            uv = None if params is None else self.closest_parameters(point, params[i])
+            if uv is None:
+                xyz, uv = self.geometry.closest_point(point, return_parameters=True)
+            else:
+                xyz = self.geometry.point_at(*uv)
+            closest[i] = xyz
+            result[i] = uv
+            _, _, _, normal = self.geometry.curvature_at(*uv)
+            frames[i] = Vector(*normal).unitized()
+        return closest, result, frames
@@ -17,6 +17,35 @@ import compas.geometry  # noqa: F401
 from compas.data import Data
 
 
+def _rcm_order(n, edges):
+    # type: (int, npt.ArrayLike) -> npt.ArrayLike
+    """Compute the reverse Cuthill-McKee ordering of the vertices of a network."""
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+    i = np.concatenate([edges[:, 0], edges[:, 1]])
+    j = np.concatenate([edges[:, 1], edges[:, 0]])
+    A = coo_matrix((np.ones(len(i)), (i, j)), shape=(n, n)).tocsr()
+    return np.asarray(reverse_cuthill_mckee(A, symmetric_mode=True), dtype=int)
+
+
+def _morton_order(xyz, bits=21):
+    # type: (npt.ArrayLike, int) -> npt.ArrayLike
+    """Compute the ordering of a set of points along a Morton (Z-order) curve."""
+    xyz = np.asarray(xyz, dtype=np.float64)
+    lower = xyz.min(axis=0)
+    size = (xyz.max(axis=0) - lower).max()
+    if size == 0:
+        return np.arange(len(xyz))
+    cells = ((xyz - lower) / size * (2**bits - 1)).astype(np.uint64)
+    code = np.zeros(len(xyz), dtype=np.uint64)
+    for b in range(bits):
+        for axis in range(3):
+            bit = (cells[:, axis] >> np.uint64(b)) & np.uint64(1)
+            code |= bit << np.uint64(3 * b + axis)
+    return np.argsort(code, kind="stable")
+
+
 class InputData(Data):
     """Class representing input data for DR solvers.
 
@@ -51,29 +80,63 @@ class InputData(Data):
     v0
     r0
     C
+    vertex_order
+    vertex_rank
+    edge_order
+    sector
+
+    Notes
+    -----
+    The vertices and edges can be reordered for better memory locality in the numpy solvers with :meth:`reorder`.
+    The array attributes are then expressed in the new order,
+    and the results of the solvers are restored to the original order with :meth:`restore`.
+
+    The input data of one sector of a symmetric network is computed with :meth:`reduced`.
+    The results of the solvers for the sector are then restored to results for the complete network.
 
     """
 
+    # the data is serialized in the original order, together with the reordering
+    # the data of a sector is serialized as the data of the complete network and its symmetry
+
     @property
     def __data__(self):
         # type: () -> dict
-        return {
-            "vertices": self.vertices,
-            "edges": self.edges,
-            "fixed": self.fixed,
-            "loads": self.loads,
-            "qpre": self.qpre,
-            "fpre": self.fpre,
-            "lpre": self.lpre,
-            "linit": self.linit,
-            "E": self.E,
-            "radius": self.radius,
+        if self._sector is not None:
+            return {
+                "network": self._sector.indata,
+                "symmetry": self._sector.symmetry,
+                "tol": self._sector.tol,
+            }
+        data = {
+            "vertices": self._vertices,
+            "edges": self._edges,
+            "fixed": self._fixed,
+            "loads": self._loads,
+            "qpre": self._qpre,
+            "fpre": self._fpre,
+            "lpre": self._lpre,
+            "linit": self._linit,
+            "E": self._E,
+            "radius": self._radius,
         }
+        if self._vertex_order is not None:
+            data["vertex_order"] = self._vertex_order
+            data["edge_order"] = self._edge_order
+        return data
 
     @classmethod
     def __from_data__(cls, data):
         # type: (dict) -> InputData
-        return super(InputData, cls).__from_data__(data)
+        if "network" in data:
+            return data["network"].reduced(data["symmetry"], tol=data["tol"])
+        data = dict(data)
+        vertex_order = data.pop("vertex_order", None)
+        edge_order = data.pop("edge_order", None)
+        indata = super(InputData, cls).__from_data__(data)
+        if vertex_order is not None:
+            indata._apply_order(vertex_order, edge_order)
+        return indata
 
     def __init__(
         self,
@@ -88,6 +151,7 @@ class InputData(Data):
         E=None,  # type: list[float] | None
         radius=None,  # type: list[float] | None
     ):  # type: (...) -> None
+        super(InputData, self).__init__()
         self._vertices = vertices
         self._vertices_array = None
         self._edges = edges
@@ -110,16 +174,50 @@ class InputData(Data):
         self._radius_array = None
         # (lazy) computed properties
         self._C = None
+        # reordering
+        self._vertex_order = None
+        self._vertex_rank = None
+        self._edge_order = None
+        # symmetry
+        self._sector = None
+
+    def _reset(self):
+        # type: () -> None
+        self._vertices_array = None
+        self._edges_array = None
+        self._free = None
+        self._loads_array = None
+        self._qpre_array = None
+        self._fpre_array = None
+        self._lpre_array = None
+        self._linit_array = None
+        self._E_array = None
+        self._radius_array = None
+        self._C = None
+
+    def _reordered_vertices(self, array):
+        # type: (npt.ArrayLike) -> npt.ArrayLike
+        if self._vertex_order is None:
+            return array
+        return array[self._vertex_order]
+
+    def _reordered_edges(self, array):
+        # type: (npt.ArrayLike) -> npt.ArrayLike
+        if self._edge_order is None:
+            return array
+        return array[self._edge_order]
 
     @property
     def vertices(self):
         # type: () -> npt.ArrayLike
         if has_numpy:
             if self._vertices_array is None:
-                self._vertices_array = np.asarray(
-                    self._vertices,
-                    dtype=np.float64,
-                ).reshape((-1, 3))
+                self._vertices_array = self._reordered_vertices(
+                    np.asarray(
+                        self._vertices,
+                        dtype=np.float64,
+                    ).reshape((-1, 3))
+                )
             return self._vertices_array
         return self._vertices
 
@@ -132,30 +230,56 @@ class InputData(Data):
                     self._edges,
                     dtype=np.int32,
                 ).reshape((-1, 2))
+                if self._vertex_order is not None:
+                    self._edges_array = self._reordered_edges(self._vertex_rank[self._edges_array]).astype(np.int32)
             return self._edges_array
         return self._edges
 
     @property
     def fixed(self):
         # type: () -> npt.ArrayLike
+        if self._vertex_order is not None:
+            return self._vertex_rank[np.asarray(self._fixed, dtype=int)].tolist()
         return self._fixed
 
     @property
     def free(self):
         # type: () -> npt.ArrayLike
         if self._free is None:
-            self._free = list(set(range(len(self._vertices))) - set(self._fixed))
+            self._free = list(set(range(len(self._vertices))) - set(self.fixed))
         return self._free
 
+    @property
+    def vertex_order(self):
+        # type: () -> npt.ArrayLike | None
+        return self._vertex_order
+
+    @property
+    def vertex_rank(self):
+        # type: () -> npt.ArrayLike | None
+        return self._vertex_rank
+
+    @property
+    def edge_order(self):
+        # type: () -> npt.ArrayLike | None
+        return self._edge_order
+
+    @property
+    def sector(self):
+        # type: () -> compas_dr.symmetry.Sector | None
+        return self._sector
+
     @property
     def loads(self):
         # type: () -> npt.ArrayLike
         if has_numpy:
             if self._loads_array is None:
-                self._loads_array = np.asarray(
-                    self._loads,
-                    dtype=np.float64,
-                ).reshape((-1, 3))
+                self._loads_array = self._reordered_vertices(
+                    np.asarray(
+                        self._loads,
+                        dtype=np.float64,
+                    ).reshape((-1, 3))
+                )
             return self._loads_array
         return self._loads
 
@@ -164,10 +288,12 @@ class InputData(Data):
         # type: () -> npt.ArrayLike
         if has_numpy:
             if self._qpre_array is None:
-                self._qpre_array = np.asarray(
-                    self._qpre,
-                    dtype=np.float64,
-                ).reshape((-1, 1))
+                self._qpre_array = self._reordered_edges(
+                    np.asarray(
+                        self._qpre,
+                        dtype=np.float64,
+                    ).reshape((-1, 1))
+                )
             return self._qpre_array
         return self._qpre
 
@@ -178,10 +304,12 @@ class InputData(Data):
             self._fpre = [0.0] * len(self._edges)
         if has_numpy:
             if self._fpre_array is None:
-                self._fpre_array = np.asarray(
-                    self._fpre,
-                    dtype=np.float64,
-                ).reshape((-1, 1))
+                self._fpre_array = self._reordered_edges(
+                    np.asarray(
+                        self._fpre,
+                        dtype=np.float64,
+                    ).reshape((-1, 1))
+                )
             return self._fpre_array
         return self._fpre
 
@@ -192,10 +320,12 @@ class InputData(Data):
             self._lpre = [0.0] * len(self._edges)
         if has_numpy:
             if self._lpre_array is None:
-                self._lpre_array = np.asarray(
-                    self._lpre,
-                    dtype=np.float64,
-                ).reshape((-1, 1))
+                self._lpre_array = self._reordered_edges(
+                    np.asarray(
+                        self._lpre,
+                        dtype=np.float64,
+                    ).reshape((-1, 1))
+                )
             return self._lpre_array
         return self._lpre
 
@@ -206,10 +336,12 @@ class InputData(Data):
             self._linit = [0.0] * len(self._edges)
         if has_numpy:
             if self._linit_array is None:
-                self._linit_array = np.asarray(
-                    self._linit,
-                    dtype=np.float64,
-                ).reshape((-1, 1))
+                self._linit_array = self._reordered_edges(
+                    np.asarray(
+                        self._linit,
+                        dtype=np.float64,
+                    ).reshape((-1, 1))
+                )
             return self._linit_array
         return self._linit
 
@@ -220,10 +352,12 @@ class InputData(Data):
             self._E = [0.0] * len(self._edges)
         if has_numpy:
             if self._E_array is None:
-                self._E_array = np.asarray(
-                    self._E,
-                    dtype=np.float64,
-                ).reshape((-1, 1))
+                self._E_array = self._reordered_edges(
+                    np.asarray(
+                        self._E,
+                        dtype=np.float64,
+                    ).reshape((-1, 1))
+                )
             return self._E_array
         return self._E
 
@@ -234,10 +368,12 @@ class InputData(Data):
             self._radius = [0.0] * len(self._edges)
         if has_numpy:
             if self._radius_array is None:
-                self._radius_array = np.asarray(
-                    self._radius,
-                    dtype=np.float64,
-                ).reshape((-1, 1))
+                self._radius_array = self._reordered_edges(
+                    np.asarray(
+                        self._radius,
+                        dtype=np.float64,
+                    ).reshape((-1, 1))
+                )
             return self._radius_array
         return self._radius
 
@@ -274,10 +410,234 @@ class InputData(Data):
         # type: () -> npt.ArrayLike | None
         if has_numpy:
             if self._C is None:
-                self._C = connectivity_matrix(self._edges, rtype="csr")
+                if self._vertex_order is not None:
+                    self._C = connectivity_matrix(self.edges.tolist(), rtype="csr")
+                else:
+                    self._C = connectivity_matrix(self._edges, rtype="csr")
+                # vertices without edges at the end of the list have no column
+                if self._C.shape[1] < len(self._vertices):
+                    self._C.resize((self._C.shape[0], len(self._vertices)))
             return self._C
         # return ...
 
+    # =============================================================================
+    # Reordering
+    # =============================================================================
+
+    def reorder(self, method="rcm"):
+        # type: (str | None) -> None
+        """Reorder the vertices and edges for better memory locality in the numpy solvers.
+
+        With ``"rcm"``, the vertices are ordered with the reverse Cuthill-McKee algorithm,
+        which minimises the bandwidth of the connectivity matrices.
+        With ``"morton"``, the vertices are ordered along a Morton (Z-order) space-filling curve through their coordinates.
+        In both cases, the edges are sorted by the new indices of their vertices.
+
+        The original data is not modified.
+        Only the array attributes and the indices of the fixed and free vertices are expressed in the new order.
+        Reordering requires numpy and scipy.
+
+        Parameters
+        ----------
+        method : {"rcm", "morton"} | None, optional
+            The reordering method.
+            If None, the original order is restored.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the reordering method is not supported.
+        ValueError
+            If the data is the data of a sector of a symmetric network.
+            The data of the complete network should be reordered before the reduction instead.
+
+        Examples
+        --------
+        >>> from compas.datastructures import Mesh
+        >>> from compas_dr.numdata import InputData
+        >>> from compas_dr.solvers import dr_numpy
+        >>> mesh = Mesh.from_meshgrid(dx=10, nx=10)
+        >>> fixed = list(mesh.vertices_where(vertex_degree=2))
+        >>> loads = [[0, 0, -0.1]] * mesh.number_of_vertices()
+        >>> qpre = [1.0] * mesh.number_of_edges()
+        >>> inputdata = InputData.from_mesh(mesh, fixed, loads, qpre)
+        >>> inputdata.reorder("rcm")
+        >>> result = dr_numpy(inputdata)
+        >>> result.update_mesh(mesh)
+
+        """
+        if method not in (None, "rcm", "morton"):
+            raise ValueError("Reordering method not supported: {}".format(method))
+        if self._sector is not None:
+            raise ValueError("The data of a sector of a symmetric network cannot be reordered.")
+
+        self._vertex_order = None
+        self._vertex_rank = None
+        self._edge_order = None
+        self._reset()
+
+        if method is None:
+            return
+
+        edges = self.edges
+        if method == "rcm":
+            order = _rcm_order(len(self._vertices), edges)
+        else:
+            order = _morton_order(self.vertices)
+
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        edges = np.sort(rank[edges], axis=1)
+
+        self._apply_order(order, np.lexsort((edges[:, 1], edges[:, 0])))
+
+    def _apply_order(self, vertex_order, edge_order):
+        # type: (npt.ArrayLike, npt.ArrayLike) -> None
+        vertex_order = np.asarray(vertex_order, dtype=int)
+        rank = np.empty_like(vertex_order)
+        rank[vertex_order] = np.arange(len(vertex_order))
+
+        self._vertex_order = vertex_order
+        self._vertex_rank = rank
+        self._edge_order = np.asarray(edge_order, dtype=int)
+        self._reset()
+
+    def restore(self, result):
+        # type: (ResultData) -> ResultData
+        """Restore the original order of the vertices and edges in the results of a solver.
+
+        Edges added after the reordering, for example to a solver context, are kept at the end.
+        If the data is the input data of one sector of a symmetric network,
+        the results of the complete network are reconstructed.
+
+        Parameters
+        ----------
+        result : :class:`ResultData`
+            The results, in the order of the array attributes.
+
+        Returns
+        -------
+        :class:`ResultData`
+            The results in the original order.
+            If the data is not reordered, and not the data of a sector, the results are returned unchanged.
+
+        """
+        if self._vertex_order is not None:
+            result = self._restore_order(result)
+        if self._sector is not None:
+            result = self._sector.restore(result)
+        return result
+
+    def _restore_order(self, result):
+        # type: (ResultData) -> ResultData
+
+        def vertices(array):
+            restored = np.empty_like(array)
+            restored[self._vertex_order] = array
+            return restored
+
+        def edges(array):
+            n = len(self._edge_order)
+            restored = np.array(array, copy=True)
+            restored[self._edge_order] = array[:n]
+            return restored
+
+        def pairs(array):
+            n = len(self._edge_order)
+            return np.where(array < n, self._edge_order[np.minimum(array, n - 1)], array)
+
+        return ResultData(
+            xyz=vertices(result.xyz),
+            q=edges(result.q),
+            forces=edges(result.forces),
+            lengths=edges(result.lengths),
+            residuals=vertices(result.residuals),
+            contacts=None if result.contacts is None else [self._vertex_order[contact] for contact in result.contacts],
+            clashes=None if result.clashes is None else pairs(result.clashes),
+            events=result.events,
+        )
+
+    # =============================================================================
+    # Symmetry
+    # =============================================================================
+
+    def reduced(self, symmetry, tol=1e-6):
+        # type: (compas_dr.symmetry.Symmetry, float) -> InputData
+        """Construct the input data of one sector of a symmetric network.
+
+        The sector consists of one representative vertex per set of vertices that are images of each other under the symmetry,
+        the edges connected to the representative vertices,
+        and the ghost vertices at the other ends of these edges.
+        The ghost vertices are fixed in the input data of the sector,
+        and the numpy solvers move them together with the images of their representatives,
+        such that the representative vertices have the same trajectory as in a solve of the complete network.
+        The results of the solvers are restored to results for the complete network, in the order of this data.
+
+        Reduction requires numpy and scipy.
+
+        Parameters
+        ----------
+        symmetry : :class:`compas_dr.symmetry.Symmetry`
+            The symmetry of the network.
+        tol : float, optional
+            The tolerance for matching the vertices with their images.
+
+        Returns
+        -------
+        :class:`InputData`
+            The input data of the sector.
+
+        Raises
+        ------
+        ValueError
+            If the vertices, edges, supports, loads or edge attributes are not symmetric.
+
+        Examples
+        --------
+        >>> from compas.datastructures import Mesh
+        >>> from compas.geometry import Plane
+        >>> from compas_dr.numdata import InputData
+        >>> from compas_dr.solvers import dr_numpy
+        >>> from compas_dr.symmetry import MirrorSymmetry
+        >>> mesh = Mesh.from_meshgrid(dx=10, nx=10)
+        >>> fixed = list(mesh.vertices_where(vertex_degree=2))
+        >>> loads = [[0, 0, -0.1]] * mesh.number_of_vertices()
+        >>> qpre = [1.0] * mesh.number_of_edges()
+        >>> inputdata = InputData.from_mesh(mesh, fixed, loads, qpre)
+        >>> sector = inputdata.reduced(MirrorSymmetry(Plane([5, 0, 0], [1, 0, 0])))
+        >>> result = dr_numpy(sector)
+        >>> len(result.xyz) == mesh.number_of_vertices()
+        True
+
+        """
+        from compas_dr.symmetry import Sector
+
+        sector = Sector(self, symmetry, tol=tol)
+
+        local = np.full(len(self.vertices), -1, dtype=int)
+        local[sector.vertices] = np.arange(len(sector.vertices))
+        edges = local[self.edges[sector.edges]]
+        fixed = np.concatenate([sector.rank[np.asarray(self.fixed, dtype=int)], np.arange(sector.owned, len(sector.vertices))])
+
+        indata = InputData(
+            vertices=self.vertices[sector.vertices],
+            edges=edges.tolist(),
+            fixed=fixed[fixed >= 0].tolist(),
+            loads=self.loads[sector.vertices],
+            qpre=self.qpre[sector.edges],
+            fpre=self.fpre[sector.edges],
+            lpre=self.lpre[sector.edges],
+            linit=self.linit[sector.edges],
+            E=self.E[sector.edges],
+            radius=self.radius[sector.edges],
+        )
+        indata._sector = sector
+        return indata
+
     # =============================================================================
     # Constructors
     # =============================================================================
@@ -323,6 +683,9 @@ class ResultData(Data):
     forces
     lengths
     residuals
+    contacts
+    clashes
+    events
 
     Attributes
     ----------
@@ -331,6 +694,9 @@ class ResultData(Data):
     forces
     lengths
     residuals
+    contacts
+    clashes
+    events
 
     """
 
@@ -344,13 +710,16 @@ class ResultData(Data):
         # type: (dict) -> ResultData
         return super(ResultData, cls).__from_data__(data)
 
-    def __init__(self, xyz, q, forces, lengths, residuals):
-        # type: (npt.ArrayLike, npt.ArrayLike, npt.ArrayLike, npt.ArrayLike, npt.ArrayLike) -> None
+    def __init__(self, xyz, q, forces, lengths, residuals, contacts=None, clashes=None, events=None):
+        # type: (npt.ArrayLike, npt.ArrayLike, npt.ArrayLike, npt.ArrayLike, npt.ArrayLike, list[npt.ArrayLike] | None, npt.ArrayLike | None, list[dict] | None) -> None
         self.xyz = xyz
         self.q = q
         self.forces = forces
         self.lengths = lengths
         self.residuals = residuals
+        self.contacts = contacts
+        self.clashes = clashes
+        self.events = events
 
     def update_mesh(self, mesh, vertex_index=None):
         # type: (compas.datastructures.Mesh, dict[int, int] | None) -> None
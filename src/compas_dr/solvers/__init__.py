@@ -1,10 +1,34 @@
+from .assembly import AssemblyPlan
+from .backend import Backend
+from .backend import ThreadedBackend
+from .clearance import Clearance
+from .context import SolverContext
+from .diagnostics import Diagnosis
+from .diagnostics import diagnose_numpy
 from .dr import dr
+from .dr_components_numpy import dr_components_numpy
 from .dr_constrained_numpy import dr_constrained_numpy
+from .dr_multilevel_numpy import dr_multilevel_numpy
 from .dr_numpy import dr_numpy
+from .dr_partitioned_numpy import dr_partitioned_numpy
+from .fd_numpy import fd_numpy
+from .watchdog import Watchdog
 
 
 __all__ = [
+    "AssemblyPlan",
+    "Backend",
+    "ThreadedBackend",
+    "Clearance",
+    "SolverContext",
+    "Watchdog",
+    "Diagnosis",
+    "diagnose_numpy",
     "dr",
+    "dr_components_numpy",
     "dr_constrained_numpy",
+    "dr_multilevel_numpy",
     "dr_numpy",
+    "dr_partitioned_numpy",
+    "fd_numpy",
 ]
@@ -0,0 +1,257 @@
+import numpy
+from compas.linalg import normrow
+
+
+class ActiveSet:
+    """Class for tracking the vertices of a network that are still moving during relaxation.
+
+    A free vertex is frozen after its residual force and displacement have been below the tolerances
+    for a number of consecutive iterations.
+    The active vertices are the moving vertices and their free neighbours.
+    Frozen vertices in the active set are woken if their residual force or displacement
+    exceeds the tolerances multiplied by the ``wake`` factor.
+
+    The residual forces of the frozen vertices outside the active set only change
+    if one of their neighbours moves.
+    These vertices form the rim of the active set,
+    and their residual forces are recomputed whenever the convergence criteria are evaluated,
+    such that the residual forces of all free vertices are up to date.
+    If the frozen vertices prevent the criteria from being satisfied,
+    the frozen vertices with the largest residual forces are woken,
+    and the tolerance for freezing vertices is reduced.
+
+    The active set grows at most once every other iteration,
+    and shrinks at most once every ``k`` iterations.
+
+    Parameters
+    ----------
+    C : :class:`scipy.sparse.csr_matrix`
+        The connectivity matrix of the network.
+    free : array
+        The indices of the free vertices.
+    plan : :class:`compas_dr.solvers.AssemblyPlan`
+        The assembly plan of the stiffness matrix of the free vertices.
+    k : int, optional
+        The number of consecutive iterations a vertex has to be below the tolerances before it is frozen.
+    tol1 : float, optional
+        Tolerance for the length of the residual force vector of a single vertex.
+    tol2 : float, optional
+        Tolerance for the length of the displacement vector of a single vertex.
+        If None, the displacements are multiplied by the stiffness of the vertices,
+        and compared with ``tol1``.
+    wake : float, optional
+        The factor of the tolerances above which a frozen vertex is woken.
+    strict : float, optional
+        The length of the residual force vector of a single vertex below which it never prevents convergence.
+
+    Attributes
+    ----------
+    active : array
+        A boolean mask of the active vertices.
+    vertices : array
+        The active vertices.
+    edges : array
+        The edges connected to the active vertices.
+    Ca : :class:`scipy.sparse.csr_matrix`
+        The connectivity matrix of the active edges.
+    Cat2 : :class:`scipy.sparse.csr_matrix`
+        The transposed connectivity matrix of the active edges and vertices, with squared entries.
+    plan : :class:`compas_dr.solvers.AssemblyPlan`
+        The assembly plan of the stiffness matrix of the active vertices.
+    rim : array
+        The frozen vertices outside the active set with neighbours in the active set.
+    rim_plan : :class:`compas_dr.solvers.AssemblyPlan`
+        The assembly plan of the stiffness matrix of the vertices of the rim.
+
+    """
+
+    def __init__(self, C, free, plan, k=10, tol1=1e-3, tol2=None, wake=10.0, strict=0.0):
+        self.C = C
+        self.free = free
+        self._plan = plan
+        self.k = k
+        self.tol1 = tol1
+        self.tol2 = tol2
+        self.wake = wake
+        self.strict = strict
+
+        n = C.shape[1]
+        self.is_free = numpy.zeros(n, dtype=bool)
+        self.is_free[free] = True
+        self.local = numpy.full(n, -1, dtype=int)
+        self.local[free] = numpy.arange(len(free))
+        self.Et = abs(C).transpose().tocsr()
+        self.N = self.Et.dot(self.Et.transpose()).tocsr()
+        self.quiet = numpy.zeros(n, dtype=int)
+        self.moving = self.is_free.copy()
+        self._current = self.moving
+        self._rebuilt = 0
+        self.count = 0
+
+        # initially, all free vertices and all edges are active
+        # and the rim is empty
+
+        self.active = self.is_free.copy()
+        self.vertices = numpy.asarray(free, dtype=int)
+        self.edges = numpy.arange(C.shape[0])
+        self.Ca = None
+        self.Cat2 = None
+        self.plan = plan
+        self.rim = numpy.zeros(0, dtype=int)
+        self.rim_plan = None
+
+    def neighbours(self, mask):
+        """Identify the free vertices in or next to a selection of vertices.
+
+        Parameters
+        ----------
+        mask : array
+            A boolean mask of the selected vertices.
+
+        Returns
+        -------
+        array
+            A boolean mask.
+
+        """
+        return self.is_free & (self.N.dot(mask.astype(float)) > 0)
+
+    def reset(self, k=0):
+        """Wake all vertices.
+
+        Parameters
+        ----------
+        k : int, optional
+            The index of the current iteration.
+
+        Returns
+        -------
+        None
+
+        """
+        self.quiet[:] = 0
+        self.moving = self.is_free.copy()
+        self.activate(k)
+
+    def activate(self, k=0):
+        """Update the active vertices and edges, and the rim, to the moving vertices.
+
+        Parameters
+        ----------
+        k : int, optional
+            The index of the current iteration.
+
+        Returns
+        -------
+        None
+
+        """
+        active = self.neighbours(self.moving)
+        rim = self.neighbours(active) & ~active
+        self.active = active
+        self.vertices = numpy.flatnonzero(active)
+        edges = numpy.zeros(self.C.shape[0], dtype=bool)
+        edges[self.Et[self.vertices].indices] = True
+        self.edges = numpy.flatnonzero(edges)
+        self.Ca = self.C[self.edges]
+        self.Cat2 = self.Ca[:, self.vertices].transpose().tocsr()
+        self.Cat2.data **= 2
+        self.plan = self._plan.rows(self.local[self.vertices])
+        self.rim = numpy.flatnonzero(rim)
+        self.rim_plan = self._plan.rows(self.local[self.rim])
+        self._current = self.moving
+        self._rebuilt = k
+        self.count += 1
+
+    def freeze(self, r, dx, stiffness):
+        """Update the numbers of consecutive quiet iterations of the active vertices.
+
+        Parameters
+        ----------
+        r : array
+            The residual forces of the active vertices.
+        dx : array
+            The displacements of the active vertices.
+        stiffness : array
+            The stiffness of the active vertices, i.e. the diagonal of the stiffness matrix.
+
+        Returns
+        -------
+        None
+
+        """
+        quiet = self.quiet[self.vertices]
+        factor = numpy.where(quiet >= self.k, self.wake, 1.0)
+        is_quiet = normrow(r)[:, 0] < factor * self.tol1
+        if self.tol2 is None:
+            is_quiet &= normrow(dx)[:, 0] * stiffness[:, 0] < factor * self.tol1
+        else:
+            is_quiet &= normrow(dx)[:, 0] < factor * self.tol2
+        self.quiet[self.vertices] = numpy.where(is_quiet, quiet + 1, 0)
+        self.moving = self.is_free & (self.quiet < self.k)
+
+    def check(self, r, criteria, tol1):
+        """Wake the frozen vertices with large residual forces.
+
+        Parameters
+        ----------
+        r : array
+            The residual forces of all vertices.
+        criteria : :class:`compas_dr.solvers.convergence.ConvergenceCriteria`
+            The convergence criteria.
+        tol1 : float
+            The tolerance for the residual forces of the network.
+
+        Returns
+        -------
+        bool
+            True if the frozen vertices prevent the criteria from being satisfied.
+
+        """
+        free = self.free
+        frozen = ~self.moving[free]
+        if not frozen.any():
+            return False
+        residuals = normrow(r[free])[:, 0]
+        wake = frozen & (residuals >= self.wake * self.tol1)
+
+        # the frozen vertices with the largest residual forces are woken
+        # until the others no longer prevent the criteria from being satisfied
+        # and the tolerance for freezing vertices is reduced accordingly
+
+        index = numpy.flatnonzero(frozen & ~wake)
+        limited = criteria.forces(r[free[index]]) >= 0.5 * tol1
+        if limited:
+            index = index[numpy.argsort(residuals[index])]
+            if criteria.norm_type == "max":
+                keep = residuals[index] < 0.5 * tol1
+            else:
+                keep = numpy.sqrt(numpy.cumsum(residuals[index] ** 2)) / criteria.scale < 0.5 * tol1
+            wake[index[~keep]] = True
+            if keep.any():
+                self.tol1 = max(min(self.tol1, residuals[index[keep]].max()), self.strict)
+            else:
+                self.tol1 = self.strict
+
+        self.quiet[free[wake]] = 0
+        self.moving = self.is_free & (self.quiet < self.k)
+        return limited
+
+    def due(self, k):
+        """Verify if the active vertices and edges should be updated.
+
+        Parameters
+        ----------
+        k : int
+            The index of the current iteration.
+
+        Returns
+        -------
+        bool
+
+        """
+        if numpy.array_equal(self.moving, self._current):
+            return False
+        if (self.moving & ~self._current).any():
+            return k - self._rebuilt >= 2
+        return k - self._rebuilt >= self.k
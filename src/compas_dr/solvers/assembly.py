@@ -0,0 +1,187 @@
+import numpy
+import scipy.sparse
+
+
+class AssemblyPlan:
+    """Precomputed sparsity pattern of matrix products of the form ``Ca^T Q Cb``,
+    with ``Q`` a diagonal matrix of force densities.
+
+    The plan maps the force densities directly onto the data array of the assembled matrix,
+    such that repeated assembly with different force densities costs a single sparse matrix-vector product.
+
+    Parameters
+    ----------
+    Ca : :class:`scipy.sparse.csr_matrix`
+        Edge-vertex connectivity matrix providing the rows of the product.
+    Cb : :class:`scipy.sparse.csr_matrix`
+        Edge-vertex connectivity matrix providing the columns of the product.
+
+    """
+
+    def __init__(self, Ca, Cb):
+        Ca = scipy.sparse.csr_matrix(Ca)
+        Cb = scipy.sparse.csr_matrix(Cb)
+        m = Ca.shape[0]
+        self.shape = Ca.shape[1], Cb.shape[1]
+
+        na = numpy.diff(Ca.indptr)
+        nb = numpy.diff(Cb.indptr)
+        npairs = na * nb
+        edges = numpy.repeat(numpy.arange(m), npairs)
+        offset = numpy.arange(npairs.sum()) - numpy.repeat(numpy.cumsum(npairs) - npairs, npairs)
+        ia = Ca.indptr[edges] + offset // nb[edges]
+        ib = Cb.indptr[edges] + offset % nb[edges]
+
+        rows = Ca.indices[ia].astype(numpy.int64)
+        cols = Cb.indices[ib].astype(numpy.int64)
+        keys, inverse = numpy.unique(rows * self.shape[1] + cols, return_inverse=True)
+
+        self.P = scipy.sparse.csr_matrix((Ca.data[ia] * Cb.data[ib], (inverse.ravel(), edges)), shape=(len(keys), m))
+        self.indices = (keys % self.shape[1]).astype(numpy.int32)
+        self.indptr = numpy.concatenate(([0], numpy.cumsum(numpy.bincount(keys // self.shape[1], minlength=self.shape[0])))).astype(numpy.int32)
+
+    def assemble(self, q):
+        """Assemble the matrix product for the given force densities.
+
+        Parameters
+        ----------
+        q : array
+            The force densities of the edges.
+
+        Returns
+        -------
+        :class:`scipy.sparse.csr_matrix`
+
+        """
+        data = self.P.dot(numpy.ravel(q))
+        return scipy.sparse.csr_matrix((data, self.indices, self.indptr), shape=self.shape)
+
+    def rows(self, rows):
+        """Restrict the plan to a selection of rows of the matrix product.
+
+        Parameters
+        ----------
+        rows : array
+            The indices of the rows.
+
+        Returns
+        -------
+        :class:`AssemblyPlan`
+            A plan of the selected rows, with the force densities of all edges as input.
+
+        """
+        rows = numpy.asarray(rows, dtype=int)
+        start = self.indptr[rows]
+        count = self.indptr[rows + 1] - start
+        offset = numpy.cumsum(count) - count
+        index = numpy.repeat(start - offset, count) + numpy.arange(count.sum())
+        plan = AssemblyPlan.__new__(AssemblyPlan)
+        plan.shape = len(rows), self.shape[1]
+        plan.P = self.P[index]
+        plan.indices = self.indices[index]
+        plan.indptr = numpy.concatenate(([0], numpy.cumsum(count))).astype(numpy.int32)
+        return plan
+
+    def columns(self, columns):
+        """Restrict the plan to a selection of columns of the matrix product.
+
+        Parameters
+        ----------
+        columns : array
+            The indices of the columns, in ascending order.
+
+        Returns
+        -------
+        :class:`AssemblyPlan`
+
+        """
+        columns = numpy.asarray(columns, dtype=int)
+        local = numpy.full(self.shape[1], -1, dtype=int)
+        local[columns] = numpy.arange(len(columns))
+        index = numpy.flatnonzero(local[self.indices] >= 0)
+        rows = numpy.repeat(numpy.arange(self.shape[0]), numpy.diff(self.indptr))
+        plan = AssemblyPlan.__new__(AssemblyPlan)
+        plan.shape = self.shape[0], len(columns)
+        plan.P = self.P[index]
+        plan.indices = local[self.indices[index]].astype(numpy.int32)
+        plan.indptr = numpy.concatenate(([0], numpy.cumsum(numpy.bincount(rows[index], minlength=self.shape[0])))).astype(numpy.int32)
+        return plan
+
+    def edges(self, edges):
+        """Restrict the plan to a selection of edges.
+
+        The sparsity pattern of the product is not changed,
+        such that entries without remaining edges are explicit zeros.
+
+        Parameters
+        ----------
+        edges : array
+            The indices of the edges.
+
+        Returns
+        -------
+        :class:`AssemblyPlan`
+            A plan with the force densities of the selected edges as input.
+
+        """
+        plan = AssemblyPlan.__new__(AssemblyPlan)
+        plan.shape = self.shape
+        plan.P = self.P[:, edges]
+        plan.indices = self.indices
+        plan.indptr = self.indptr
+        return plan
+
+    def merge(self, other):
+        """Merge the plan with the plan of the same product for another set of edges.
+
+        Parameters
+        ----------
+        other : :class:`AssemblyPlan`
+            The plan of the other edges.
+
+        Returns
+        -------
+        :class:`AssemblyPlan`
+            A plan with the force densities of the edges of this plan, followed by those of the other plan, as input.
+
+        """
+        plans = self, other
+        keys = [numpy.repeat(numpy.arange(plan.shape[0]), numpy.diff(plan.indptr)) * self.shape[1] + plan.indices for plan in plans]
+        merged = numpy.union1d(*keys)
+        rows = []
+        cols = []
+        data = []
+        offset = 0
+        for plan, key in zip(plans, keys):
+            P = plan.P.tocoo()
+            rows.append(numpy.searchsorted(merged, key)[P.row])
+            cols.append(P.col + offset)
+            data.append(P.data)
+            offset += P.shape[1]
+        plan = AssemblyPlan.__new__(AssemblyPlan)
+        plan.shape = self.shape
+        plan.P = scipy.sparse.csr_matrix((numpy.concatenate(data), (numpy.concatenate(rows), numpy.concatenate(cols))), shape=(len(merged), offset))
+        plan.indices = (merged % self.shape[1]).astype(numpy.int32)
+        plan.indptr = numpy.concatenate(([0], numpy.cumsum(numpy.bincount(merged // self.shape[1], minlength=self.shape[0])))).astype(numpy.int32)
+        return plan
+
+    @staticmethod
+    def stack(plans):
+        """Stack the rows of a sequence of plans of products with the same columns and edges.
+
+        Parameters
+        ----------
+        plans : list[:class:`AssemblyPlan`]
+            The plans.
+
+        Returns
+        -------
+        :class:`AssemblyPlan`
+
+        """
+        plan = AssemblyPlan.__new__(AssemblyPlan)
+        plan.shape = sum(p.shape[0] for p in plans), plans[0].shape[1]
+        plan.P = scipy.sparse.vstack([p.P for p in plans], format="csr")
+        plan.indices = numpy.concatenate([p.indices for p in plans]).astype(numpy.int32)
+        plan.indptr = numpy.concatenate(([0], numpy.cumsum(numpy.concatenate([numpy.diff(p.indptr) for p in plans])))).astype(numpy.int32)
+        return plan
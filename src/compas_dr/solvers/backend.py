@@ -0,0 +1,139 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+import scipy.sparse
+
+
+class Backend:
+    """Base class for the sparse linear algebra backends of the solvers.
+
+    The default backend computes sparse matrix products with scipy, on a single thread.
+
+    Examples
+    --------
+    >>> import numpy
+    >>> import scipy.sparse
+    >>> from compas_dr.solvers import Backend
+    >>> backend = Backend()
+    >>> backend.dot(scipy.sparse.identity(3, format="csr"), numpy.ones((3, 1)))
+    array([[1.],
+           [1.],
+           [1.]])
+
+    """
+
+    def dot(self, A, x):
+        """Compute the product of a sparse matrix and a dense array.
+
+        Parameters
+        ----------
+        A : :class:`scipy.sparse.csr_matrix`
+            The sparse matrix.
+        x : array
+            The dense array.
+
+        Returns
+        -------
+        array
+
+        """
+        return A.dot(x)
+
+
+class ThreadedBackend(Backend):
+    """Backend computing the products of sparse CSR matrices with a pool of threads.
+
+    The rows of a matrix are split in blocks with roughly the same number of non-zero entries,
+    and the products of the blocks are computed in parallel.
+    The blocks share the data of the matrix, and the scipy kernels release the GIL,
+    so the threads run concurrently.
+    The partition of the rows is cached per sparsity pattern,
+    which is shared by all matrices assembled with the same :class:`compas_dr.solvers.AssemblyPlan`.
+
+    Parameters
+    ----------
+    threads : int, optional
+        The number of threads.
+        Defaults to the number of CPUs.
+    min_nnz : int, optional
+        Matrices with fewer non-zero entries are multiplied on the calling thread.
+
+    Examples
+    --------
+    >>> import numpy
+    >>> import scipy.sparse
+    >>> from compas_dr.solvers import ThreadedBackend
+    >>> backend = ThreadedBackend(threads=2, min_nnz=0)
+    >>> backend.dot(scipy.sparse.identity(3, format="csr"), numpy.ones((3, 1)))
+    array([[1.],
+           [1.],
+           [1.]])
+
+    """
+
+    def __init__(self, threads=None, min_nnz=100000):
+        self.threads = threads or os.cpu_count() or 1
+        self.min_nnz = min_nnz
+        self._pool = None
+        self._partitions = {}
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.threads)
+        return self._pool
+
+    def partition(self, A):
+        """Compute the row blocks of a matrix.
+
+        Parameters
+        ----------
+        A : :class:`scipy.sparse.csr_matrix`
+            The sparse matrix.
+
+        Returns
+        -------
+        list[tuple[int, int, int, int, array]]
+            For every block, the first and last row, the first and last non-zero entry,
+            and the index pointer array of the block.
+
+        """
+        key = id(A.indptr)
+        partition = self._partitions.get(key)
+        if partition is not None and partition[0] is A.indptr:
+            return partition[1]
+
+        indptr = A.indptr
+        bounds = numpy.searchsorted(indptr, numpy.linspace(0, indptr[-1], self.threads + 1))
+        bounds[0] = 0
+        bounds[-1] = A.shape[0]
+        bounds = numpy.unique(bounds)
+
+        blocks = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            a = indptr[start]
+            b = indptr[stop]
+            blocks.append((start, stop, a, b, indptr[start : stop + 1] - a))
+
+        if len(self._partitions) > 32:
+            self._partitions.clear()
+        self._partitions[key] = indptr, blocks
+        return blocks
+
+    def dot(self, A, x):
+        if getattr(A, "format", None) != "csr" or A.nnz < self.min_nnz or self.threads < 2:
+            return A.dot(x)
+
+        x = numpy.asarray(x)
+        y = numpy.empty((A.shape[0],) + x.shape[1:], dtype=numpy.result_type(A.dtype, x.dtype))
+        n = A.shape[1]
+
+        def work(block):
+            start, stop, a, b, indptr = block
+            B = scipy.sparse.csr_matrix((A.data[a:b], A.indices[a:b], indptr), shape=(stop - start, n), copy=False)
+            y[start:stop] = B.dot(x)
+
+        for future in [self.pool.submit(work, block) for block in self.partition(A)]:
+            future.result()
+        return y
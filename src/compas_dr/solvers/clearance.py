@@ -0,0 +1,304 @@
+import numpy
+
+# the offsets of a cell, and of half of its 26 neighbours
+# such that every pair of neighbouring cells is visited once
+OFFSETS = numpy.array([[i, j, k] for i in (-1, 0, 1) for j in (-1, 0, 1) for k in (-1, 0, 1)][13:], dtype=numpy.int64)
+
+
+def closest_points_on_segments(a, b, c, d):
+    """Compute the closest points of pairs of line segments.
+
+    Parameters
+    ----------
+    a : array
+        The start points of the first segments, as an array of shape ``(n, 3)``.
+    b : array
+        The end points of the first segments, as an array of shape ``(n, 3)``.
+    c : array
+        The start points of the second segments, as an array of shape ``(n, 3)``.
+    d : array
+        The end points of the second segments, as an array of shape ``(n, 3)``.
+
+    Returns
+    -------
+    tuple[array, array]
+        The parameters of the closest points on the first and on the second segments.
+
+    """
+    d1 = b - a
+    d2 = d - c
+    r = a - c
+    aa = numpy.einsum("ij,ij->i", d1, d1)
+    ee = numpy.einsum("ij,ij->i", d2, d2)
+    bb = numpy.einsum("ij,ij->i", d1, d2)
+    cc = numpy.einsum("ij,ij->i", d1, r)
+    ff = numpy.einsum("ij,ij->i", d2, r)
+
+    # the closest points of the infinite lines, clipped to the first segment
+    # then clipped to the second segment, and moved back on the first segment if necessary
+    # segments of zero length are treated as points
+
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        denom = aa * ee - bb * bb
+        s = numpy.where(denom > 0, numpy.clip((bb * ff - cc * ee) / denom, 0.0, 1.0), 0.0)
+        t = numpy.where(ee > 0, (bb * s + ff) / ee, 0.0)
+        below = t < 0
+        above = t > 1
+        t = numpy.clip(t, 0.0, 1.0)
+        s = numpy.where(below, numpy.clip(-cc / aa, 0.0, 1.0), s)
+        s = numpy.where(above, numpy.clip((bb - cc) / aa, 0.0, 1.0), s)
+        s = numpy.where(aa > 0, s, 0.0)
+
+    return s, t
+
+
+class Clearance:
+    """Class for detecting and resolving self-contact between the edges of a network during relaxation.
+
+    The edges are sampled at regular intervals, and the samples are hashed into the cells of a uniform grid,
+    by sorting them on the integer keys of their cells.
+    The pairs of edges with samples in the same or in neighbouring cells are candidates for contact.
+    The candidates are kept as long as no vertex moved further than half of the ``skin`` distance since they were found,
+    such that the grid is only rebuilt once in a while,
+    and the work per iteration is proportional to the number of edges.
+
+    Pairs of edges that share a vertex are never in contact.
+
+    Parameters
+    ----------
+    distance : float
+        The minimum clearance distance between the edges.
+    stiffness : float, optional
+        The stiffness of the penalty forces that push pairs of edges apart,
+        proportional to the depth of the violation of the clearance distance.
+        If None, the violations are only recorded.
+    skin : float, optional
+        The additional distance within which pairs of edges are kept as candidates.
+        Defaults to the clearance distance.
+
+    Attributes
+    ----------
+    pairs : array
+        The pairs of edges closer than the clearance distance, as an array of shape ``(k, 2)``.
+    distances : array
+        The distances between the pairs of edges.
+
+    Notes
+    -----
+    The clearance distance should be smaller than the distance between the edges of the faces of the network,
+    otherwise the edges of a face are always in contact.
+
+    The penalty forces are not included in the fictitious masses of the vertices.
+    A stiffness much larger than the stiffness of the edges in contact makes the iterations unstable.
+
+    Examples
+    --------
+    >>> import numpy
+    >>> from compas_dr.solvers import Clearance
+    >>> clearance = Clearance(0.2, stiffness=10.0)
+    >>> clearance.setup([[0, 1], [2, 3]])
+    >>> x = numpy.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.5, -0.5, 0.1], [0.5, 0.5, 0.1]])
+    >>> forces = clearance.forces(x)
+    >>> clearance.pairs.tolist()
+    [[0, 1]]
+    >>> forces[:, 2].round(3).tolist()
+    [-0.5, -0.5, 0.5, 0.5]
+
+    """
+
+    def __init__(self, distance, stiffness=None, skin=None):
+        self.distance = distance
+        self.stiffness = stiffness
+        self.skin = distance if skin is None else skin
+        self.pairs = numpy.zeros((0, 2), dtype=int)
+        self.distances = numpy.zeros(0)
+        self._edges = None
+        self._candidates = None
+        self._x = None
+
+    def setup(self, edges):
+        """Set the edges of the network, and discard the candidates for contact.
+
+        Parameters
+        ----------
+        edges : array
+            The vertex pairs of the edges, as an array of shape ``(m, 2)``.
+
+        Returns
+        -------
+        None
+
+        """
+        self._edges = numpy.asarray(edges, dtype=int).reshape((-1, 2))
+        self._candidates = None
+        self._x = None
+        self.pairs = numpy.zeros((0, 2), dtype=int)
+        self.distances = numpy.zeros(0)
+
+    def candidates(self, x):
+        """Find the pairs of edges that can be closer than the clearance distance plus the skin distance.
+
+        Parameters
+        ----------
+        x : array
+            The vertex coordinates.
+
+        Returns
+        -------
+        array
+            The pairs of edges, as an array of shape ``(k, 2)``.
+
+        """
+        cutoff = self.distance + self.skin
+        edges = self._edges
+        if not len(edges):
+            return numpy.zeros((0, 2), dtype=int)
+        a = x[edges[:, 0]]
+        b = x[edges[:, 1]]
+        lower = numpy.minimum(a, b)
+        upper = numpy.maximum(a, b)
+        lengths = numpy.linalg.norm(b - a, axis=1)
+
+        # samples at most "spacing" apart are in the same or neighbouring cells
+        # if the segments are closer than the cutoff distance
+        # the cells are enlarged for long edges, to limit the number of samples per edge
+        # and for large networks, to limit the number of cells
+
+        origin = lower.min(axis=0)
+        extent = float((upper.max(axis=0) - origin).max())
+        size = max(2 * cutoff, cutoff + float(numpy.median(lengths)) / 8, extent / 2**20)
+        spacing = size - cutoff
+        counts = numpy.ceil(lengths / spacing).astype(int) + 1
+        owners = numpy.repeat(numpy.arange(len(edges)), counts)
+        t = (numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) - counts, counts)) / numpy.repeat(numpy.maximum(counts - 1, 1), counts)
+        cells = numpy.floor((a[owners] + t[:, None] * (b - a)[owners] - origin) / size).astype(numpy.int64) + 1
+
+        # the cells are identified by their index in a grid with an empty layer of cells around the network
+        # such that the keys of the neighbouring cells are offsets of the key of a cell
+        # the samples of an edge in the same cell are consecutive, and only the first one is kept
+
+        shape = cells.max(axis=0) + 2
+        strides = numpy.array([shape[1] * shape[2], shape[2], 1], dtype=numpy.int64)
+        keys = cells.dot(strides)
+        first = numpy.ones(len(keys), dtype=bool)
+        first[1:] = (keys[1:] != keys[:-1]) | (owners[1:] != owners[:-1])
+        keys = keys[first]
+        owners = owners[first]
+        order = numpy.argsort(keys, kind="stable")
+        keys = keys[order]
+        owners = owners[order]
+
+        heads = numpy.flatnonzero(numpy.diff(keys, prepend=-1))
+        sizes = numpy.diff(heads, append=len(keys))
+        occupied = keys[heads]
+
+        # the edges of every pair of neighbouring cells are paired
+        # every pair of neighbouring cells is visited once
+
+        m = len(edges)
+        found = []
+        for offset in OFFSETS.dot(strides):
+            position = numpy.searchsorted(occupied, occupied + offset)
+            position[position == len(occupied)] = 0
+            neighbours = numpy.flatnonzero(occupied[position] == occupied + offset)
+            position = position[neighbours]
+            n = sizes[neighbours] * sizes[position]
+            groups = numpy.repeat(numpy.arange(len(n)), n)
+            k = numpy.arange(n.sum()) - numpy.repeat(numpy.cumsum(n) - n, n)
+            i = owners[heads[neighbours][groups] + k // sizes[position][groups]]
+            j = owners[heads[position][groups] + k % sizes[position][groups]]
+            keep = i < j if offset == 0 else i != j
+            i, j = numpy.minimum(i[keep], j[keep]), numpy.maximum(i[keep], j[keep])
+
+            # the pairs of edges with bounding boxes further apart than the cutoff distance
+            # and the pairs of edges that share a vertex are discarded
+
+            keep = numpy.all((lower[i] <= upper[j] + cutoff) & (lower[j] <= upper[i] + cutoff), axis=1)
+            i = i[keep]
+            j = j[keep]
+            u = edges[i]
+            v = edges[j]
+            keep = (u[:, 0] != v[:, 0]) & (u[:, 0] != v[:, 1]) & (u[:, 1] != v[:, 0]) & (u[:, 1] != v[:, 1])
+            found.append(i[keep] * m + j[keep])
+
+        found = numpy.sort(numpy.concatenate(found))
+        found = found[numpy.diff(found, prepend=-1) != 0]
+        return numpy.column_stack([found // m, found % m])
+
+    def update(self, x):
+        """Compute the pairs of edges closer than the clearance distance.
+
+        The candidates for contact are only searched again
+        if a vertex moved further than half of the skin distance since the last search.
+
+        Parameters
+        ----------
+        x : array
+            The vertex coordinates.
+
+        Returns
+        -------
+        tuple[array, array, array]
+            The pairs of edges in contact,
+            and the parameters of the closest points on the first and on the second edges.
+
+        """
+        if self._candidates is None or numpy.max(numpy.linalg.norm(x - self._x, axis=1)) > 0.5 * self.skin:
+            self._candidates = self.candidates(x)
+            self._x = x.copy()
+
+        pairs = self._candidates
+        u = self._edges[pairs[:, 0]]
+        v = self._edges[pairs[:, 1]]
+        s, t = closest_points_on_segments(x[u[:, 0]], x[u[:, 1]], x[v[:, 0]], x[v[:, 1]])
+        p = x[u[:, 0]] + s[:, None] * (x[u[:, 1]] - x[u[:, 0]])
+        q = x[v[:, 0]] + t[:, None] * (x[v[:, 1]] - x[v[:, 0]])
+        distances = numpy.linalg.norm(p - q, axis=1)
+
+        contact = distances < self.distance
+        self.pairs = pairs[contact]
+        self.distances = distances[contact]
+        return self.pairs, s[contact], t[contact]
+
+    def forces(self, x):
+        """Compute the penalty forces of the pairs of edges closer than the clearance distance.
+
+        The force of a pair of edges acts along the line between their closest points,
+        and is distributed over the vertices of the edges according to the parameters of the closest points.
+
+        Parameters
+        ----------
+        x : array
+            The vertex coordinates.
+
+        Returns
+        -------
+        array
+            The penalty forces at the vertices.
+            If the stiffness is None, all forces are zero.
+
+        """
+        pairs, s, t = self.update(x)
+        forces = numpy.zeros_like(x)
+        if self.stiffness is None or not len(pairs):
+            return forces
+
+        u = self._edges[pairs[:, 0]]
+        v = self._edges[pairs[:, 1]]
+        p = x[u[:, 0]] + s[:, None] * (x[u[:, 1]] - x[u[:, 0]])
+        q = x[v[:, 0]] + t[:, None] * (x[v[:, 1]] - x[v[:, 0]])
+
+        # edges that intersect are pushed apart along the normal of their plane
+
+        directions = p - q
+        crossing = self.distances == 0
+        directions[crossing] = numpy.cross(x[u[crossing, 1]] - x[u[crossing, 0]], x[v[crossing, 1]] - x[v[crossing, 0]])
+        lengths = numpy.linalg.norm(directions, axis=1)
+        lengths[lengths == 0] = 1.0
+        f = (self.stiffness * (self.distance - self.distances) / lengths)[:, None] * directions
+
+        vertices = numpy.concatenate([u[:, 0], u[:, 1], v[:, 0], v[:, 1]])
+        weights = numpy.concatenate([1 - s, s, t - 1, -t])
+        for axis in range(3):
+            forces[:, axis] = numpy.bincount(vertices, weights=weights * numpy.tile(f[:, axis], 4), minlength=len(x))
+        return forces
@@ -0,0 +1,531 @@
+import numpy
+import scipy.sparse
+from compas.linalg import normrow
+from compas.matrices import connectivity_matrix
+
+import compas_dr.numdata  # noqa: F401
+from compas_dr.solvers.assembly import AssemblyPlan
+from compas_dr.solvers.factorization import Factorization
+from compas_dr.solvers.tangent import TangentStiffness
+
+
+class SolverContext:
+    """Class representing the preprocessed topology and the state of a DR problem.
+
+    A context is built once from an input data object and can be passed to a solver instead of the input data.
+    The solver continues from the state stored in the context and writes the final state back to it,
+    such that subsequent solves restart from the previous equilibrium.
+    In between solves, the attributes and topology of the problem can be modified incrementally,
+    without rebuilding the input data and the connectivity matrices.
+    The assembly plan of the stiffness matrix is patched by these modifications instead of being rebuilt,
+    and the other assembly plans and the tangent stiffness matrix are derived from it.
+
+    The arrays of the context are expressed in the order of the array attributes of the input data.
+    The indices of vertices and edges passed to the modifications are the indices of the original order of the input data,
+    also if the input data is reordered with :meth:`compas_dr.numdata.InputData.reorder`,
+    such that they match the indices of the results of the solvers.
+
+    Parameters
+    ----------
+    indata : :class:`compas_dr.numdata.InputData`
+        An input data object.
+
+    Attributes
+    ----------
+    x : array
+        The current vertex coordinates.
+    v : array
+        The current vertex velocities.
+    q : array
+        The current force densities.
+    l : array
+        The current edge lengths.
+    f : array
+        The current edge forces.
+    r : array
+        The current residual forces.
+    p : array
+        The vertex loads.
+    fixed : array
+        The indices of the fixed vertices.
+    free : array
+        The indices of the free vertices.
+    edges : list[tuple[int, int]]
+        The vertex pairs of the edges.
+    adjacency : dict[int, list[int]]
+        The neighbours of every vertex.
+    edge_index : dict[tuple[int, int], int]
+        The index of the edge between a pair of vertices, in both directions.
+    C : :class:`scipy.sparse.csr_matrix`
+        The edge-vertex connectivity matrix.
+    Ct : :class:`scipy.sparse.csr_matrix`
+        The transpose of the connectivity matrix.
+    Ci : :class:`scipy.sparse.csr_matrix`
+        The columns of the connectivity matrix corresponding to the free vertices.
+    Cit : :class:`scipy.sparse.csr_matrix`
+        The transpose of ``Ci``.
+    Cit2 : :class:`scipy.sparse.csr_matrix`
+        ``Cit`` with all entries squared.
+    Cf : :class:`scipy.sparse.csr_matrix`
+        The columns of the connectivity matrix corresponding to the fixed vertices.
+    plan : :class:`AssemblyPlan`
+        The assembly plan of ``Cit Q C``.
+    plan_free : :class:`AssemblyPlan`
+        The assembly plan of ``Cit Q Ci``.
+    plan_fixed : :class:`AssemblyPlan`
+        The assembly plan of ``Cit Q Cf``.
+    factorization : :class:`compas_dr.solvers.factorization.Factorization`
+        The cached factorization of the stiffness matrix of the free vertices.
+    tangent : :class:`compas_dr.solvers.tangent.TangentStiffness`
+        The tangent stiffness matrix of the free vertices.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> from compas_dr.numdata import InputData
+    >>> from compas_dr.solvers import SolverContext
+    >>> from compas_dr.solvers import dr_numpy
+    >>> mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    >>> fixed = list(mesh.vertices_where(vertex_degree=2))
+    >>> loads = [[0, 0, 0]] * mesh.number_of_vertices()
+    >>> qpre = [1.0] * mesh.number_of_edges()
+    >>> context = SolverContext(InputData.from_mesh(mesh, fixed, loads, qpre))
+    >>> result = dr_numpy(context)
+    >>> context.update_edges([0, 1, 2], qpre=[10.0, 10.0, 10.0])
+    >>> result = dr_numpy(context)
+
+    """
+
+    def __init__(self, indata):
+        # type: (compas_dr.numdata.InputData) -> None
+        self.indata = indata
+
+        self.x = indata.vertices  # m
+        self.p = indata.loads  # kN
+        self.fixed = numpy.array(sorted(set(indata.fixed)), dtype=int)
+        self.qpre = indata.qpre.copy()
+        self.fpre = indata.fpre.copy()  # kN
+        self.lpre = indata.lpre.copy()  # m
+        self.E = indata.E.copy()  # kN/mm2 => GPa
+        self.radius = indata.radius.copy()  # mm
+
+        self._C = indata.C.tocsr()
+        self._factorization = None
+        self._reset_topology()
+
+        # if none of the initial lengths are set,
+        # set the initial lengths to the current lengths
+
+        self.q = indata.q0
+        self.l = normrow(self.C.dot(self.x))  # noqa: E741
+        self.f = self.q * self.l
+        self.v = indata.v0
+        self.r = indata.r0
+
+        self.linit = indata.linit.copy()  # m
+        if all(self.linit == 0):
+            self.linit = self.l.copy()
+
+    # the factorization detects changes of the sparsity pattern by itself
+    # and is never reset
+
+    def _reset_topology(self, plan=None, connectivity=True):
+        if connectivity:
+            self._edges = None
+            self._adjacency = None
+            self._edge_index = None
+            self._Ct = None
+        self._free = None
+        self._Ci = None
+        self._Cit = None
+        self._Cit2 = None
+        self._Cf = None
+        self._plan = plan
+        self._plan_free = None
+        self._plan_fixed = None
+        self._tangent = None
+
+    # =============================================================================
+    # Topology
+    # =============================================================================
+
+    @staticmethod
+    def area(radius):
+        """Compute the areas of the circular cross sections of edges.
+
+        Parameters
+        ----------
+        radius : array
+            The radii of the cross sections.
+
+        Returns
+        -------
+        array
+
+        """
+        return 3.14159 * radius**2
+
+    @property
+    def EA(self):
+        A = self.area(self.radius)  # mm2
+        return self.E * A  # kN
+
+    @property
+    def free(self):
+        if self._free is None:
+            self._free = numpy.setdiff1d(numpy.arange(self.x.shape[0]), self.fixed)
+        return self._free
+
+    @property
+    def edges(self):
+        if self._edges is None:
+            # the column indices of every row are sorted
+            # so the orientation of the edges is restored from the signs
+            C = self.C
+            first = C.indices[C.indptr[:-1]]
+            second = C.indices[C.indptr[:-1] + 1]
+            flip = C.data[C.indptr[:-1]] > 0
+            u = numpy.where(flip, second, first)
+            v = numpy.where(flip, first, second)
+            self._edges = list(zip(u.tolist(), v.tolist()))
+        return self._edges
+
+    @property
+    def adjacency(self):
+        if self._adjacency is None:
+            self._adjacency = {i: [] for i in range(self.x.shape[0])}
+            for i, j in self.edges:
+                self._adjacency[i].append(j)
+                self._adjacency[j].append(i)
+        return self._adjacency
+
+    @property
+    def edge_index(self):
+        if self._edge_index is None:
+            self._edge_index = {}
+            for index, (i, j) in enumerate(self.edges):
+                self._edge_index[(i, j)] = index
+                self._edge_index[(j, i)] = index
+        return self._edge_index
+
+    @property
+    def C(self):
+        return self._C
+
+    @property
+    def Ct(self):
+        if self._Ct is None:
+            self._Ct = self.C.transpose().tocsr()
+        return self._Ct
+
+    @property
+    def Ci(self):
+        if self._Ci is None:
+            self._Ci = self.C[:, self.free]
+        return self._Ci
+
+    @property
+    def Cit(self):
+        if self._Cit is None:
+            self._Cit = self.Ci.transpose().tocsr()
+        return self._Cit
+
+    @property
+    def Cit2(self):
+        if self._Cit2 is None:
+            self._Cit2 = self.Cit.copy()
+            self._Cit2.data **= 2
+        return self._Cit2
+
+    @property
+    def Cf(self):
+        if self._Cf is None:
+            self._Cf = self.C[:, self.fixed]
+        return self._Cf
+
+    @property
+    def plan(self):
+        if self._plan is None:
+            self._plan = AssemblyPlan(self.Ci, self.C)
+        return self._plan
+
+    @property
+    def plan_free(self):
+        if self._plan_free is None:
+            self._plan_free = self.plan.columns(self.free)
+        return self._plan_free
+
+    @property
+    def plan_fixed(self):
+        if self._plan_fixed is None:
+            self._plan_fixed = self.plan.columns(self.fixed)
+        return self._plan_fixed
+
+    @property
+    def factorization(self):
+        if self._factorization is None:
+            self._factorization = Factorization()
+        return self._factorization
+
+    @property
+    def tangent(self):
+        if self._tangent is None:
+            self._tangent = TangentStiffness(self.Ci, self.plan_free)
+        return self._tangent
+
+    # =============================================================================
+    # State
+    # =============================================================================
+
+    def force_densities(self, edges=None):
+        """Compute the force densities and the axial stiffness of the edges in the current state.
+
+        Parameters
+        ----------
+        edges : array, optional
+            The indices of a selection of edges.
+            Defaults to all edges.
+
+        Returns
+        -------
+        tuple[array, array]
+            The force densities, and the axial stiffness of the edges per unit length.
+
+        """
+        if edges is None:
+            edges = slice(None)
+        l = self.l[edges]  # noqa: E741
+        linit = self.linit[edges]
+        EA = self.EA[edges]
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            q_fpre = self.fpre[edges] / l
+            q_lpre = self.f[edges] / self.lpre[edges]
+            q_EA = EA * (l - linit) / (linit * l)
+            EA_linit = EA / linit
+        q_lpre[~numpy.isfinite(q_lpre)] = 0
+        q_EA[~numpy.isfinite(q_EA)] = 0
+        EA_linit[~numpy.isfinite(EA_linit)] = 0
+        qpre = self.qpre[edges]
+        q = qpre + q_fpre + q_lpre + q_EA
+        stiffness = qpre + q_fpre + q_lpre + EA_linit
+        return q, stiffness
+
+    def residuals(self):
+        """Compute the residual forces in the current geometry.
+
+        The lengths of the edges are updated to the current geometry,
+        and the force densities are computed with :meth:`force_densities`.
+
+        Returns
+        -------
+        array
+
+        """
+        u = self.C.dot(self.x)
+        self.l = normrow(u)  # noqa: E741
+        q, _ = self.force_densities()
+        return self.p - self.Ct.dot(q * u)
+
+    # =============================================================================
+    # Incremental updates
+    # =============================================================================
+
+    # the indices of the original order of the input data are mapped to the order of the arrays
+    # edges added after a reordering are not reordered
+
+    def _vertex_indices(self, vertices):
+        vertices = numpy.asarray(vertices, dtype=int)
+        if self.indata.vertex_rank is None:
+            return vertices
+        return self.indata.vertex_rank[vertices]
+
+    def _edge_indices(self, edges):
+        edges = numpy.asarray(edges, dtype=int)
+        order = self.indata.edge_order
+        if order is None:
+            return edges
+        rank = numpy.empty_like(order)
+        rank[order] = numpy.arange(len(order))
+        return numpy.where(edges < len(order), rank[numpy.minimum(edges, len(order) - 1)], edges)
+
+    def update_edges(self, edges, qpre=None, fpre=None, lpre=None, linit=None, E=None, radius=None):
+        """Update the attributes of a selection of edges.
+
+        Parameters
+        ----------
+        edges : list[int]
+            The indices of the edges.
+        qpre : list[float], optional
+            The new prescribed force densities.
+        fpre : list[float], optional
+            The new prescribed forces.
+        lpre : list[float], optional
+            The new prescribed lengths.
+        linit : list[float], optional
+            The new initial lengths.
+        E : list[float], optional
+            The new moduli of elasticity.
+        radius : list[float], optional
+            The new radii of the cross sections.
+
+        Returns
+        -------
+        None
+
+        """
+        edges = self._edge_indices(edges)
+        for name, values in (("qpre", qpre), ("fpre", fpre), ("lpre", lpre), ("linit", linit), ("E", E), ("radius", radius)):
+            if values is not None:
+                getattr(self, name)[edges] = numpy.asarray(values, dtype=numpy.float64).reshape((-1, 1))
+
+    def add_fixed(self, vertices):
+        """Fix a selection of vertices at their current location.
+
+        The rows of the vertices are removed from the assembly plan of the stiffness matrix.
+
+        Parameters
+        ----------
+        vertices : list[int]
+            The indices of the vertices.
+
+        Returns
+        -------
+        None
+
+        """
+        vertices = self._vertex_indices(vertices)
+        plan = self._plan
+        if plan is not None:
+            plan = plan.rows(numpy.flatnonzero(~numpy.isin(self.free, vertices)))
+        self.fixed = numpy.union1d(self.fixed, vertices)
+        self.v[self.fixed] = 0
+        self._reset_topology(plan=plan, connectivity=False)
+
+    def remove_fixed(self, vertices):
+        """Release a selection of fixed vertices.
+
+        The rows of the vertices are inserted in the assembly plan of the stiffness matrix.
+
+        Parameters
+        ----------
+        vertices : list[int]
+            The indices of the vertices.
+
+        Returns
+        -------
+        None
+
+        """
+        released = numpy.intersect1d(self.fixed, self._vertex_indices(vertices))
+        plan = self._plan
+        if plan is not None and len(released):
+            order = numpy.argsort(numpy.concatenate([self.free, released]))
+            plan = AssemblyPlan.stack([plan, AssemblyPlan(self.C[:, released], self.C)]).rows(order)
+        self.fixed = numpy.setdiff1d(self.fixed, released)
+        self._reset_topology(plan=plan, connectivity=False)
+
+    def add_edges(self, edges, qpre, fpre=None, lpre=None, linit=None, E=None, radius=None):
+        """Add edges between existing vertices.
+
+        The plan of the new edges is merged into the assembly plan of the stiffness matrix.
+
+        Parameters
+        ----------
+        edges : list[tuple[int, int]]
+            The vertex pairs of the new edges.
+        qpre : list[float]
+            The prescribed force densities of the new edges.
+        fpre : list[float], optional
+            The prescribed forces of the new edges.
+        lpre : list[float], optional
+            The prescribed lengths of the new edges.
+        linit : list[float], optional
+            The initial lengths of the new edges.
+            Defaults to the current lengths.
+        E : list[float], optional
+            The moduli of elasticity of the new edges.
+        radius : list[float], optional
+            The radii of the cross sections of the new edges.
+
+        Returns
+        -------
+        list[int]
+            The indices of the new edges.
+
+        """
+        m = self.C.shape[0]
+        C = connectivity_matrix(self._vertex_indices(edges).reshape((-1, 2)).tolist(), rtype="csr")
+        C.resize((C.shape[0], self.C.shape[1]))
+        plan = self._plan
+        if plan is not None:
+            plan = plan.merge(AssemblyPlan(C[:, self.free], C))
+        self._C = scipy.sparse.vstack([self.C, C], format="csr")
+
+        e = C.shape[0]
+        u = C.dot(self.x)
+        l = normrow(u)  # noqa: E741
+        if linit is None:
+            linit = l
+
+        def column(values):
+            if values is None:
+                return numpy.zeros((e, 1))
+            return numpy.asarray(values, dtype=numpy.float64).reshape((-1, 1))
+
+        self.qpre = numpy.vstack([self.qpre, column(qpre)])
+        self.fpre = numpy.vstack([self.fpre, column(fpre)])
+        self.lpre = numpy.vstack([self.lpre, column(lpre)])
+        self.linit = numpy.vstack([self.linit, column(linit)])
+        self.E = numpy.vstack([self.E, column(E)])
+        self.radius = numpy.vstack([self.radius, column(radius)])
+        self.q = numpy.vstack([self.q, numpy.ones((e, 1))])
+        self.l = numpy.vstack([self.l, l])
+        self.f = numpy.vstack([self.f, l])
+
+        self._reset_topology(plan=plan)
+        return list(range(m, m + e))
+
+    def remove_edges(self, edges):
+        """Remove a selection of edges.
+
+        The edges are removed from the assembly plan of the stiffness matrix,
+        without changing its sparsity pattern, such that the ordering of the factorization remains valid.
+
+        Parameters
+        ----------
+        edges : list[int]
+            The indices of the edges.
+            The indices of the remaining edges are shifted accordingly.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the input data is reordered.
+            The results of the solvers cannot be restored to the original order of the remaining edges.
+
+        """
+        if self.indata.edge_order is not None:
+            raise ValueError("Edges cannot be removed from the context of reordered input data.")
+        keep = numpy.ones(self.C.shape[0], dtype=bool)
+        keep[numpy.asarray(edges, dtype=int)] = False
+        self._C = self.C[keep]
+        for name in ("qpre", "fpre", "lpre", "linit", "E", "radius", "q", "l", "f"):
+            setattr(self, name, getattr(self, name)[keep])
+        plan = self._plan
+        if plan is not None:
+            plan = plan.edges(keep)
+        self._reset_topology(plan=plan)
+
+    def reset(self):
+        """Reset the velocities of the vertices.
+
+        Returns
+        -------
+        None
+
+        """
+        self.v[:] = 0
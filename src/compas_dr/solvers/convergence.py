@@ -0,0 +1,140 @@
+import numpy
+
+
+class ConvergenceCriteria:
+    """Class for evaluating the convergence criteria of the solvers.
+
+    There are separate criteria for the residual forces, for the displacements,
+    and for the residual forces along the constraints of constrained vertices.
+    The solvers compare them with separate tolerances, for example ``tol1``, ``tol2`` and ``tol3``
+    of :func:`compas_dr.solvers.dr_constrained_numpy`.
+    :func:`compas_dr.solvers.dr_numpy` has no constraints, and only uses the first two.
+
+    The criteria are only computed at every ``interval`` iterations.
+    The solvers gather the residual forces of the free vertices in a preallocated buffer that is reused for every evaluation,
+    and the displacements are only computed for the vertices that move.
+
+    Parameters
+    ----------
+    norm_type : {"l2", "max", "relative"}, optional
+        The norm used for the criteria.
+        With ``"l2"``, the Euclidean norm of all components is used.
+        With ``"max"``, the largest absolute component is used.
+        With ``"relative"``, the Euclidean norm of the residual forces is divided by the Euclidean norm of the loads.
+        The norm of the displacements is the Euclidean norm.
+    interval : int, optional
+        The number of iterations between two evaluations of the criteria.
+    loads : array, optional
+        The loads on the free vertices.
+        Required for ``"relative"`` criteria.
+
+    Raises
+    ------
+    ValueError
+        If the norm type is not supported.
+    ValueError
+        If the interval is smaller than 1.
+
+    Examples
+    --------
+    >>> import numpy
+    >>> from compas_dr.solvers.convergence import ConvergenceCriteria
+    >>> criteria = ConvergenceCriteria(norm_type="max", interval=10)
+    >>> criteria.due(9)
+    True
+    >>> float(criteria.forces(numpy.array([[0.0, 0.0, -2.0], [1.0, 0.0, 0.0]])))
+    2.0
+
+    """
+
+    NORM_TYPES = ("l2", "max", "relative")
+
+    def __init__(self, norm_type="l2", interval=1, loads=None):
+        if norm_type not in self.NORM_TYPES:
+            raise ValueError("Norm type not supported: {}".format(norm_type))
+        if interval < 1:
+            raise ValueError("The check interval should be at least 1.")
+        self.norm_type = norm_type
+        self.interval = interval
+        self.scale = 1.0
+        if norm_type == "relative" and loads is not None:
+            scale = self._l2(numpy.asarray(loads, dtype=numpy.float64))
+            if scale > 0:
+                self.scale = scale
+
+    @staticmethod
+    def _l2(a):
+        a = numpy.ravel(a)
+        return float(numpy.sqrt(numpy.dot(a, a)))
+
+    @staticmethod
+    def _max(a):
+        if not numpy.size(a):
+            return 0.0
+        return float(max(numpy.max(a), -numpy.min(a)))
+
+    def due(self, k):
+        """Verify if the criteria should be evaluated at an iteration.
+
+        Parameters
+        ----------
+        k : int
+            The index of the iteration.
+
+        Returns
+        -------
+        bool
+
+        """
+        return (k + 1) % self.interval == 0
+
+    def forces(self, r):
+        """Compute the criterion for an array of residual forces.
+
+        Parameters
+        ----------
+        r : array
+            The residual forces.
+
+        Returns
+        -------
+        float
+
+        """
+        if self.norm_type == "max":
+            return self._max(r)
+        return self._l2(r) / self.scale
+
+    def constraints(self, t):
+        """Compute the criterion for an array of residual forces along the constraints of constrained vertices.
+
+        The norm is the same as the norm of the residual forces.
+
+        Parameters
+        ----------
+        t : array
+            The tangent components of the residual forces of the constrained vertices.
+
+        Returns
+        -------
+        float
+
+        """
+        return self.forces(t)
+
+    def displacements(self, dx):
+        """Compute the criterion for an array of displacements.
+
+        Parameters
+        ----------
+        dx : array
+            The displacements.
+
+        Returns
+        -------
+        float
+
+        """
+        if self.norm_type == "max":
+            return self._max(dx)
+        return self._l2(dx)
@@ -0,0 +1,154 @@
+from typing import Union
+
+import numpy
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+import compas_dr.numdata
+from compas_dr.solvers.context import SolverContext
+
+
+class Diagnosis:
+    """Class representing the problems of a network that prevent the solvers from converging.
+
+    All indices refer to the original order of the vertices and edges of the input data.
+
+    Attributes
+    ----------
+    floating : list[array]
+        The vertices of every connected component without fixed vertices.
+    massless : array
+        The free vertices with zero or negative fictitious mass,
+        because the sum of the axial stiffness of their edges is not positive.
+    mechanisms : array
+        The free vertices of components with fixed vertices,
+        that are not connected to a fixed vertex through edges with positive axial stiffness.
+    degenerate : array
+        The edges of zero length.
+
+    """
+
+    def __init__(self, floating, massless, mechanisms, degenerate):
+        self.floating = floating
+        self.massless = massless
+        self.mechanisms = mechanisms
+        self.degenerate = degenerate
+
+    def __str__(self):
+        lines = []
+        if self.floating:
+            lines.append("Components without fixed vertices: {}".format([vertices.tolist() for vertices in self.floating]))
+        if len(self.massless):
+            lines.append("Free vertices without mass: {}".format(self.massless.tolist()))
+        if len(self.mechanisms):
+            lines.append("Free vertices not supported by stiff edges: {}".format(self.mechanisms.tolist()))
+        if len(self.degenerate):
+            lines.append("Edges of zero length: {}".format(self.degenerate.tolist()))
+        return "\n".join(lines) or "No problems found."
+
+    @property
+    def is_valid(self):
+        """bool: True if no problems were found."""
+        return not (self.floating or len(self.massless) or len(self.mechanisms) or len(self.degenerate))
+
+
+def diagnose_numpy(
+    indata: Union[compas_dr.numdata.InputData, SolverContext],
+    tol: float = 1e-9,
+) -> Diagnosis:
+    """Identify the problems of a network that prevent the solvers from converging, before relaxing it.
+
+    The connected components of the network are identified with a graph traversal of the edges,
+    and the fictitious masses of the vertices with the diagonal of the stiffness matrix,
+    assembled from the axial stiffness of the edges in the initial geometry.
+    The connected components of the network of edges with positive axial stiffness
+    identify the vertices that are not supported by the fixed vertices.
+
+    Parameters
+    ----------
+    indata : :class:`compas_dr.numdata.InputData` | :class:`compas_dr.solvers.SolverContext`
+        An input data object, or a solver context.
+        If a solver context is provided, the current state of the context is analysed.
+    tol : float, optional
+        The tolerance for masses, stiffness and lengths,
+        relative to the largest mass, stiffness and length of the network.
+
+    Returns
+    -------
+    :class:`compas_dr.solvers.Diagnosis`
+        The problems of the network.
+
+    Examples
+    --------
+    >>> from compas_dr.numdata import InputData
+    >>> from compas_dr.solvers import diagnose_numpy
+    >>> vertices = [[0, 0, 0], [1, 0, 0], [2, 0, 0], [0, 1, 0], [1, 1, 0]]
+    >>> edges = [[0, 1], [1, 2], [3, 4]]
+    >>> loads = [[0, 0, -1]] * 5
+    >>> indata = InputData(vertices, edges, [0, 2], loads, [1.0, 0.0, 1.0])
+    >>> diagnosis = diagnose_numpy(indata)
+    >>> [vertices.tolist() for vertices in diagnosis.floating]
+    [[3, 4]]
+    >>> diagnosis.mechanisms.tolist()
+    []
+    >>> diagnosis.is_valid
+    False
+
+    """
+    context = indata if isinstance(indata, SolverContext) else SolverContext(indata)
+    indata = context.indata
+
+    n = len(context.x)
+    edges = numpy.array(context.edges, dtype=int).reshape((-1, 2))
+    fixed = numpy.zeros(n, dtype=bool)
+    fixed[context.fixed] = True
+
+    # the stiffness of edges of zero length with prescribed forces is undefined
+
+    _, stiffness = context.force_densities()
+    stiffness = numpy.where(numpy.isfinite(stiffness), stiffness, 0.0).ravel()
+    lengths = context.l.ravel()
+
+    def scale(values):
+        return tol * (numpy.abs(values).max() if len(values) else 0.0)
+
+    # the fictitious masses are proportional to the diagonal of the stiffness matrix
+    # which is the sum of the axial stiffness of the edges connected to a vertex
+
+    diagonal = numpy.bincount(edges.ravel(), weights=numpy.repeat(stiffness, 2), minlength=n)
+    massless = numpy.flatnonzero(~fixed & (diagonal <= scale(diagonal)))
+
+    # the components of the network, and of the network of stiff edges
+    # a component is supported if it contains a fixed vertex
+
+    def labels(selection):
+        u, v = edges[selection].T
+        adjacency = coo_matrix((numpy.ones(len(u)), (u, v)), shape=(n, n))
+        count, labels = connected_components(adjacency, directed=False)
+        supported = numpy.zeros(count, dtype=bool)
+        supported[labels[fixed]] = True
+        return labels, supported[labels]
+
+    components, supported = labels(slice(None))
+    _, stiff = labels(stiffness > scale(stiffness))
+
+    degree = numpy.bincount(edges.ravel(), minlength=n)
+    loose = ~supported & (degree > 0)
+    order = numpy.argsort(components[loose], kind="stable")
+    vertices = numpy.flatnonzero(loose)[order]
+    heads = numpy.flatnonzero(numpy.diff(components[vertices], prepend=-1))
+    floating = numpy.split(vertices, heads[1:]) if len(vertices) else []
+
+    mechanisms = numpy.flatnonzero(supported & ~stiff)
+
+    degenerate = numpy.flatnonzero(lengths <= scale(lengths))
+
+    # the indices of the original order of the input data
+
+    if indata.vertex_order is not None:
+        floating = [numpy.sort(indata.vertex_order[vertices]) for vertices in floating]
+        massless = numpy.sort(indata.vertex_order[massless])
+        mechanisms = numpy.sort(indata.vertex_order[mechanisms])
+        degenerate = numpy.sort(indata.edge_order[degenerate])
+
+    return Diagnosis(floating, massless, mechanisms, degenerate)
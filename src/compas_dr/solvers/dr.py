@@ -4,19 +4,13 @@ from __future__ import print_function
 
 from math import sqrt
 
-K = [
-    [0.0],
-    [0.5, 0.5],
-    [0.5, 0.0, 0.5],
-    [1.0, 0.0, 0.0, 1.0],
-]
+from compas_dr.solvers.integration import Coeff
+from compas_dr.solvers.integration import K
 
-
-class Coeff:
-    def __init__(self, c):
-        self.c = c
-        self.a = (1 - c * 0.5) / (1 + c * 0.5)
-        self.b = 0.5 * (1 + self.a)
+try:
+    from compas_dr.solvers.context import SolverContext
+except ImportError:
+    SolverContext = None
 
 
 def norm_vector(vector):
@@ -88,10 +82,10 @@ def adjacency_from_edges(edges):
 
 def dr(
     vertices,
-    edges,
-    fixed,
-    loads,
-    qpre,
+    edges=None,
+    fixed=None,
+    loads=None,
+    qpre=None,
     fpre=None,
     lpre=None,
     linit=None,
@@ -109,8 +103,12 @@ def dr(
 
     Parameters
     ----------
-    vertices : list
-        XYZ coordinates of the vertices.
+    vertices : list | :class:`compas_dr.solvers.SolverContext`
+        XYZ coordinates of the vertices, or a solver context.
+        With a solver context, the edges, fixed vertices, loads, and prescribed values are taken from the context,
+        the solver continues from the geometry and velocities stored in the context,
+        and the final state is written back to it.
+        The adjacency of the vertices is cached on the context in between solves.
     edges : list
         Connectivity of the vertices.
     fixed : list
@@ -161,6 +159,11 @@ def dr(
     r : array
         Residual forces.
 
+    Raises
+    ------
+    ValueError
+        If the input data of the solver context is reordered, or is the sector of a symmetric network.
+
     Examples
     --------
     >>>
@@ -169,6 +172,25 @@ def dr(
         if not callable(callback):
             raise Exception("The callback is not callable.")
 
+    # --------------------------------------------------------------------------
+    # context
+    # --------------------------------------------------------------------------
+
+    context = None
+    if SolverContext is not None and isinstance(vertices, SolverContext):
+        context = vertices
+        if context.indata.sector is not None:
+            raise ValueError("The sector of a symmetric network is not supported by this solver.")
+        if context.indata.vertex_order is not None or context.indata.edge_order is not None:
+            raise ValueError("Reordered input data is not supported by this solver.")
+        vertices = context.x.tolist()
+        edges = context.edges
+        fixed = context.fixed.tolist()
+        loads = context.p.tolist()
+        qpre = context.qpre[:, 0].tolist()
+        fpre = context.fpre[:, 0].tolist()
+        lpre = context.lpre[:, 0].tolist()
+
     # --------------------------------------------------------------------------
     # preprocess
     # --------------------------------------------------------------------------
@@ -176,10 +198,13 @@ def dr(
     n = len(vertices)
     e = len(edges)
 
-    i_nbrs = adjacency_from_edges(edges)
-
-    ij_e = {(i, j): index for index, (i, j) in enumerate(edges)}
-    ij_e.update({(j, i): index for (i, j), index in ij_e.items()})
+    if context is None:
+        i_nbrs = adjacency_from_edges(edges)
+        ij_e = {(i, j): index for index, (i, j) in enumerate(edges)}
+        ij_e.update({(j, i): index for (i, j), index in ij_e.items()})
+    else:
+        i_nbrs = context.adjacency
+        ij_e = context.edge_index
 
     coeff = Coeff(c)
     ca = coeff.a
@@ -200,11 +225,16 @@ def dr(
     # initial values
     # --------------------------------------------------------------------------
 
-    Q = [1.0 for _ in range(e)]
-    L = [sum((X[i][axis] - X[j][axis]) ** 2 for axis in (0, 1, 2)) ** 0.5 for i, j in iter(edges)]
-    F = [q * length for q, length in zip(Q, L)]
-    M = [sum(0.5 * dt**2 * Q[ij_e[(i, j)]] for j in i_nbrs[i]) for i in range(n)]
-    V = [[0.0, 0.0, 0.0] for _ in range(n)]
+    if context is None:
+        Q = [1.0 for _ in range(e)]
+        L = [sum((X[i][axis] - X[j][axis]) ** 2 for axis in (0, 1, 2)) ** 0.5 for i, j in iter(edges)]
+        F = [q * length for q, length in zip(Q, L)]
+        V = [[0.0, 0.0, 0.0] for _ in range(n)]
+    else:
+        Q = context.q[:, 0].tolist()
+        L = context.l[:, 0].tolist()
+        F = context.f[:, 0].tolist()
+        V = context.v.tolist()
     R = [[0.0, 0.0, 0.0] for _ in range(n)]
     dX = [[0.0, 0.0, 0.0] for _ in range(n)]
 
@@ -315,4 +345,12 @@ def dr(
 
     update_R()
 
+    if context is not None:
+        context.x[:] = X
+        context.v[:] = V
+        context.q[:, 0] = Q
+        context.l[:, 0] = L
+        context.f[:, 0] = F
+        context.r[:] = R
+
     return X, Q, F, L, R
@@ -0,0 +1,276 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal
+from typing import Union
+
+import numpy
+from compas.linalg import normrow
+from scipy.sparse.csgraph import connected_components
+
+import compas_dr.numdata
+from compas_dr.numdata import InputData
+from compas_dr.numdata import ResultData
+from compas_dr.solvers.backend import Backend
+from compas_dr.solvers.context import SolverContext
+from compas_dr.solvers.dr_numpy import dr_numpy
+
+
+def components(C):
+    """Identify the connected components of a network.
+
+    Parameters
+    ----------
+    C : :class:`scipy.sparse.csr_matrix`
+        The connectivity matrix of the network.
+
+    Returns
+    -------
+    list[array]
+        The indices of the vertices of every component with at least one edge.
+
+    """
+    E = abs(C)
+    count, labels = connected_components(E.transpose().dot(E), directed=False)
+    order = numpy.argsort(labels, kind="stable")
+    parts = numpy.split(order, numpy.cumsum(numpy.bincount(labels, minlength=count))[:-1])
+    degree = numpy.diff(E.transpose().tocsr().indptr)
+    return [part for part in parts if degree[part].any()]
+
+
+class Component:
+    """Class representing a connected component of a network.
+
+    Parameters
+    ----------
+    vertices : array
+        The global indices of the vertices of the component.
+    context : :class:`compas_dr.solvers.SolverContext`
+        The context of the complete network.
+
+    Attributes
+    ----------
+    vertices : array
+        The global indices of the vertices of the component.
+    edges : array
+        The global indices of the edges of the component.
+    context : :class:`compas_dr.solvers.SolverContext`
+        The context of the component.
+
+    """
+
+    def __init__(self, vertices, context):
+        C = context.C
+        Ct = context.Ct
+
+        self.vertices = numpy.asarray(vertices, dtype=int)
+        self.edges = numpy.unique(Ct[self.vertices].indices)
+
+        local = numpy.full(C.shape[1], -1, dtype=int)
+        local[self.vertices] = numpy.arange(len(self.vertices))
+
+        # the column indices of the connectivity matrix are sorted
+        # so the orientation of the edges is restored from the signs
+
+        uv = C[self.edges]
+        u = local[uv.indices[uv.indptr[:-1]]]
+        v = local[uv.indices[uv.indptr[:-1] + 1]]
+        flip = uv.data[uv.indptr[:-1]] > 0
+        u, v = numpy.where(flip, v, u), numpy.where(flip, u, v)
+
+        indata = InputData(
+            vertices=context.x[self.vertices].copy(),
+            edges=numpy.column_stack([u, v]).tolist(),
+            fixed=local[numpy.intersect1d(context.fixed, self.vertices)].tolist(),
+            loads=context.p[self.vertices].copy(),
+            qpre=context.qpre[self.edges],
+            fpre=context.fpre[self.edges],
+            lpre=context.lpre[self.edges],
+            linit=context.linit[self.edges],
+            E=context.E[self.edges],
+            radius=context.radius[self.edges],
+        )
+        self.context = SolverContext(indata)
+        self.context.v = context.v[self.vertices].copy()
+        for name in ("q", "l", "f"):
+            setattr(self.context, name, getattr(context, name)[self.edges].copy())
+
+    def gather(self, context):
+        """Copy the state of the component to the complete network.
+
+        Parameters
+        ----------
+        context : :class:`compas_dr.solvers.SolverContext`
+            The context of the complete network.
+
+        Returns
+        -------
+        None
+
+        """
+        context.x[self.vertices] = self.context.x
+        context.v[self.vertices] = self.context.v
+        for name in ("q", "l", "f"):
+            getattr(context, name)[self.edges] = getattr(self.context, name)
+
+
+def dr_components_numpy(
+    indata: Union[compas_dr.numdata.InputData, SolverContext],
+    threads: int = None,
+    kmax: int = 10000,
+    dt: float = 1.0,
+    tol1: float = 1e-3,
+    tol2: float = 1e-6,
+    c: float = 0.1,
+    rk_steps: Literal[1, 2, 4] = 2,
+    integrator: Literal["rk", "implicit", "fire", "nesterov"] = "rk",
+    newton_tol: float = None,
+    newton_kmax: int = 10,
+    check_interval: int = 1,
+    norm_type: Literal["l2", "max", "relative"] = "l2",
+    backend: Backend = None,
+) -> compas_dr.numdata.ResultData:
+    """Dynamic relaxation of a network of axial-force members, with the connected components relaxed independently.
+
+    The connected components of the network are identified from its edges,
+    and relaxed with :func:`compas_dr.solvers.dr_numpy` on a pool of threads.
+    Every component stops as soon as it has converged,
+    such that components that converge early don't take part in the iterations of the slower ones.
+    The results of the components are merged in the result of the complete network.
+
+    For ``"l2"`` norms, the tolerances of the components are divided by the square root of the number of components,
+    such that the criteria of the complete network are also satisfied if all components have converged.
+    For ``"max"`` and ``"relative"`` norms, this is already the case with the original tolerances.
+
+    Parameters
+    ----------
+    indata : :class:`compas_dr.numdata.InputData` | :class:`compas_dr.solvers.SolverContext`
+        An input data object, or a solver context.
+        If a solver context is provided, the solver continues from the state stored in the context,
+        and the final state is written back to it.
+    threads : int, optional
+        The number of threads.
+        Defaults to the number of components, or the number of CPUs if that is smaller.
+        With one thread, the components are relaxed one after the other.
+    kmax : int, optional
+        The maximum number of iterations per component.
+    dt : float, optional
+        The time step for the integration scheme.
+    tol1 : float, optional
+        Tolerance for the norm of the residual forces of the complete network.
+    tol2 : float, optional
+        Tolerance for the norm of the displacements of the complete network.
+    c : float, optional
+        Value used to calculate coefficients "a" and "b" of the RK integration.
+    rk_steps : {1, 2, 4}, optional
+        The number of Runge Kutta integration steps.
+    integrator : {"rk", "implicit", "fire", "nesterov"}, optional
+        The time integration scheme, see :func:`compas_dr.solvers.dr_numpy`.
+    newton_tol : float, optional
+        The norm of the residual forces of a component below which its equilibrium is polished with Newton-Raphson iterations,
+        see :func:`compas_dr.solvers.dr_numpy`.
+    newton_kmax : int, optional
+        The maximum number of Newton-Raphson iterations.
+    check_interval : int, optional
+        The number of iterations between two evaluations of the convergence criteria.
+    norm_type : {"l2", "max", "relative"}, optional
+        The norm used for the convergence criteria.
+    backend : :class:`compas_dr.solvers.Backend`, optional
+        The backend for the sparse matrix products of the iterations of every component,
+        see :func:`compas_dr.solvers.dr_numpy`.
+
+    Returns
+    -------
+    :class:`compas_dr.numdata.ResultData`
+        A result data object.
+
+    Raises
+    ------
+    ValueError
+        If the input data is the data of one sector of a symmetric network.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> from compas_dr.numdata import InputData
+    >>> from compas_dr.solvers import dr_components_numpy
+    >>> mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    >>> fixed = list(mesh.vertices_where(vertex_degree=2))
+    >>> loads = [[0, 0, -0.1]] * mesh.number_of_vertices()
+    >>> qpre = [1.0] * mesh.number_of_edges()
+    >>> result = dr_components_numpy(InputData.from_mesh(mesh, fixed, loads, qpre))
+
+    """
+    context = indata if isinstance(indata, SolverContext) else SolverContext(indata)
+
+    if context.indata.sector is not None:
+        raise ValueError("The sector of a symmetric network is not supported by this solver.")
+
+    x = context.x  # m
+    p = context.p  # kN
+    C = context.C
+    Ct = context.Ct
+
+    # --------------------------------------------------------------------------
+    # components
+    # --------------------------------------------------------------------------
+
+    parts = [Component(vertices, context) for vertices in components(C)]
+
+    if norm_type == "l2" and len(parts) > 1:
+        tol1 = tol1 / len(parts) ** 0.5
+        tol2 = tol2 / len(parts) ** 0.5
+        if newton_tol:
+            newton_tol = newton_tol / len(parts) ** 0.5
+
+    options = dict(
+        kmax=kmax,
+        dt=dt,
+        tol1=tol1,
+        tol2=tol2,
+        c=c,
+        rk_steps=rk_steps,
+        integrator=integrator,
+        newton_tol=newton_tol,
+        newton_kmax=newton_kmax,
+        check_interval=check_interval,
+        norm_type=norm_type,
+        backend=backend,
+    )
+
+    # the floating point error settings are local to every thread
+
+    def relax(part):
+        with numpy.errstate(divide="ignore"):
+            dr_numpy(part.context, **options)
+
+    # --------------------------------------------------------------------------
+    # relax
+    # --------------------------------------------------------------------------
+
+    threads = threads or min(len(parts), os.cpu_count() or 1)
+    if threads > 1 and len(parts) > 1:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(relax, parts))
+    else:
+        for part in parts:
+            relax(part)
+
+    for part in parts:
+        part.gather(context)
+
+    # --------------------------------------------------------------------------
+    # result
+    # --------------------------------------------------------------------------
+
+    q = context.q
+    u = C.dot(x)
+    l = normrow(u)  # noqa: E741
+    f = q * l
+    r = p - Ct.dot(q * u)
+
+    context.q = q
+    context.l = l
+    context.f = f
+    context.r = r
+
+    return context.indata.restore(ResultData(xyz=x, q=q, forces=f, lengths=l, residuals=r))
@@ -1,48 +1,47 @@
 from typing import Callable
 from typing import Literal
 from typing import Sequence
+from typing import Union
 
 import numpy
 import scipy.sparse  # noqa: F401
 from compas.linalg import normrow
-from numpy import isinf
-from numpy import isnan
-from scipy.linalg import norm
-from scipy.sparse import diags
 
 import compas_dr.numdata
 from compas_dr.constraints import Constraint
+from compas_dr.constraints import ConstraintSet
+from compas_dr.constraints import Contact
+from compas_dr.constraints import MultiConstraint
 from compas_dr.numdata import ResultData
+from compas_dr.solvers.backend import Backend
+from compas_dr.solvers.clearance import Clearance
+from compas_dr.solvers.context import SolverContext
+from compas_dr.solvers.convergence import ConvergenceCriteria
+from compas_dr.solvers.integration import Coeff
+from compas_dr.solvers.integration import rk
 
 old_settings = numpy.seterr(divide="ignore")
 
 
-K = [
-    [0.0],
-    [0.5, 0.5],
-    [0.5, 0.0, 0.5],
-    [1.0, 0.0, 0.0, 1.0],
-]
-
-
-class Coeff:
-    def __init__(self, c):
-        self.c = c
-        self.a = (1 - c * 0.5) / (1 + c * 0.5)
-        self.b = 0.5 * (1 + self.a)
-
-
 def dr_constrained_numpy(
     *,
-    indata: compas_dr.numdata.InputData,
-    constraints: Sequence[Constraint],
+    indata: Union[compas_dr.numdata.InputData, SolverContext],
+    constraints: Union[Sequence[Constraint], ConstraintSet],
+    contacts: Sequence[Contact] = None,
+    clearance: Clearance = None,
     kmax: int = 10000,
     dt: float = 1.0,
     tol1: float = 1e-3,
     tol2: float = 1e-6,
+    tol3: float = None,
     c: float = 0.1,
     rk_steps: Literal[1, 2, 4] = 2,
     damping: float = 0.1,
+    newton_tol: float = None,
+    newton_kmax: int = 10,
+    check_interval: int = 1,
+    norm_type: Literal["l2", "max", "relative"] = "l2",
+    backend: Backend = None,
     callback: Callable = None,
     callback_args: list = None,
 ) -> compas_dr.numdata.ResultData:
@@ -51,10 +50,29 @@ def dr_constrained_numpy(
 
     Parameters
     ----------
-    indata : :class:`compas_dr.numdata.InputData`
-        An input data object.
-    constraints : list[:class:`~compas_dr.constraints.Constraint`]
-        Vertex constraints.
+    indata : :class:`compas_dr.numdata.InputData` | :class:`compas_dr.solvers.SolverContext`
+        An input data object, or a solver context.
+        With a solver context, the solver continues from the state stored in the context,
+        and writes the final state back to it.
+        With the data of one sector of a symmetric network (see :meth:`compas_dr.numdata.InputData.reduced`),
+        only the sector is relaxed, and the result is the result of the complete network.
+    constraints : :class:`~compas_dr.constraints.ConstraintSet` | list[:class:`~compas_dr.constraints.Constraint`]
+        Vertex constraints, as a constraint set,
+        or as a list with a constraint or None per vertex.
+        Only the constrained vertices of a constraint set are visited by the solver.
+        The vertices of a :class:`~compas_dr.constraints.MultiConstraint` are updated at once.
+        For the sector of a symmetric network, the constraints are given for the vertices of the complete network,
+        and only the constraints of the representative vertices of the sector are used.
+    contacts : list[:class:`~compas_dr.constraints.Contact`], optional
+        One-sided contacts, evaluated for all free vertices at once.
+        The free vertices that violate a contact are projected on its boundary,
+        and the components of their velocities and residual forces towards the violated side are removed.
+        The vertices in contact at the end of the solve are reported in the result.
+    clearance : :class:`~compas_dr.solvers.Clearance`, optional
+        Self-contact between the edges of the network.
+        The penalty forces of the pairs of edges closer than the clearance distance
+        are added to the loads once per iteration.
+        The pairs of edges in contact at the end of the solve are stored in the ``clashes`` of the result.
     kmax : int, optional
         The maximum number of iterations.
     dt : float, optional
@@ -63,20 +81,45 @@ def dr_constrained_numpy(
         Tolerance for the sum of the length of all residual force vectors.
     tol2 : float, optional
         Tolerance for the sum of the length of all displacement vectors.
+    tol3 : float, optional
+        Tolerance for the residual forces of the constrained vertices, along the constraints.
+        If provided, the residual forces of the constrained vertices are excluded from the criterion for ``tol1``,
+        and the solver only stops on the residual forces if both criteria are satisfied.
     c : float, optional
         Value used to calculate coefficients "a" and "b", with
         "a" used as a multiplication factor for the starting velocity for the RK integration at every iteration, and
         "b" used as a multiplication factor for the acceleration used during RK integration.
     rk_steps : {1, 2, 4}, optional
         The number of Runge Kutta integration steps.
+    damping : float, optional
+        Damping factor for the updates of the constrained vertices.
+    newton_tol : float, optional
+        If provided, the DR iterations are stopped as soon as the norm of the residual forces drops below this value,
+        and the equilibrium is polished with Newton-Raphson iterations using the tangent stiffness matrix of the network.
+        The constrained vertices are held in place during every Newton-Raphson step, and updated afterwards.
+        The Newton-Raphson iterations stop if the residual forces increase.
+        Newton-Raphson polishing is not available for the sector of a symmetric network.
+    newton_kmax : int, optional
+        The maximum number of Newton-Raphson iterations.
+    check_interval : int, optional
+        The number of iterations between two evaluations of the convergence criteria.
+    norm_type : {"l2", "max", "relative"}, optional
+        The norm used for the convergence criteria.
+        With ``"l2"``, the Euclidean norm of the residual forces and displacements of all free vertices is used.
+        With ``"max"``, the largest absolute component is used.
+        With ``"relative"``, the Euclidean norm of the residual forces is divided by the Euclidean norm of the loads.
+    backend : :class:`compas_dr.solvers.Backend`, optional
+        The backend for the sparse matrix products of the iterations.
+        Use a :class:`compas_dr.solvers.ThreadedBackend` to distribute the products over multiple threads.
+        Defaults to single-threaded scipy products.
     callback : callable, optional
-        User-defined function that is called at every iteration.
-        If provided, the callback will be called at every iteration with the following arguments
+        User-defined function that is called whenever the convergence criteria are evaluated.
+        If provided, the callback will be called with the following arguments
 
         * `k`: the number of the current iteration
         * `x`: the current vertex coordinates
-        * `crit1`: the norm of the residual forces
-        * `crit2`: the norm of the displacement vectors
+        * `crit1`: the convergence criterion for the residual forces
+        * `crit2`: the convergence criterion for the displacement vectors
         * `callback_args`: optional additional arguments
 
     callback_args : tuple, optional
@@ -91,6 +134,8 @@ def dr_constrained_numpy(
     ------
     ValueError
         If a callback function is provided that is not callable.
+    ValueError
+        If the norm type is not supported, or the check interval is smaller than 1.
 
     Notes
     -----
@@ -127,125 +172,174 @@ def dr_constrained_numpy(
     # numdata
     # --------------------------------------------------------------------------
 
-    x = indata.vertices  # m
-    p = indata.loads  # kN
-    free = indata.free
-    qpre = indata.qpre
-    lpre = indata.lpre  # kN
-    fpre = indata.fpre  # m
-    linit = indata.linit  # m
-    E = indata.E  # kN/mm2 => GPa
-    radius = indata.radius  # mm
-
-    C = indata.C  # type: scipy.sparse.csr_matrix
-    Ct = C.transpose()
-    Ci = C[:, free]
-    Cit = Ci.transpose()
-    Ct2 = Ct.copy()
-    Ct2.data **= 2
-
-    A = 3.14159 * radius**2  # mm2
-    EA = E * A  # kN
+    context = indata if isinstance(indata, SolverContext) else SolverContext(indata)
+    sector = context.indata.sector
+
+    # the tangent stiffness matrix does not couple the ghost vertices of a sector to their representatives
+
+    if sector is not None:
+        newton_tol = None
+
+    x = context.x  # m
+    p = context.p  # kN
+    free = context.free
+    fpre = context.fpre  # kN
+
+    C = context.C  # type: scipy.sparse.csr_matrix
+    Ct = context.Ct
+    Cit2 = context.Cit2
+
+    if not isinstance(constraints, ConstraintSet):
+        constraints = ConstraintSet.from_list(constraints)
+    if sector is not None:
+        constraints = constraints.remapped(sector.rank)
+    if context.indata.vertex_rank is not None:
+        constraints = constraints.remapped(context.indata.vertex_rank)
+    contacts = contacts or []
 
     # --------------------------------------------------------------------------
-    # initial values
+    # convergence criteria
     # --------------------------------------------------------------------------
-    # if none of the initial lengths are set,
-    # set the initial lengths to the current lengths
+    # with a separate tolerance for the constrained vertices
+    # their residual forces are checked along the constraints only
     # --------------------------------------------------------------------------
 
-    q = indata.q0
-    l = indata.l0  # noqa: E741
-    f = q * l
-    v = indata.v0
-    r = indata.r0
+    backend = backend or Backend()
+    dot = backend.dot
+
+    criteria = ConvergenceCriteria(norm_type=norm_type, interval=check_interval, loads=p[free])
+
+    # the penalty forces of self-contact are added to a copy of the loads
+
+    if clearance is not None:
+        clearance.setup(context.edges)
+        p = p + clearance.forces(x)
+
+    constrained = numpy.asarray(constraints.vertices, dtype=int)
+    groups = [(constraint, numpy.asarray(vertices, dtype=int)) for constraint, vertices in constraints]
+    unconstrained = free
+    if tol3 is not None:
+        unconstrained = numpy.setdiff1d(free, constrained)
+    tangents = numpy.zeros((len(constrained), 3))
+    Ctc = Ct[constrained]
+
+    # the residual forces of the unconstrained vertices are gathered in a preallocated buffer
+    # for the convergence criteria
+
+    ru = numpy.empty((len(unconstrained), 3))
+
+    # --------------------------------------------------------------------------
+    # initial values
+    # --------------------------------------------------------------------------
+    # the lengths, forces and residual forces are updated in place
+    # such that the force densities of the context are computed in the current state
+    # --------------------------------------------------------------------------
 
-    if all(linit == 0):
-        linit = indata.l0
+    q = context.q
+    l = context.l  # noqa: E741
+    f = context.f
+    v = context.v
+    r = context.r
 
     # --------------------------------------------------------------------------
     # helpers
     # --------------------------------------------------------------------------
 
-    def rk(x0, v0, steps=2):
-        def acceleration(t, v):
-            dx = v * t
-            x[free] = x0[free] + dx[free]
-            r[free] = p[free] - D.dot(x)
-            return cb * r / mass
-
-        if steps == 1:
-            return acceleration(dt, v0)
-
-        if steps == 2:
-            B = [0.0, 1.0]
-            K0 = dt * acceleration(K[0][0] * dt, v0)
-            K1 = dt * acceleration(K[1][0] * dt, v0 + K[1][1] * K0)
-            dv = B[0] * K0 + B[1] * K1
-            return dv
-
-        if steps == 4:
-            B = [1.0 / 6.0, 1.0 / 3.0, 1.0 / 3.0, 1.0 / 6.0]
-            K0 = dt * acceleration(K[0][0] * dt, v0)
-            K1 = dt * acceleration(K[1][0] * dt, v0 + K[1][1] * K0)
-            K2 = dt * acceleration(K[2][0] * dt, v0 + K[2][1] * K0 + K[2][2] * K1)
-            K3 = dt * acceleration(K[3][0] * dt, v0 + K[3][1] * K0 + K[3][2] * K1 + K[3][3] * K2)
-            dv = B[0] * K0 + B[1] * K1 + B[2] * K2 + B[3] * K3
-            return dv
-
-        raise NotImplementedError
+    # the vertices of a multi-vertex constraint are updated at once
+    # a constraint shared by several vertices is reset before every vertex
+    # such that the projection of the previous vertex is not reused
+
+    def update_constraints():
+        i = 0
+        for constraint, vertices in groups:
+            if isinstance(constraint, MultiConstraint):
+                constraint.locations = x[vertices]
+                constraint.residuals = r[vertices]
+                if tol3 is not None:
+                    tangents[i : i + len(vertices)] = constraint.tangents
+                constraint.update(damping=damping)
+                x[vertices] = constraint.locations
+                r[vertices] = constraint.residuals
+                i += len(vertices)
+                continue
+            shared = len(vertices) > 1
+            for vertex in vertices:
+                if shared:
+                    constraint.reset()
+                constraint.location = x[vertex]
+                constraint.residual = r[vertex]
+                if tol3 is not None:
+                    tangents[i] = constraint.tangent
+                constraint.update(damping=damping)
+                x[vertex] = constraint.location
+                r[vertex] = constraint.residual
+                i += 1
+
+    def converged():
+        if crit1 >= tol1:
+            return False
+        if tol3 is None:
+            return True
+        return criteria.constraints(tangents) < tol3
+
+    def acceleration(t, v):
+        x[free] = x0 + v * t
+        if sector is not None:
+            sector.update(x)
+        r[free] = p[free] - dot(D, x)
+        return cb * r[free] / mass
 
     # --------------------------------------------------------------------------
     # start iterating
     # --------------------------------------------------------------------------
 
     for k in range(kmax):
-        print(k)
-
-        q_fpre = fpre / l
-        q_lpre = f / lpre
-        q_EA = EA * (l - linit) / (linit * l)
-        q_lpre[isinf(q_lpre)] = 0
-        q_lpre[isnan(q_lpre)] = 0
-        q_EA[isinf(q_EA)] = 0
-        q_EA[isnan(q_EA)] = 0
-
-        q = qpre + q_fpre + q_lpre + q_EA
-        Q = diags([q[:, 0]], [0])
-        D = Cit.dot(Q).dot(C)
-        mass = 0.5 * dt**2 * Ct2.dot(qpre + q_fpre + q_lpre + EA / linit)
+        q, stiffness = context.force_densities()
+        D = context.plan.assemble(q)
+        mass = 0.5 * dt**2 * dot(Cit2, stiffness)
 
         # RK
 
-        x0 = x.copy()
-        v0 = ca * v.copy()
-        dv = rk(x0, v0, steps=rk_steps)
-        v[free] = v0[free] + dv[free]
-        dx = v * dt
-        x[free] = x0[free] + dx[free]
-
-        # update
-
-        u = C.dot(x)
-        l = normrow(u)  # noqa: E741
-        f = q * l
-        r = p - Ct.dot(Q).dot(u)
+        x0 = x[free]
+        xc = x[constrained]
+        v0 = ca * v[free]
+        dv = rk(acceleration, v0, dt, steps=rk_steps)
+        v[free] = v0 + dv
+        x[free] = x0 + v[free] * dt
+        if sector is not None:
+            sector.update(x)
 
         # update constraints
+        # with the residual forces at the unconstrained locations
+        # the velocities of the constrained vertices follow their constrained displacements
+
+        r[constrained] = p[constrained] - dot(Ctc, q * dot(C, x))
+        update_constraints()
+        v[constrained] = (x[constrained] - xc) / dt
+        for contact in contacts:
+            contact.resolve(x, v, free)
+        if sector is not None:
+            sector.update(x)
+        dx = x[free] - x0
 
-        for vertex, constraint in enumerate(constraints):
-            if not constraint:
-                continue
-            constraint.location = x[vertex]
-            constraint.residual = r[vertex]
-            constraint.update(damping=damping)
-            x[vertex] = constraint.location
-            r[vertex] = constraint.residual
+        # update
+
+        u = dot(C, x)
+        l[:] = normrow(u)
+        f[:] = q * l
+        if clearance is not None:
+            p[:] = context.p + clearance.forces(x)
+        r[:] = p - dot(Ct, q * u)
+        for contact in contacts:
+            contact.react(r)
 
         # crits
 
-        crit1 = norm(r[free])
-        crit2 = norm(dx[free])
+        if not (criteria.due(k) or k == kmax - 1):
+            continue
+
+        crit1 = criteria.forces(numpy.take(r, unconstrained, axis=0, out=ru))
+        crit2 = criteria.displacements(dx)
 
         # callback
 
@@ -254,13 +348,97 @@ def dr_constrained_numpy(
 
         # convergence
 
-        if crit1 < tol1:
+        if converged():
             break
         if crit2 < tol2:
             break
+        if newton_tol and crit1 < newton_tol:
+            break
+
+    # --------------------------------------------------------------------------
+    # newton polishing
+    # --------------------------------------------------------------------------
+    # the constrained vertices are held in place during every newton step
+    # and updated afterwards
+    # --------------------------------------------------------------------------
+
+    if newton_tol and tol1 <= crit1 < newton_tol:
+        u = C.dot(x)
+        l[:] = normrow(u)
+        q, stiffness = context.force_densities()
+        for k in range(k + 1, k + 1 + newton_kmax):
+            if clearance is not None:
+                p[:] = context.p + clearance.forces(x)
+            r[:] = p - Ct.dot(q * u)
+            for contact in contacts:
+                contact.react(r)
+            x0 = x[free]
+            try:
+                dx = context.tangent.solve(u, l, q, stiffness - fpre / l, r[free])
+            except RuntimeError:
+                break
+            # backtracking line search
+            # with the force densities of the trial geometry
+            crit0 = crit1
+            for _ in range(10):
+                x[free] = x0 + dx
+                u = C.dot(x)
+                l[:] = normrow(u)
+                q, stiffness = context.force_densities()
+                r[:] = p - Ct.dot(q * u)
+                for contact in contacts:
+                    contact.react(r)
+                crit1 = criteria.forces(numpy.take(r, unconstrained, axis=0, out=ru))
+                if crit1 < crit0:
+                    break
+                dx *= 0.5
+            else:
+                x[free] = x0
+                u = C.dot(x)
+                l[:] = normrow(u)
+                q, stiffness = context.force_densities()
+                crit1 = crit0
+                break
+
+            update_constraints()
+            for contact in contacts:
+                contact.resolve(x, None, free)
+
+            u = C.dot(x)
+            l[:] = normrow(u)
+            q, stiffness = context.force_densities()
+            f[:] = q * l
+            crit2 = criteria.displacements(dx)
+
+            if callback:
+                callback(k, x, crit1, crit2, callback_args)
+
+            if converged():
+                break
+            if crit2 < tol2:
+                break
 
     # --------------------------------------------------------------------------
     # result
     # --------------------------------------------------------------------------
 
-    return ResultData(xyz=x, q=q, forces=f, lengths=l, residuals=r)
+    # the force densities and forces are recomputed in the final geometry
+
+    q, _ = context.force_densities()
+    f[:] = q * l
+    context.q = q
+
+    if clearance is not None:
+        clearance.update(x)
+
+    result = ResultData(
+        xyz=x,
+        q=q,
+        forces=f,
+        lengths=l,
+        residuals=r,
+        contacts=[contact.vertices for contact in contacts] if contacts else None,
+        clashes=clearance.pairs if clearance is not None else None,
+    )
+
+    return context.indata.restore(result)
@@ -0,0 +1,436 @@
+from typing import Callable
+from typing import Literal
+from typing import Union
+
+import numpy
+import scipy.sparse
+from compas.linalg import normrow
+from numpy.linalg import norm
+
+import compas_dr.numdata
+from compas_dr.numdata import InputData
+from compas_dr.solvers.backend import Backend
+from compas_dr.solvers.context import SolverContext
+from compas_dr.solvers.dr_numpy import dr_numpy
+
+
+def aggregate(adjacency, fixed):
+    """Group the vertices of a network in aggregates of neighbouring vertices.
+
+    Every free vertex of which none of the free neighbours is aggregated yet
+    forms a new aggregate together with those neighbours.
+    The remaining free vertices join the aggregate of one of their neighbours.
+    Fixed vertices always form an aggregate on their own.
+
+    Parameters
+    ----------
+    adjacency : :class:`scipy.sparse.csr_matrix`
+        The vertex adjacency matrix.
+    fixed : array
+        The indices of the fixed vertices.
+
+    Returns
+    -------
+    array
+        The index of the aggregate of every vertex.
+
+    """
+    n = adjacency.shape[0]
+    indptr = adjacency.indptr
+    indices = adjacency.indices
+
+    aggregates = numpy.full(n, -1, dtype=int)
+    is_fixed = numpy.zeros(n, dtype=bool)
+    is_fixed[fixed] = True
+    aggregates[fixed] = numpy.arange(len(fixed))
+    count = len(fixed)
+
+    for vertex in range(n):
+        if aggregates[vertex] >= 0:
+            continue
+        neighbors = indices[indptr[vertex] : indptr[vertex + 1]]
+        neighbors = neighbors[~is_fixed[neighbors]]
+        if numpy.any(aggregates[neighbors] >= 0):
+            continue
+        aggregates[vertex] = count
+        aggregates[neighbors] = count
+        count += 1
+
+    for vertex in numpy.flatnonzero(aggregates < 0):
+        neighbors = indices[indptr[vertex] : indptr[vertex + 1]]
+        neighbors = neighbors[~is_fixed[neighbors] & (aggregates[neighbors] >= 0)]
+        if len(neighbors):
+            aggregates[vertex] = aggregates[neighbors[0]]
+        else:
+            aggregates[vertex] = count
+            count += 1
+
+    return aggregates
+
+
+def coarsen(context, aggregates):
+    """Construct the input data of the coarse network corresponding to a set of aggregates.
+
+    The coarse vertices are located at the centroids of the aggregates and carry the sum of their loads.
+    Every pair of neighbouring aggregates is connected by a single coarse edge,
+    which represents the fine edges in between the two aggregates.
+    The attributes of the coarse edge are chosen such that it carries the total force of those fine edges
+    in the current geometry:
+    the prescribed forces and the elastic stiffness ``EA`` are summed,
+    the prescribed force densities are summed after scaling with the ratio of the fine and coarse lengths,
+    and the initial length is chosen such that the coarse edge has the average strain of the fine edges.
+    Prescribed lengths are not transferred to the coarse network.
+
+    Parameters
+    ----------
+    context : :class:`compas_dr.solvers.SolverContext`
+        The context of the fine network.
+    aggregates : array
+        The index of the aggregate of every vertex of the fine network.
+
+    Returns
+    -------
+    :class:`compas_dr.numdata.InputData`
+
+    """
+    n = aggregates.max() + 1
+    P = scipy.sparse.csr_matrix((numpy.ones(len(aggregates)), (numpy.arange(len(aggregates)), aggregates)), shape=(len(aggregates), n))
+    size = numpy.asarray(P.sum(axis=0)).reshape((-1, 1))
+    xyz = P.transpose().dot(context.x) / size
+    loads = P.transpose().dot(context.p)
+
+    # the fine edges in between different aggregates
+    # grouped per pair of aggregates
+
+    C = context.C
+    Cc = C.dot(P).tocsr()
+    Cc.eliminate_zeros()
+    crossing = numpy.flatnonzero(numpy.diff(Cc.indptr) == 2)
+    first = Cc.indices[Cc.indptr[crossing]]
+    second = Cc.indices[Cc.indptr[crossing] + 1]
+    flip = Cc.data[Cc.indptr[crossing]] > 0
+    u = numpy.where(flip, second, first)
+    v = numpy.where(flip, first, second)
+
+    pairs, edges = numpy.unique(numpy.column_stack([numpy.minimum(u, v), numpy.maximum(u, v)]), axis=0, return_inverse=True)
+    edges = edges.ravel()
+    m = len(pairs)
+
+    def total(values):
+        return numpy.bincount(edges, weights=values[crossing, 0], minlength=m).reshape((-1, 1))
+
+    l = normrow(C.dot(context.x))  # noqa: E741
+    lc = normrow(xyz[pairs[:, 1]] - xyz[pairs[:, 0]])
+    lc[lc == 0] = 1.0
+
+    EA = total(context.EA)
+    ratio = numpy.divide(context.linit, l, out=numpy.ones_like(l), where=l > 0)
+    ratio = numpy.divide(total(context.EA * ratio), EA, out=numpy.ones_like(EA), where=EA > 0)
+
+    # the coarse edges have unit radius
+    # and a modulus of elasticity that results in the total stiffness of the fine edges
+
+    radius = numpy.ones((m, 1))
+
+    return InputData(
+        vertices=xyz,
+        edges=pairs.tolist(),
+        fixed=list(range(len(context.fixed))),
+        loads=loads,
+        qpre=total(context.qpre * l) / lc,
+        fpre=total(context.fpre),
+        linit=ratio * lc,
+        E=EA / SolverContext.area(radius),
+        radius=radius,
+    )
+
+
+def prolongate(context, aggregates, displacements, smoothing=2):
+    """Compute the displacements of the vertices of the fine network from the displacements of the aggregates.
+
+    The displacements are smoothed by averaging over the neighbours of every vertex.
+    Vertices without edges keep the displacement of their aggregate.
+
+    Parameters
+    ----------
+    context : :class:`compas_dr.solvers.SolverContext`
+        The context of the fine network.
+    aggregates : array
+        The index of the aggregate of every vertex of the fine network.
+    displacements : array
+        The displacements of the aggregates.
+    smoothing : int, optional
+        The number of smoothing passes.
+
+    Returns
+    -------
+    array
+
+    """
+    E = abs(context.C)
+    N = E.transpose().dot(E).tocsr()
+    degree = numpy.asarray(N.sum(axis=1)).reshape((-1, 1))
+
+    d = displacements[aggregates]
+    d[context.fixed] = 0
+    for _ in range(smoothing):
+        d = numpy.divide(N.dot(d), degree, out=d.copy(), where=degree > 0)
+        d[context.fixed] = 0
+    return d
+
+
+class Level:
+    """Class representing a level of the multilevel hierarchy.
+
+    Parameters
+    ----------
+    context : :class:`compas_dr.solvers.SolverContext`
+        The context of the fine network.
+
+    Attributes
+    ----------
+    context : :class:`compas_dr.solvers.SolverContext`
+        The context of the fine network.
+    aggregates : array
+        The index of the aggregate of every vertex of the fine network.
+    P : :class:`scipy.sparse.csr_matrix`
+        The aggregation matrix.
+    size : array
+        The number of vertices of every aggregate.
+    coarse : :class:`compas_dr.solvers.SolverContext`
+        The context of the coarse network.
+    loads : array
+        The original loads of the coarse network.
+
+    """
+
+    def __init__(self, context):
+        E = abs(context.C)
+        self.context = context
+        self.aggregates = aggregate(E.transpose().dot(E).tocsr(), context.fixed)
+        n = len(self.aggregates)
+        self.P = scipy.sparse.csr_matrix((numpy.ones(n), (numpy.arange(n), self.aggregates)))
+        self.size = numpy.asarray(self.P.sum(axis=0)).reshape((-1, 1))
+        self.coarse = SolverContext(coarsen(context, self.aggregates))
+        self.loads = self.coarse.p.copy()
+
+    def restrict(self):
+        """Restrict the current state of the fine network to the coarse network.
+
+        The coarse vertices are moved to the centroids of the aggregates,
+        and the loads on the coarse network are set such that the residual forces of the coarse network
+        are the sums of the residual forces of the aggregates.
+
+        Returns
+        -------
+        array
+            The restricted coordinates.
+
+        """
+        r = self.context.residuals()
+        coarse = self.coarse
+        xh = self.P.transpose().dot(self.context.x) / self.size
+        coarse.x[:] = xh
+        coarse.v[:] = 0
+        coarse.p[:] = self.loads
+        coarse.p[:] += self.P.transpose().dot(r) - coarse.residuals()
+        return xh
+
+
+def dr_multilevel_numpy(
+    indata: Union[compas_dr.numdata.InputData, SolverContext],
+    levels: int = None,
+    min_vertices: int = 100,
+    cycles: int = 100,
+    relaxations: int = 10,
+    kmax: int = 10000,
+    kmax_coarse: int = 1000,
+    dt: float = 1.0,
+    tol1: float = 1e-3,
+    tol2: float = 1e-6,
+    c: float = 0.1,
+    rk_steps: Literal[1, 2, 4] = 2,
+    backend: Backend = None,
+    callback: Callable = None,
+    callback_args: list = None,
+) -> compas_dr.numdata.ResultData:
+    """Multilevel dynamic relaxation of a network of axial-force members.
+
+    The network is coarsened recursively by grouping neighbouring vertices in aggregates (see :func:`aggregate`),
+    until the coarse network has fewer than ``min_vertices`` vertices, or the maximum number of levels is reached.
+
+    First, the coarsest network is relaxed with :func:`compas_dr.solvers.dr_numpy`,
+    and its displacements are prolongated to the next finer network as initial geometry for the next solve,
+    up to the original network.
+    Then, the remaining error is reduced with multigrid cycles of the full approximation scheme.
+    In every cycle, a few DR iterations are applied to the original network,
+    the residual forces are restricted to the coarse network,
+    the resulting correction of the coarse geometry is prolongated to the original network,
+    and a few more DR iterations are applied.
+    The coarse corrections are computed in the same way, recursively.
+    A correction is scaled down if it doesn't reduce the residual forces,
+    and the cycles are stopped if no scaled correction does,
+    for example if compressed edges make the equilibrium of the coarse network unstable.
+    Finally, the original network is relaxed with :func:`compas_dr.solvers.dr_numpy` up to the requested tolerances.
+
+    Since the coarse networks reduce the smooth part of the error, that DR only reduces slowly,
+    the number of iterations is much smaller than for a single solve of the original network.
+
+    Parameters
+    ----------
+    indata : :class:`compas_dr.numdata.InputData` | :class:`compas_dr.solvers.SolverContext`
+        An input data object, or a solver context.
+    levels : int, optional
+        The maximum number of levels, including the original network.
+        Defaults to as many levels as needed to reach ``min_vertices``.
+    min_vertices : int, optional
+        The number of vertices of the coarsest network.
+    cycles : int, optional
+        The maximum number of multigrid cycles.
+    relaxations : int, optional
+        The number of DR iterations before and after every coarse correction.
+    kmax : int, optional
+        The maximum number of iterations of the final solve of the original network.
+    kmax_coarse : int, optional
+        The maximum number of iterations of the solves of the coarse networks.
+    dt : float, optional
+        The time step for the integration scheme.
+    tol1 : float, optional
+        Tolerance for the norm of the residual forces.
+    tol2 : float, optional
+        Tolerance for the norm of the displacements.
+    c : float, optional
+        Value used to calculate coefficients "a" and "b" of the RK integration.
+    rk_steps : {1, 2, 4}, optional
+        The number of Runge Kutta integration steps.
+    backend : :class:`compas_dr.solvers.Backend`, optional
+        The backend for the sparse matrix products of the iterations on all levels,
+        see :func:`compas_dr.solvers.dr_numpy`.
+    callback : callable, optional
+        User-defined function that is called after every cycle,
+        with the number of the cycle, the vertex coordinates, the norm of the residual forces,
+        the norm of the coarse correction, and ``callback_args``.
+    callback_args : tuple, optional
+        Additional arguments passed to the callback.
+
+    Returns
+    -------
+    :class:`compas_dr.numdata.ResultData`
+        A result data object.
+
+    Raises
+    ------
+    ValueError
+        If a callback function is provided that is not callable.
+    ValueError
+        If the input data is the data of one sector of a symmetric network.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> from compas_dr.numdata import InputData
+    >>> from compas_dr.solvers import dr_multilevel_numpy
+    >>> mesh = Mesh.from_meshgrid(dx=10, nx=50)
+    >>> fixed = list(mesh.vertices_where(vertex_degree=2))
+    >>> loads = [[0, 0, -0.01]] * mesh.number_of_vertices()
+    >>> qpre = [1.0] * mesh.number_of_edges()
+    >>> result = dr_multilevel_numpy(InputData.from_mesh(mesh, fixed, loads, qpre))
+
+    """
+    if callback:
+        if not callable(callback):
+            raise ValueError("The provided callback is not callable.")
+
+    context = indata if isinstance(indata, SolverContext) else SolverContext(indata)
+
+    if context.indata.sector is not None:
+        raise ValueError("The sector of a symmetric network is not supported by this solver.")
+
+    options = dict(dt=dt, c=c, rk_steps=rk_steps, backend=backend)
+
+    # --------------------------------------------------------------------------
+    # hierarchy
+    # --------------------------------------------------------------------------
+
+    hierarchy = []
+    fine = context
+    while len(fine.x) > min_vertices and (levels is None or len(hierarchy) + 1 < levels):
+        level = Level(fine)
+        if len(level.coarse.x) > 0.8 * len(fine.x):
+            break
+        hierarchy.append(level)
+        fine = level.coarse
+
+    # --------------------------------------------------------------------------
+    # coarse to fine
+    # --------------------------------------------------------------------------
+
+    for level in hierarchy[::-1]:
+        x0 = level.coarse.x.copy()
+        dr_numpy(level.coarse, kmax=kmax_coarse, tol1=tol1, tol2=tol2, **options)
+        if numpy.all(numpy.isfinite(level.coarse.x)):
+            level.context.x += prolongate(level.context, level.aggregates, level.coarse.x - x0)
+            level.context.v[:] = 0
+        level.coarse.x[:] = x0
+
+    # --------------------------------------------------------------------------
+    # cycles
+    # --------------------------------------------------------------------------
+
+    def relax(fine):
+        dr_numpy(fine, kmax=relaxations, tol1=0, tol2=0, **options)
+
+    def cycle(index):
+        level = hierarchy[index]
+        fine = level.context
+        coarse = level.coarse
+
+        relax(fine)
+
+        xh = level.restrict()
+        if index + 1 < len(hierarchy):
+            cycle(index + 1)
+        else:
+            r = coarse.residuals()
+            dr_numpy(coarse, kmax=kmax_coarse, tol1=0.01 * norm(r[coarse.free]), tol2=0, **options)
+        if not numpy.all(numpy.isfinite(coarse.x)):
+            return 0.0
+
+        # the correction is accepted if the residual forces are reduced after smoothing
+        # otherwise it is scaled down
+
+        x0 = fine.x.copy()
+        v0 = fine.v.copy()
+        d = prolongate(fine, level.aggregates, coarse.x - xh)
+        crit0 = norm(fine.residuals()[fine.free])
+        for alpha in (1.0, 0.5, 0.25):
+            fine.x[:] = x0 + alpha * d
+            fine.v[:] = 0
+            relax(fine)
+            crit1 = norm(fine.residuals()[fine.free])
+            if crit1 < crit0:
+                return alpha * norm(d)
+
+        fine.x[:] = x0
+        fine.v[:] = v0
+        fine.residuals()
+        return 0.0
+
+    if hierarchy:
+        crit1 = norm(context.residuals()[context.free])
+        for k in range(cycles):
+            crit0 = crit1
+            dx = cycle(0)
+            crit1 = norm(context.residuals()[context.free])
+
+            if callback:
+                callback(k, context.x, crit1, dx, callback_args)
+
+            if crit1 < tol1:
+                break
+            if not dx:
+                break
+            if crit1 > 0.8 * crit0:
+                break
+
+    return dr_numpy(context, kmax=kmax, tol1=tol1, tol2=tol2, **options)
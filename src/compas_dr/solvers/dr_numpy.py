@@ -1,43 +1,67 @@
 from typing import Callable
 from typing import Literal
+from typing import Union
 
 import numpy
 import scipy.sparse  # noqa: F401
 from compas.linalg import normrow
-from numpy import isinf
-from numpy import isnan
-from scipy.linalg import norm
 from scipy.sparse import diags
 
 import compas_dr.numdata
 from compas_dr.numdata import ResultData
+from compas_dr.solvers.activeset import ActiveSet
+from compas_dr.solvers.backend import Backend
+from compas_dr.solvers.clearance import Clearance
+from compas_dr.solvers.context import SolverContext
+from compas_dr.solvers.convergence import ConvergenceCriteria
+from compas_dr.solvers.fd_numpy import fd_numpy
+from compas_dr.solvers.integration import Coeff
+from compas_dr.solvers.integration import rk
+from compas_dr.solvers.watchdog import Watchdog
 
 old_settings = numpy.seterr(divide="ignore")
 
 
-K = [
-    [0.0],
-    [0.5, 0.5],
-    [0.5, 0.0, 0.5],
-    [1.0, 0.0, 0.0, 1.0],
-]
+class Fire:
+    def __init__(self, h, alpha=0.02, ndelay=5, finc=1.1, fdec=0.5, falpha=0.99):
+        self.h = h
+        self.alpha0 = alpha
+        self.alpha = alpha
+        self.ndelay = ndelay
+        self.finc = finc
+        self.fdec = fdec
+        self.falpha = falpha
+        self.npos = 0
 
 
-class Coeff:
-    def __init__(self, c):
-        self.c = c
-        self.a = (1 - c * 0.5) / (1 + c * 0.5)
-        self.b = 0.5 * (1 + self.a)
+class Nesterov:
+    def __init__(self, x):
+        self.x = x
+        self.t = 1.0
 
 
 def dr_numpy(
-    indata: compas_dr.numdata.InputData,
+    indata: Union[compas_dr.numdata.InputData, SolverContext],
     kmax: int = 10000,
     dt: float = 1.0,
     tol1: float = 1e-3,
     tol2: float = 1e-6,
     c: float = 0.1,
     rk_steps: Literal[1, 2, 4] = 2,
+    method: Literal["dr", "fdm"] = "dr",
+    integrator: Literal["rk", "implicit", "fire", "nesterov"] = "rk",
+    newton_tol: float = None,
+    newton_kmax: int = 10,
+    active_set: bool = False,
+    active_k: int = 10,
+    active_tol1: float = None,
+    active_tol2: float = None,
+    active_wake: float = 10.0,
+    check_interval: int = 1,
+    norm_type: Literal["l2", "max", "relative"] = "l2",
+    backend: Backend = None,
+    clearance: Clearance = None,
+    watchdog: Watchdog = None,
     callback: Callable = None,
     callback_args: list = None,
 ) -> compas_dr.numdata.ResultData:
@@ -46,8 +70,12 @@ def dr_numpy(
 
     Parameters
     ----------
-    indata : :class:`compas_dr.numdata.InputData`
-        An input data object.
+    indata : :class:`compas_dr.numdata.InputData` | :class:`compas_dr.solvers.SolverContext`
+        An input data object, or a solver context.
+        If a solver context is provided, the solver continues from the state stored in the context,
+        and the final state is written back to it.
+        If the input data is the data of one sector of a symmetric network (see :meth:`compas_dr.numdata.InputData.reduced`),
+        only the sector is relaxed, and the result is the result of the complete network.
     kmax : int, optional
         The maximum number of iterations.
     dt : float, optional
@@ -62,14 +90,89 @@ def dr_numpy(
         "b" used as a multiplication factor for the acceleration used during RK integration.
     rk_steps : {1, 2, 4}, optional
         The number of Runge Kutta integration steps.
+    method : {"dr", "fdm"}, optional
+        If ``"fdm"``, the linear force density equilibrium is computed first, with :func:`compas_dr.solvers.fd_numpy`.
+        If the problem has no prescribed forces, prescribed lengths, elastic properties or self-contact, this is the solution
+        and it is returned directly. Otherwise, it is used as the initial geometry for the DR iterations,
+        with the force densities of the current state.
+        If the stiffness matrix of the linear equilibrium is singular, the DR iterations start from the current geometry.
+    integrator : {"rk", "implicit", "fire", "nesterov"}, optional
+        The time integration scheme.
+        With ``"rk"``, the explicit Runge Kutta scheme with ``rk_steps`` steps is used.
+        With ``"implicit"``, every iteration is a backward Euler step,
+        with the residual forces linearised using the axial stiffness of the edges.
+        The linear system of every step is solved with a cached sparse factorization,
+        which is only recomputed if the stiffness of the edges has changed.
+        The masses are computed for a unit time step, such that time steps ``dt`` much larger than 1 can be used.
+        For ``dt`` going to infinity, the steps become quasi-Newton steps on the equilibrium equations.
+        With ``"fire"``, the Fast Inertial Relaxation Engine is used [2]_,
+        with an adaptive time step of at most ``dt``, instead of the viscous damping of the RK scheme.
+        With ``"nesterov"``, Nesterov's accelerated gradient method is used,
+        with the residual forces scaled by the fictitious masses and adaptive restart of the momentum [3]_.
+    newton_tol : float, optional
+        If provided, the DR iterations are stopped as soon as the norm of the residual forces drops below this value,
+        and the equilibrium is polished with Newton-Raphson iterations using the tangent stiffness matrix of the network.
+        The Newton-Raphson iterations stop if the residual forces increase.
+        Newton-Raphson polishing is not available for the sector of a symmetric network.
+    newton_kmax : int, optional
+        The maximum number of Newton-Raphson iterations.
+    active_set : bool, optional
+        If True, free vertices that have been in equilibrium for a number of consecutive iterations are frozen,
+        and the updates are restricted to the moving vertices and their direct neighbours,
+        see :class:`compas_dr.solvers.activeset.ActiveSet`.
+        Frozen vertices are woken if their residual forces or displacements
+        exceed the tolerances multiplied by ``active_wake``,
+        or if they prevent the convergence criteria from being satisfied.
+        Whenever the criteria are evaluated, the residual forces of the frozen neighbours of the active set are recomputed,
+        such that the criteria are always evaluated with the residual forces of all free vertices.
+        Active set mode pays off if a local change of a relaxed network only affects part of it,
+        for example after changing the force densities of a few edges of a network with many supports.
+        If the whole network responds to the change, the bookkeeping makes the iterations slower than without it.
+        Active set mode is only available for the ``"rk"`` integrator.
+    active_k : int, optional
+        The number of consecutive iterations a vertex has to be below the tolerances before it is frozen.
+        The active set shrinks at most once every ``active_k`` iterations.
+    active_tol1 : float, optional
+        Tolerance for the length of the residual force vector of a single vertex.
+        Defaults to ``tol1``, multiplied by the norm of the loads for ``"relative"`` criteria.
+        The tolerance is reduced during the iterations if the frozen vertices prevent convergence.
+    active_tol2 : float, optional
+        Tolerance for the length of the displacement vector of a single vertex.
+        If None, the displacements are multiplied by the stiffness of the vertices, and compared with ``active_tol1``.
+    active_wake : float, optional
+        The factor of the tolerances above which a frozen vertex is woken.
+    check_interval : int, optional
+        The number of iterations between two evaluations of the convergence criteria.
+        On large problems with cheap iterations, evaluating the criteria less often saves a significant amount of time,
+        at the cost of a few extra iterations.
+    norm_type : {"l2", "max", "relative"}, optional
+        The norm used for the convergence criteria.
+        With ``"l2"``, the Euclidean norm of the residual forces and displacements of all free vertices is used.
+        With ``"max"``, the largest absolute component is used.
+        With ``"relative"``, the Euclidean norm of the residual forces is divided by the Euclidean norm of the loads.
+    backend : :class:`compas_dr.solvers.Backend`, optional
+        The backend for the sparse matrix products of the iterations.
+        Use a :class:`compas_dr.solvers.ThreadedBackend` to distribute the products over multiple threads.
+        Defaults to single-threaded scipy products.
+    clearance : :class:`compas_dr.solvers.Clearance`, optional
+        Self-contact between the edges of the network.
+        The penalty forces of the pairs of edges closer than the clearance distance
+        are added to the loads once per iteration.
+        The pairs of edges in contact at the end of the solve are stored in the ``clashes`` of the result.
+        Self-contact is not available in active set mode.
+    watchdog : :class:`compas_dr.solvers.Watchdog`, optional
+        Detection of divergence of the iterations.
+        If the coordinates or residual forces are no longer finite, or the residual forces grow too much,
+        the iterations continue from the last valid state with larger fictitious masses and more damping.
+        The events are stored in the ``events`` of the result.
     callback : callable, optional
-        User-defined function that is called at every iteration.
-        If provided, the callback will be called at every iteration with the following arguments
+        User-defined function that is called whenever the convergence criteria are evaluated.
+        If provided, the callback will be called with the following arguments
 
         * `k`: the number of the current iteration
         * `x`: the current vertex coordinates
-        * `crit1`: the norm of the residual forces
-        * `crit2`: the norm of the displacement vectors
+        * `crit1`: the convergence criterion for the residual forces
+        * `crit2`: the convergence criterion for the displacement vectors
         * `callback_args`: optional additional arguments
 
     callback_args : tuple, optional
@@ -84,6 +187,14 @@ def dr_numpy(
     ------
     ValueError
         If a callback function is provided that is not callable.
+    ValueError
+        If active set mode is combined with an integrator other than ``"rk"``.
+    ValueError
+        If active set mode is combined with self-contact.
+    ValueError
+        If active set mode is used for the sector of a symmetric network.
+    ValueError
+        If the norm type is not supported, or the check interval is smaller than 1.
 
     Notes
     -----
@@ -94,6 +205,12 @@ def dr_numpy(
     .. [1] De Laet L., Veenendaal D., Van Mele T., Mollaert M. and Block P.,
            *Bending incorporated: designing tension structures by integrating bending-active elements*,
            Proceedings of Tensinet Symposium 2013,Istanbul, Turkey, 2013.
+    .. [2] Bitzek E., Koskinen P., Gähler F., Moseler M. and Gumbsch P.,
+           *Structural relaxation made simple*,
+           Physical Review Letters 97, 170201, 2006.
+    .. [3] O'Donoghue B. and Candès E.,
+           *Adaptive restart for accelerated gradient schemes*,
+           Foundations of Computational Mathematics 15, 715-732, 2015.
 
     Examples
     --------
@@ -108,6 +225,12 @@ def dr_numpy(
         if not callable(callback):
             raise ValueError("The provided callback is not callable.")
 
+    if active_set and integrator != "rk":
+        raise ValueError("Active set mode is only available for the RK integrator.")
+
+    if active_set and clearance is not None:
+        raise ValueError("Active set mode is not available with self-contact.")
+
     # --------------------------------------------------------------------------
     # configuration
     # --------------------------------------------------------------------------
@@ -120,122 +243,401 @@ def dr_numpy(
     # numdata
     # --------------------------------------------------------------------------
 
-    x = indata.vertices  # m
-    p = indata.loads  # kN
-    free = indata.free
-    qpre = indata.qpre
-    lpre = indata.lpre  # kN
-    fpre = indata.fpre  # m
-    linit = indata.linit  # m
-    E = indata.E  # kN/mm2 => GPa
-    radius = indata.radius  # mm
+    context = indata if isinstance(indata, SolverContext) else SolverContext(indata)
+    sector = context.indata.sector
+
+    # the tangent stiffness matrix does not couple the ghost vertices of a sector to their representatives
 
-    C = indata.C  # type: scipy.sparse.csr_matrix
-    Ct = C.transpose()
-    Ci = C[:, free]
-    Cit = Ci.transpose()
-    Ct2 = Ct.copy()
-    Ct2.data **= 2
+    if sector is not None:
+        newton_tol = None
 
-    A = 3.14159 * radius**2  # mm2
-    EA = E * A  # kN
+    if active_set and sector is not None:
+        raise ValueError("Active set mode is not available for the sector of a symmetric network.")
+
+    x = context.x  # m
+    p = context.p  # kN
+    free = context.free
+    lpre = context.lpre  # m
+    fpre = context.fpre  # kN
+    EA = context.EA  # kN
+
+    C = context.C  # type: scipy.sparse.csr_matrix
+    Ct = context.Ct
+
+    backend = backend or Backend()
+    dot = backend.dot
+
+    criteria = ConvergenceCriteria(norm_type=norm_type, interval=check_interval, loads=p[free])
+
+    # --------------------------------------------------------------------------
+    # linear initial geometry
+    # --------------------------------------------------------------------------
+    # with prescribed forces, prescribed lengths or elastic properties,
+    # the force densities of the current state are used
+    # if the stiffness matrix is singular, the iterations start from the current geometry
+    # --------------------------------------------------------------------------
+
+    if method == "fdm":
+        linear = not (fpre.any() or lpre.any() or EA.any())
+        try:
+            result = fd_numpy(context, q=None if linear else context.force_densities()[0])
+        except RuntimeError:
+            result = None
+        if result is not None and linear and clearance is None:
+            return result
+
+    # the penalty forces of self-contact are added to a copy of the loads
+
+    if clearance is not None:
+        clearance.setup(context.edges)
+        p = p + clearance.forces(x)
 
     # --------------------------------------------------------------------------
     # initial values
     # --------------------------------------------------------------------------
-    # if none of the initial lengths are set,
-    # set the initial lengths to the current lengths
+
+    q = context.q
+    l = context.l  # noqa: E741
+    f = context.f
+    v = context.v
+    r = context.r
+
+    # --------------------------------------------------------------------------
+    # active set
+    # --------------------------------------------------------------------------
+    # by default, all free vertices and all edges are active
+    # in active set mode, the active vertices and edges are updated on the fly
     # --------------------------------------------------------------------------
 
-    q = indata.q0
-    l = indata.l0  # noqa: E741
-    f = q * l
-    v = indata.v0
-    r = indata.r0
+    active = free
+    edges = slice(None)
+    Ca = C
+    Cat2 = context.Cit2
+    plan = context.plan
+
+    if active_set:
+        if active_tol1 is None:
+            active_tol1 = tol1 * criteria.scale
+
+        # the tolerance for freezing vertices is never reduced below the residual force of a single vertex
+        # for which all free vertices together still satisfy the criteria
 
-    if all(linit == 0):
-        linit = indata.l0
+        strict = tol1 * criteria.scale / len(free) ** 0.5
+
+        aset = ActiveSet(C, free, context.plan, k=active_k, tol1=active_tol1, tol2=active_tol2, wake=active_wake, strict=strict)
+
+    # the residual forces of the rim are updated before the active set changes
+    # such that the residual forces of all free vertices remain up to date
+    # and the velocities of the vertices that are no longer active are discarded
+
+    def rim():
+        if len(aset.rim):
+            r[aset.rim] = p[aset.rim] - dot(aset.rim_plan.assemble(q), x)
+
+    def activate(k):
+        rim()
+        aset.activate(k)
+        v[free[~aset.active[free]]] = 0
+        return aset.vertices, aset.edges, aset.Ca, aset.Cat2, aset.plan
 
     # --------------------------------------------------------------------------
     # helpers
     # --------------------------------------------------------------------------
 
-    def rk(x0, v0, steps=2):
-        def acceleration(t, v):
-            dx = v * t
-            x[free] = x0[free] + dx[free]
-            r[free] = p[free] - D.dot(x)
-            return cb * r / mass
+    # the lengths and forces are updated in place
+    # such that the force densities of the context are computed in the current state
 
-        if steps == 1:
-            return acceleration(dt, v0)
+    def assemble(edges):
+        qe, stiffness = context.force_densities(edges)
+        q[edges] = qe
+        return qe, stiffness, plan.assemble(q)
 
-        if steps == 2:
-            B = [0.0, 1.0]
-            K0 = dt * acceleration(K[0][0] * dt, v0)
-            K1 = dt * acceleration(K[1][0] * dt, v0 + K[1][1] * K0)
-            dv = B[0] * K0 + B[1] * K1
-            return dv
+    # the first stage is evaluated at the start of the step
+    # for which the residual forces are already known
 
-        if steps == 4:
-            B = [1.0 / 6.0, 1.0 / 3.0, 1.0 / 3.0, 1.0 / 6.0]
-            K0 = dt * acceleration(K[0][0] * dt, v0)
-            K1 = dt * acceleration(K[1][0] * dt, v0 + K[1][1] * K0)
-            K2 = dt * acceleration(K[2][0] * dt, v0 + K[2][1] * K0 + K[2][2] * K1)
-            K3 = dt * acceleration(K[3][0] * dt, v0 + K[3][1] * K0 + K[3][2] * K1 + K[3][3] * K2)
-            dv = B[0] * K0 + B[1] * K1 + B[2] * K2 + B[3] * K3
-            return dv
+    def acceleration(t, v):
+        x[active] = x0 + v * t
+        if sector is not None:
+            sector.update(x)
+        r[active] = p[active] - dot(D, x)
+        return cb * r[active] / mass
+
+    # --------------------------------------------------------------------------
+    # integrator state
+    # --------------------------------------------------------------------------
 
-        raise NotImplementedError
+    fire = Fire(h=0.5 * dt)
+    nesterov = Nesterov(x=x[free])
 
     # --------------------------------------------------------------------------
     # start iterating
     # --------------------------------------------------------------------------
 
+    # --------------------------------------------------------------------------
+    # the force densities, the stiffness matrix and the residual forces
+    # are computed once per iteration, at the end of the step,
+    # and reused at the start of the next step
+    # --------------------------------------------------------------------------
+
+    # the residual forces of the free vertices are gathered in a preallocated buffer
+    # for the convergence criteria and the watchdog
+
+    rf = numpy.empty((len(free), 3))
+
+    def residuals():
+        return numpy.take(r, free, axis=0, out=rf)
+
+    qe, stiffness, D = assemble(edges)
+    r[active] = p[active] - dot(D, x)
+    crit1 = criteria.forces(residuals())
+    crit2 = numpy.inf
+
+    # the fictitious masses are scaled up by the watchdog after a rollback
+
+    scale = 1.0
+
+    if watchdog is not None:
+        watchdog.reset()
+        watchdog.save(-1, residuals(), x=x, q=q, l=l, f=f)
+
     for k in range(kmax):
-        q_fpre = fpre / l
-        q_lpre = f / lpre
-        q_EA = EA * (l - linit) / (linit * l)
-        q_lpre[isinf(q_lpre)] = 0
-        q_lpre[isnan(q_lpre)] = 0
-        q_EA[isinf(q_EA)] = 0
-        q_EA[isnan(q_EA)] = 0
-
-        q = qpre + q_fpre + q_lpre + q_EA
-        Q = diags([q[:, 0]], [0])
-        D = Cit.dot(Q).dot(C)
-        mass = 0.5 * dt**2 * Ct2.dot(qpre + q_fpre + q_lpre + EA / linit)
-
-        # RK
-        x0 = x.copy()
-        v0 = ca * v.copy()
-        dv = rk(x0, v0, steps=rk_steps)
-        v[free] = v0[free] + dv[free]
-        dx = v * dt
-        x[free] = x0[free] + dx[free]
+        x0 = x[active]
+        v0 = ca * v[active]
+
+        if integrator == "implicit":
+            # backward Euler
+            # with the residual linearised around the current geometry
+            # and masses for a unit time step
+            mass = 0.5 * scale * dot(Cat2, stiffness) / (cb * dt**2)
+            A = context.plan_free.assemble(stiffness) + diags([mass[:, 0]], [0])
+            # a singular system is left to the watchdog, if there is one
+            try:
+                context.factorization.factorize(A)
+                dx = context.factorization.solve(r[active] + mass * v0 * dt)
+            except RuntimeError:
+                if watchdog is None:
+                    raise
+                dx = numpy.full_like(x0, numpy.nan)
+            v[active] = dx / dt
+            x[active] = x0 + dx
+
+        elif integrator == "fire":
+            # FIRE
+            # semi-implicit Euler with adaptive time step
+            # and mixing of the velocities with the direction of the residual forces
+            mass = 0.5 * scale * dt**2 * dot(Cat2, stiffness)
+            a = r[active] / mass
+            v0 = v[active]
+            dx = 0
+            if numpy.sum(r[active] * v0) > 0:
+                fire.npos += 1
+                if fire.npos > fire.ndelay:
+                    fire.h = min(fire.h * fire.finc, dt)
+                    fire.alpha *= fire.falpha
+            else:
+                fire.npos = 0
+                fire.h = max(fire.h * fire.fdec, 0.01 * dt)
+                fire.alpha = fire.alpha0
+                dx = -0.5 * fire.h * v0
+                v0 = 0 * v0
+            v0 = v0 + fire.h * a
+            # without residual forces, there is no direction to mix the velocities with
+            norm_a = numpy.linalg.norm(a)
+            if norm_a > 0:
+                v0 = (1 - fire.alpha) * v0 + fire.alpha * numpy.linalg.norm(v0) / norm_a * a
+            v[active] = v0
+            dx = dx + fire.h * v0
+            x[active] = x0 + dx
+
+        elif integrator == "nesterov":
+            # Nesterov accelerated gradient
+            # preconditioned with the fictitious masses
+            # and with adaptive restart of the momentum
+            mass = 0.5 * scale * dt**2 * dot(Cat2, stiffness)
+            t0 = nesterov.t
+            nesterov.t = 0.5 * (1 + (1 + 4 * t0**2) ** 0.5)
+            y = x0 + (t0 - 1) / nesterov.t * (x0 - nesterov.x)
+            x[active] = y
+            if sector is not None:
+                sector.update(x)
+            r[active] = p[active] - dot(D, x)
+            dx = y + 0.25 * dt**2 * r[active] / mass - x0
+            if numpy.sum(r[active] * dx) < 0:
+                nesterov.t = 1.0
+            nesterov.x = x0
+            v[active] = dx / dt
+            x[active] = x0 + dx
+
+        else:
+            # RK
+            mass = 0.5 * scale * dt**2 * dot(Cat2, stiffness)
+            dv = rk(acceleration, v0, dt, steps=rk_steps, a0=cb * r[active] / mass)
+            v[active] = v0 + dv
+            dx = v[active] * dt
+            x[active] = x0 + dx
+
+        # the ghost vertices of a sector follow their representatives
+
+        if sector is not None:
+            sector.update(x)
 
         # update
-        u = C.dot(x)
-        l = normrow(u)  # noqa: E741
-        f = q * l
-        r = p - Ct.dot(Q).dot(u)
+        u = dot(Ca, x)
+        l[edges] = normrow(u)
+        f[edges] = qe * l[edges]
+        qe, stiffness, D = assemble(edges)
+        if clearance is not None:
+            p[:] = context.p + clearance.forces(x)
+        ra = p[active] - dot(D, x)
+        r[active] = ra
+
+        # watchdog
+        # after a divergence, the last valid state is restored with zero velocities
+        # and the iterations continue with larger masses and more damping
+        if watchdog is not None and watchdog.due(k):
+            reason = watchdog.check(x, residuals())
+            if reason is None:
+                watchdog.save(k, residuals(), x=x, q=q, l=l, f=f)
+            else:
+                scale, c, proceed = watchdog.rollback(k, reason, scale, c, x=x, q=q, l=l, f=f)
+                v[:] = 0
+                coeff = Coeff(c)
+                ca = coeff.a
+                cb = coeff.b
+                fire = Fire(h=0.5 * dt)
+                nesterov = Nesterov(x=x[free])
+                if active_set:
+                    aset.reset(k)
+                    active, edges, Ca, Cat2, plan = aset.vertices, aset.edges, aset.Ca, aset.Cat2, aset.plan
+                if clearance is not None:
+                    p[:] = context.p + clearance.forces(x)
+                qe, stiffness, D = assemble(edges)
+                r[active] = p[active] - dot(D, x)
+                crit1 = criteria.forces(residuals())
+                if not proceed:
+                    break
+                continue
 
         # crits
-        crit1 = norm(r[free])
-        crit2 = norm(dx[free])
+        # in active set mode, the residual forces of the rim are updated first
+        # and the frozen vertices that prevent the criteria from being satisfied are woken
+        if criteria.due(k) or k == kmax - 1:
+            if active_set:
+                rim()
+                crit1 = criteria.forces(residuals())
+            else:
+                crit1 = criteria.forces(ra)
+            crit2 = criteria.displacements(dx)
+
+            # callback
+            if callback:
+                callback(k, x, crit1, crit2, callback_args)
+
+            # convergence
+            if crit1 < tol1:
+                break
+            limited = active_set and aset.check(r, criteria, tol1)
+            if crit2 < tol2 and not limited:
+                break
+            if newton_tol and crit1 < newton_tol:
+                break
+
+        # active set
+        # if all vertices are frozen before the criteria are evaluated
+        # the criteria are evaluated immediately
+        if active_set:
+            aset.freeze(r[active], dx, mass / (0.5 * scale * dt**2))
+            if not aset.moving.any():
+                rim()
+                crit1 = criteria.forces(residuals())
+                if crit1 < tol1:
+                    break
+                aset.check(r, criteria, tol1)
+            if aset.due(k):
+                active, edges, Ca, Cat2, plan = activate(k)
+                qe, stiffness, D = assemble(edges)
+                r[active] = p[active] - dot(D, x)
 
-        # callback
-        if callback:
-            callback(k, x, crit1, crit2, callback_args)
+    # --------------------------------------------------------------------------
+    # newton polishing
+    # --------------------------------------------------------------------------
+    # the geometric stiffness of prescribed forces is included in the tangent
+    # but they have no axial stiffness
+    # --------------------------------------------------------------------------
 
-        # convergence
-        if crit1 < tol1:
-            break
-        if crit2 < tol2:
-            break
+    if newton_tol and tol1 <= crit1 < newton_tol:
+        u = C.dot(x)
+        l[:] = normrow(u)
+        q, stiffness = context.force_densities()
+        for k in range(k + 1, k + 1 + newton_kmax):
+            if clearance is not None:
+                p[:] = context.p + clearance.forces(x)
+            r = p - Ct.dot(q * u)
+            x0 = x[free]
+            try:
+                dx = context.tangent.solve(u, l, q, stiffness - fpre / l, residuals())
+            except RuntimeError:
+                break
+            # backtracking line search
+            # with the force densities of the trial geometry
+            crit0 = crit1
+            for _ in range(10):
+                x[free] = x0 + dx
+                u = C.dot(x)
+                l[:] = normrow(u)
+                q, stiffness = context.force_densities()
+                r = p - Ct.dot(q * u)
+                crit1 = criteria.forces(residuals())
+                if crit1 < crit0:
+                    break
+                dx *= 0.5
+            else:
+                x[free] = x0
+                u = C.dot(x)
+                l[:] = normrow(u)
+                q, stiffness = context.force_densities()
+                crit1 = crit0
+                break
+
+            f[:] = q * l
+            crit2 = criteria.displacements(dx)
+
+            if callback:
+                callback(k, x, crit1, crit2, callback_args)
+
+            if crit1 < tol1:
+                break
+            if crit2 < tol2:
+                break
 
     # --------------------------------------------------------------------------
     # result
     # --------------------------------------------------------------------------
 
-    return ResultData(xyz=x, q=q, forces=f, lengths=l, residuals=r)
+    if clearance is not None:
+        p[:] = context.p + clearance.forces(x)
+
+    # the force densities are recomputed in the final geometry
+
+    u = dot(C, x)
+    l = normrow(u)  # noqa: E741
+    context.l = l
+    q, _ = context.force_densities()
+    f = q * l
+    r = p - dot(Ct, q * u)
+
+    context.q = q
+    context.f = f
+    context.r = r
+
+    result = ResultData(
+        xyz=x,
+        q=q,
+        forces=f,
+        lengths=l,
+        residuals=r,
+        clashes=clearance.pairs if clearance is not None else None,
+        events=list(watchdog.events) if watchdog is not None else None,
+    )
+
+    return context.indata.restore(result)
@@ -0,0 +1,399 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Literal
+from typing import Union
+
+import numpy
+from compas.linalg import normrow
+from scipy.linalg import norm
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+import compas_dr.numdata
+from compas_dr.numdata import InputData
+from compas_dr.numdata import ResultData
+from compas_dr.solvers.backend import Backend
+from compas_dr.solvers.context import SolverContext
+from compas_dr.solvers.dr_numpy import dr_numpy
+
+
+class Subdomain:
+    """Class representing a part of a network, with layers of ghost vertices around it.
+
+    The ghost vertices within ``depth - 1`` edges of the owned vertices are relaxed together with the owned vertices,
+    and the outer layer of ghost vertices is held in place.
+    Since an explicit integration stage only propagates information over a single edge,
+    the owned vertices follow the same trajectory as in a solve of the complete network
+    for ``depth`` integration stages.
+
+    Parameters
+    ----------
+    vertices : array
+        The global indices of the vertices owned by the subdomain.
+    depth : int
+        The number of layers of ghost vertices.
+    context : :class:`compas_dr.solvers.SolverContext`
+        The context of the complete network.
+    adjacency : :class:`scipy.sparse.csr_matrix`
+        The vertex adjacency matrix of the complete network.
+
+    Attributes
+    ----------
+    vertices : array
+        The global indices of the local vertices: the owned vertices, followed by the ghost vertices.
+    owned : int
+        The number of owned vertices.
+    edges : array
+        The global indices of the local edges.
+    context : :class:`compas_dr.solvers.SolverContext`
+        The context of the subdomain.
+
+    """
+
+    def __init__(self, vertices, depth, context, adjacency):
+        C = context.C
+        Ct = context.Ct
+
+        owned = numpy.asarray(vertices, dtype=int)
+        level = numpy.full(C.shape[1], -1, dtype=int)
+        level[owned] = 0
+        layers = [owned]
+        for d in range(1, depth + 1):
+            neighbors = numpy.unique(adjacency[layers[-1]].indices)
+            neighbors = neighbors[level[neighbors] < 0]
+            level[neighbors] = d
+            layers.append(neighbors)
+
+        inner = numpy.concatenate(layers[:-1])
+        edges = numpy.unique(Ct[inner].indices)
+
+        self.vertices = numpy.concatenate(layers)
+        self.owned = len(owned)
+        self.edges = edges
+
+        local = numpy.full(C.shape[1], -1, dtype=int)
+        local[self.vertices] = numpy.arange(len(self.vertices))
+
+        # the column indices of the connectivity matrix are sorted
+        # so the orientation of the edges is restored from the signs
+
+        uv = C[edges]
+        u = local[uv.indices[uv.indptr[:-1]]]
+        v = local[uv.indices[uv.indptr[:-1] + 1]]
+        flip = uv.data[uv.indptr[:-1]] > 0
+        u, v = numpy.where(flip, v, u), numpy.where(flip, u, v)
+
+        fixed = local[numpy.intersect1d(context.fixed, inner)].tolist()
+        fixed += local[layers[-1]].tolist()
+
+        indata = InputData(
+            vertices=context.x[self.vertices].copy(),
+            edges=numpy.column_stack([u, v]).tolist(),
+            fixed=fixed,
+            loads=context.p[self.vertices].copy(),
+            qpre=context.qpre[edges],
+            fpre=context.fpre[edges],
+            lpre=context.lpre[edges],
+            linit=context.linit[edges],
+            E=context.E[edges],
+            radius=context.radius[edges],
+        )
+        self.context = SolverContext(indata)
+        self.scatter(context)
+
+    def gather(self, context, edges):
+        """Copy the state of the owned vertices and of a selection of local edges to the complete network.
+
+        Parameters
+        ----------
+        context : :class:`compas_dr.solvers.SolverContext`
+            The context of the complete network.
+        edges : array
+            The local indices of the edges.
+
+        Returns
+        -------
+        None
+
+        """
+        owned = self.vertices[: self.owned]
+        context.x[owned] = self.context.x[: self.owned]
+        context.v[owned] = self.context.v[: self.owned]
+        for name in ("q", "l", "f"):
+            getattr(context, name)[self.edges[edges]] = getattr(self.context, name)[edges]
+
+    def scatter(self, context):
+        """Copy the state of the ghost vertices and the local edges from the complete network.
+
+        Parameters
+        ----------
+        context : :class:`compas_dr.solvers.SolverContext`
+            The context of the complete network.
+
+        Returns
+        -------
+        None
+
+        """
+        ghosts = self.vertices[self.owned :]
+        self.context.x[self.owned :] = context.x[ghosts]
+        self.context.v[self.owned :] = context.v[ghosts]
+        for name in ("q", "l", "f"):
+            setattr(self.context, name, getattr(context, name)[self.edges].copy())
+
+
+def bisection(xyz, parts):
+    """Partition a set of points with recursive coordinate bisection.
+
+    Parameters
+    ----------
+    xyz : array
+        The coordinates of the points.
+    parts : int
+        The number of parts.
+
+    Returns
+    -------
+    list[array]
+        The indices of the points in every part.
+
+    """
+
+    def split(indices, parts):
+        if parts == 1:
+            return [indices]
+        points = xyz[indices]
+        axis = numpy.argmax(points.max(axis=0) - points.min(axis=0))
+        order = indices[numpy.argsort(points[:, axis], kind="stable")]
+        left = parts // 2
+        n = len(indices) * left // parts
+        return split(order[:n], left) + split(order[n:], parts - left)
+
+    return split(numpy.arange(len(xyz)), parts)
+
+
+def graph_partition(C, parts):
+    """Partition the vertices of a network in parts of consecutive vertices in the reverse Cuthill-McKee ordering.
+
+    Parameters
+    ----------
+    C : :class:`scipy.sparse.csr_matrix`
+        The connectivity matrix of the network.
+    parts : int
+        The number of parts.
+
+    Returns
+    -------
+    list[array]
+        The indices of the vertices in every part.
+
+    """
+    E = abs(C)
+    order = reverse_cuthill_mckee(E.transpose().dot(E).tocsr(), symmetric_mode=True)
+    return numpy.array_split(numpy.asarray(order, dtype=int), parts)
+
+
+def dr_partitioned_numpy(
+    indata: Union[compas_dr.numdata.InputData, SolverContext],
+    parts: int = 4,
+    partition: Literal["bisection", "graph"] = "bisection",
+    exchange: int = 5,
+    threads: int = None,
+    kmax: int = 10000,
+    dt: float = 1.0,
+    tol1: float = 1e-3,
+    tol2: float = 1e-6,
+    c: float = 0.1,
+    rk_steps: Literal[1, 2, 4] = 2,
+    backend: Backend = None,
+    callback: Callable = None,
+    callback_args: list = None,
+) -> compas_dr.numdata.ResultData:
+    """Dynamic relaxation of a network of axial-force members, partitioned in subdomains that are relaxed in parallel.
+
+    Every subdomain consists of the vertices it owns, surrounded by layers of ghost vertices owned by other subdomains.
+    The subdomains are relaxed with :func:`compas_dr.solvers.dr_numpy` on a pool of threads,
+    with the outer layer of ghost vertices held in place.
+    After every ``exchange`` iterations, the state of the owned vertices is gathered in the complete network,
+    and the state of the ghost vertices is updated from there.
+
+    The number of layers is the number of integration stages in between two exchanges,
+    such that the owned vertices follow the same trajectory as in a solve of the complete network.
+    The overlap of the subdomains grows with ``exchange``,
+    which therefore balances the redundant work in the ghost layers against the number of synchronisations.
+
+    Parameters
+    ----------
+    indata : :class:`compas_dr.numdata.InputData` | :class:`compas_dr.solvers.SolverContext`
+        An input data object, or a solver context.
+    parts : int, optional
+        The number of subdomains.
+    partition : {"bisection", "graph"}, optional
+        The partitioning method.
+        With ``"bisection"``, the vertices are partitioned with recursive coordinate bisection.
+        With ``"graph"``, the vertices are partitioned in blocks of the reverse Cuthill-McKee ordering.
+    exchange : int, optional
+        The number of iterations between two exchanges of the ghost vertices.
+        The last pass before ``kmax`` is shortened, such that the total number of iterations does not exceed ``kmax``.
+    threads : int, optional
+        The number of threads.
+        Defaults to the number of subdomains.
+    kmax : int, optional
+        The maximum number of iterations.
+    dt : float, optional
+        The time step for the integration scheme.
+    tol1 : float, optional
+        Tolerance for the norm of the residual forces of the complete network.
+    tol2 : float, optional
+        Tolerance for the norm of the displacements of the complete network,
+        averaged over the iterations in between two exchanges.
+    c : float, optional
+        Value used to calculate coefficients "a" and "b" of the RK integration.
+    rk_steps : {1, 2, 4}, optional
+        The number of Runge Kutta integration steps.
+    backend : :class:`compas_dr.solvers.Backend`, optional
+        The backend for the sparse matrix products of the iterations of the subdomains and the exchanges,
+        see :func:`compas_dr.solvers.dr_numpy`.
+    callback : callable, optional
+        User-defined function that is called after every exchange,
+        with the number of iterations, the vertex coordinates, the two convergence criteria, and ``callback_args``.
+    callback_args : tuple, optional
+        Additional arguments passed to the callback.
+
+    Returns
+    -------
+    :class:`compas_dr.numdata.ResultData`
+        A result data object.
+
+    Raises
+    ------
+    ValueError
+        If a callback function is provided that is not callable.
+    ValueError
+        If the partitioning method is not supported.
+    ValueError
+        If the number of iterations between two exchanges is smaller than 1.
+    ValueError
+        If the input data is the data of one sector of a symmetric network.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> from compas_dr.numdata import InputData
+    >>> from compas_dr.solvers import dr_partitioned_numpy
+    >>> mesh = Mesh.from_meshgrid(dx=10, nx=20)
+    >>> fixed = list(mesh.vertices_where(vertex_degree=2))
+    >>> loads = [[0, 0, -0.1]] * mesh.number_of_vertices()
+    >>> qpre = [1.0] * mesh.number_of_edges()
+    >>> result = dr_partitioned_numpy(InputData.from_mesh(mesh, fixed, loads, qpre), parts=2)
+
+    """
+    if callback:
+        if not callable(callback):
+            raise ValueError("The provided callback is not callable.")
+
+    if partition not in ("bisection", "graph"):
+        raise ValueError("Partitioning method not supported: {}".format(partition))
+
+    if exchange < 1:
+        raise ValueError("The number of iterations between two exchanges should be at least 1.")
+
+    # --------------------------------------------------------------------------
+    # numdata
+    # --------------------------------------------------------------------------
+
+    context = indata if isinstance(indata, SolverContext) else SolverContext(indata)
+
+    if context.indata.sector is not None:
+        raise ValueError("The sector of a symmetric network is not supported by this solver.")
+
+    x = context.x  # m
+    p = context.p  # kN
+    free = context.free
+    C = context.C
+    Ct = context.Ct
+
+    backend = backend or Backend()
+    dot = backend.dot
+
+    # --------------------------------------------------------------------------
+    # subdomains
+    # --------------------------------------------------------------------------
+
+    if partition == "bisection":
+        vertices = bisection(x, parts)
+    else:
+        vertices = graph_partition(C, parts)
+
+    E = abs(C)
+    adjacency = E.transpose().dot(E).tocsr()
+    depth = exchange * rk_steps
+
+    subdomains = [Subdomain(part, depth, context, adjacency) for part in vertices if len(part)]
+
+    # every edge is gathered from the subdomain that owns its first vertex
+
+    owner = numpy.zeros(C.shape[1], dtype=int)
+    for index, subdomain in enumerate(subdomains):
+        owner[subdomain.vertices[: subdomain.owned]] = index
+    first = C.indices[C.indptr[:-1]]
+    edges = [numpy.flatnonzero(owner[first[subdomain.edges]] == index) for index, subdomain in enumerate(subdomains)]
+
+    # the floating point error settings are local to every thread
+
+    def relax(subdomain, steps):
+        with numpy.errstate(divide="ignore"):
+            dr_numpy(subdomain.context, kmax=steps, dt=dt, tol1=0, tol2=0, c=c, rk_steps=rk_steps, backend=backend)
+
+    # --------------------------------------------------------------------------
+    # start iterating
+    # --------------------------------------------------------------------------
+
+    k = 0
+    with ThreadPoolExecutor(max_workers=threads or len(subdomains)) as pool:
+        while k < kmax:
+            x0 = x[free]
+
+            # the last pass is shortened such that the total number of iterations does not exceed kmax
+
+            steps = min(exchange, kmax - k)
+            list(pool.map(relax, subdomains, [steps] * len(subdomains)))
+            k += steps
+
+            # exchange
+
+            for subdomain, owned in zip(subdomains, edges):
+                subdomain.gather(context, owned)
+            for subdomain in subdomains:
+                subdomain.scatter(context)
+
+            # crits
+
+            q = context.q
+            r = p - dot(Ct, q * dot(C, x))
+            crit1 = norm(r[free])
+            crit2 = norm(x[free] - x0) / steps
+
+            if callback:
+                callback(k, x, crit1, crit2, callback_args)
+
+            if crit1 < tol1:
+                break
+            if crit2 < tol2:
+                break
+
+    # --------------------------------------------------------------------------
+    # result
+    # --------------------------------------------------------------------------
+
+    q = context.q
+    u = C.dot(x)
+    l = normrow(u)  # noqa: E741
+    f = q * l
+    r = p - Ct.dot(q * u)
+
+    context.q = q
+    context.l = l
+    context.f = f
+    context.r = r
+
+    return context.indata.restore(ResultData(xyz=x, q=q, forces=f, lengths=l, residuals=r))
@@ -0,0 +1,86 @@
+import numpy
+import scipy.sparse
+from scipy.sparse.linalg import splu
+
+
+class Factorization:
+    """Sparse LU factorization of symmetric matrices with a fixed sparsity pattern.
+
+    The fill-reducing ordering of the matrix is computed during the first factorization only.
+    Subsequent factorizations reuse the ordering and only redo the numeric part,
+    and are skipped entirely if the values of the matrix have not changed.
+
+    Examples
+    --------
+    >>> import scipy.sparse
+    >>> from compas_dr.solvers.factorization import Factorization
+    >>> A = scipy.sparse.csr_matrix([[2.0, -1.0], [-1.0, 2.0]])
+    >>> factorization = Factorization()
+    >>> factorization.factorize(A)
+    >>> factorization.solve([[1.0], [1.0]])
+    array([[1.],
+           [1.]])
+
+    """
+
+    def __init__(self):
+        self.perm = None
+        self.lu = None
+        self._reordered = False
+        self._indptr = None
+        self._indices = None
+        self._data = None
+
+    def factorize(self, A):
+        """Factorize a matrix.
+
+        Parameters
+        ----------
+        A : :class:`scipy.sparse.csr_matrix`
+            A symmetric matrix.
+
+        Returns
+        -------
+        None
+
+        """
+        A = scipy.sparse.csr_matrix(A)
+        A.sort_indices()
+
+        if self._indptr is None or not (numpy.array_equal(self._indptr, A.indptr) and numpy.array_equal(self._indices, A.indices)):
+            self.perm = None
+
+        elif self.lu is not None and numpy.array_equal(self._data, A.data):
+            return
+
+        if self.perm is None:
+            self.lu = splu(A.tocsc(), permc_spec="MMD_AT_PLUS_A", diag_pivot_thresh=0, options=dict(SymmetricMode=True))
+            self.perm = numpy.argsort(self.lu.perm_c)
+            self._reordered = False
+        else:
+            self.lu = splu(A[self.perm][:, self.perm].tocsc(), permc_spec="NATURAL", diag_pivot_thresh=0, options=dict(SymmetricMode=True))
+            self._reordered = True
+
+        self._indptr = A.indptr
+        self._indices = A.indices
+        self._data = A.data.copy()
+
+    def solve(self, b):
+        """Solve the factorized system for a right-hand side.
+
+        Parameters
+        ----------
+        b : array
+            The right-hand side.
+
+        Returns
+        -------
+        array
+
+        """
+        b = numpy.asarray(b, dtype=numpy.float64)
+        if not self._reordered:
+            return self.lu.solve(b)
+        x = numpy.empty_like(b)
+        x[self.perm] = self.lu.solve(b[self.perm])
+        return x
@@ -0,0 +1,95 @@
+from typing import Union
+
+from compas.linalg import normrow
+
+import compas_dr.numdata
+from compas_dr.numdata import ResultData
+from compas_dr.solvers.context import SolverContext
+
+
+def fd_numpy(
+    indata: Union[compas_dr.numdata.InputData, SolverContext],
+    q=None,
+) -> compas_dr.numdata.ResultData:
+    """Compute the equilibrium of a network of axial-force members with the linear force density method.
+
+    By default, the equilibrium is computed for the prescribed force densities only,
+    by solving ``Cit Q Ci x_free = p_free - Cit Q Cf x_fixed`` with a sparse factorization.
+    The factorization is cached in the solver context, and the ordering of the factorization
+    is reused as long as the topology of the problem doesn't change.
+
+    If the problem has no prescribed forces, prescribed lengths, or elastic properties,
+    the result is the same as the equilibrium found by :func:`compas_dr.solvers.dr_numpy`.
+    Otherwise, the result can be used as the initial geometry for the DR iterations.
+
+    Parameters
+    ----------
+    indata : :class:`compas_dr.numdata.InputData` | :class:`compas_dr.solvers.SolverContext`
+        An input data object, or a solver context.
+        If a solver context is provided, the equilibrium geometry is written back to it.
+    q : array, optional
+        The force densities of the edges.
+        Defaults to the prescribed force densities.
+
+    Returns
+    -------
+    :class:`compas_dr.numdata.ResultData`
+        A result data object.
+
+    Raises
+    ------
+    RuntimeError
+        If the stiffness matrix of the free vertices is singular.
+    ValueError
+        If the input data is the data of one sector of a symmetric network.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> from compas_dr.numdata import InputData
+    >>> from compas_dr.solvers import fd_numpy
+    >>> mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    >>> fixed = list(mesh.vertices_where(vertex_degree=2))
+    >>> loads = [[0, 0, -0.1]] * mesh.number_of_vertices()
+    >>> qpre = [1.0] * mesh.number_of_edges()
+    >>> result = fd_numpy(InputData.from_mesh(mesh, fixed, loads, qpre))
+
+    """
+    context = indata if isinstance(indata, SolverContext) else SolverContext(indata)
+
+    if context.indata.sector is not None:
+        raise ValueError("The sector of a symmetric network is not supported by this solver.")
+
+    x = context.x  # m
+    p = context.p  # kN
+    q = context.qpre if q is None else q
+    free = context.free
+    fixed = context.fixed
+
+    # --------------------------------------------------------------------------
+    # solve
+    # --------------------------------------------------------------------------
+
+    K = context.plan_free.assemble(q)
+    Kf = context.plan_fixed.assemble(q)
+
+    context.factorization.factorize(K)
+    x[free] = context.factorization.solve(p[free] - Kf.dot(x[fixed]))
+
+    # --------------------------------------------------------------------------
+    # result
+    # --------------------------------------------------------------------------
+
+    q = q.copy()
+    u = context.C.dot(x)
+    l = normrow(u)  # noqa: E741
+    f = q * l
+    r = p - context.Ct.dot(q * u)
+
+    context.q = q
+    context.l = l
+    context.f = f
+    context.r = r
+    context.v[:] = 0
+
+    return context.indata.restore(ResultData(xyz=x, q=q, forces=f, lengths=l, residuals=r))
@@ -0,0 +1,65 @@
+K = [
+    [0.0],
+    [0.5, 0.5],
+    [0.5, 0.0, 0.5],
+    [1.0, 0.0, 0.0, 1.0],
+]
+
+
+class Coeff:
+    def __init__(self, c):
+        self.c = c
+        self.a = (1 - c * 0.5) / (1 + c * 0.5)
+        self.b = 0.5 * (1 + self.a)
+
+
+def rk(acceleration, v0, dt, steps=2, a0=None):
+    """Compute the change of the velocities over a time step with a Runge Kutta integration scheme.
+
+    Parameters
+    ----------
+    acceleration : callable
+        A function that computes the accelerations at a time in the step,
+        with the time and the velocities as arguments.
+    v0 : array
+        The velocities at the start of the step.
+    dt : float
+        The time step.
+    steps : {1, 2, 4}, optional
+        The number of Runge Kutta integration steps.
+    a0 : array, optional
+        The accelerations at the start of the step, if they are already known.
+
+    Returns
+    -------
+    array
+
+    Raises
+    ------
+    NotImplementedError
+        If the number of steps is not supported.
+
+    """
+    if steps == 1:
+        return acceleration(dt, v0)
+
+    if a0 is None:
+        a0 = acceleration(K[0][0] * dt, v0)
+
+    if steps == 2:
+        B = [0.0, 1.0]
+        K0 = dt * a0
+        K1 = dt * acceleration(K[1][0] * dt, v0 + K[1][1] * K0)
+        dv = B[0] * K0 + B[1] * K1
+        return dv
+
+    if steps == 4:
+        B = [1.0 / 6.0, 1.0 / 3.0, 1.0 / 3.0, 1.0 / 6.0]
+        K0 = dt * a0
+        K1 = dt * acceleration(K[1][0] * dt, v0 + K[1][1] * K0)
+        K2 = dt * acceleration(K[2][0] * dt, v0 + K[2][1] * K0 + K[2][2] * K1)
+        K3 = dt * acceleration(K[3][0] * dt, v0 + K[3][1] * K0 + K[3][2] * K1 + K[3][3] * K2)
+        dv = B[0] * K0 + B[1] * K1 + B[2] * K2 + B[3] * K3
+        return dv
+
+    raise NotImplementedError
@@ -0,0 +1,91 @@
+import numpy
+import scipy.sparse
+
+from compas_dr.solvers.assembly import AssemblyPlan
+from compas_dr.solvers.factorization import Factorization
+
+
+class TangentStiffness:
+    """Class representing the tangent stiffness matrix of the free vertices of a network of axial-force members.
+
+    The stiffness of every edge is the sum of a geometric part ``q (I - n n^T)``, perpendicular to the edge,
+    and an axial part ``k n n^T``, with ``q`` the force density, ``k`` the axial stiffness ``df/dl``,
+    and ``n`` the unit direction vector of the edge.
+
+    The matrix is assembled per coordinate block on the sparsity pattern of ``Cit Q Ci``,
+    with the degrees of freedom ordered per coordinate axis.
+    Since the pattern doesn't change, the ordering of the factorization is computed only once.
+
+    Parameters
+    ----------
+    Ci : :class:`scipy.sparse.csr_matrix`
+        The columns of the connectivity matrix corresponding to the free vertices.
+    plan : :class:`compas_dr.solvers.AssemblyPlan`, optional
+        The assembly plan of ``Cit Q Ci``.
+        If None, the plan is computed from ``Ci``.
+
+    """
+
+    def __init__(self, Ci, plan=None):
+        self.plan = plan or AssemblyPlan(Ci, Ci)
+        self.factorization = Factorization()
+
+    def assemble(self, u, l, q, k):  # noqa: E741
+        """Assemble the tangent stiffness matrix.
+
+        Parameters
+        ----------
+        u : array
+            The edge vectors.
+        l : array
+            The edge lengths.
+        q : array
+            The force densities of the edges.
+        k : array
+            The axial stiffness of the edges.
+
+        Returns
+        -------
+        :class:`scipy.sparse.csr_matrix`
+
+        """
+        n = u / l
+        blocks = [[None, None, None] for _ in range(3)]
+        for a in range(3):
+            for b in range(3):
+                w = (k - q)[:, 0] * n[:, a] * n[:, b]
+                if a == b:
+                    w += q[:, 0]
+                blocks[a][b] = self.plan.assemble(w)
+        return scipy.sparse.bmat(blocks, format="csr")
+
+    def solve(self, u, l, q, k, r):  # noqa: E741
+        """Compute the displacements of the free vertices that equilibrate the residual forces.
+
+        Parameters
+        ----------
+        u : array
+            The edge vectors.
+        l : array
+            The edge lengths.
+        q : array
+            The force densities of the edges.
+        k : array
+            The axial stiffness of the edges.
+        r : array
+            The residual forces at the free vertices.
+
+        Returns
+        -------
+        array
+            The displacements of the free vertices.
+
+        Raises
+        ------
+        RuntimeError
+            If the tangent stiffness matrix is singular.
+
+        """
+        self.factorization.factorize(self.assemble(u, l, q, k))
+        dx = self.factorization.solve(numpy.asarray(r).ravel(order="F"))
+        return dx.reshape((-1, 3), order="F")
@@ -0,0 +1,185 @@
+import numpy
+
+
+class Watchdog:
+    """Class for detecting and recovering from the divergence of the iterations of a solver.
+
+    At every ``interval`` iterations, the coordinates and residual forces are checked for NaN and infinite values,
+    and the norm of the residual forces is compared with the largest norm of the previous checks.
+    As long as that norm is zero, for example for a solve that starts in equilibrium, the growth is not checked.
+    If the state is valid, a copy of it is stored.
+    Otherwise, the solver rolls back to the last valid state with zero velocities,
+    increases the fictitious masses and the damping, and continues from there.
+
+    The masses of the solvers are proportional to the square of the time step,
+    such that a smaller time step does not change the trajectory of the iterations.
+    Instead, the masses are multiplied by a factor that grows with every rollback,
+    which shortens the steps.
+
+    Parameters
+    ----------
+    interval : int, optional
+        The number of iterations between two checks.
+    growth : float, optional
+        The factor by which the norm of the residual forces may exceed the largest norm of the previous checks.
+    mass : float, optional
+        The factor by which the scale factor of the fictitious masses is multiplied after a rollback.
+    damping : float, optional
+        The factor by which the damping coefficient is multiplied after a rollback.
+    restarts : int, optional
+        The maximum number of rollbacks.
+        After that, the solver stops at the last valid state.
+
+    Attributes
+    ----------
+    events : list[dict]
+        The rollbacks of the last solve, with the ``"iteration"`` at which the divergence was detected,
+        the ``"reason"`` (``"nan"`` or ``"growth"``), the ``"action"`` (``"restart"`` or ``"stop"``),
+        the ``"rollback"`` iteration of the restored state,
+        and the new scale factor of the masses ``"mass"`` and damping coefficient ``"c"``.
+
+    Raises
+    ------
+    ValueError
+        If the interval is smaller than 1.
+
+    Examples
+    --------
+    >>> import numpy
+    >>> from compas_dr.solvers import Watchdog
+    >>> watchdog = Watchdog(interval=5)
+    >>> watchdog.check(numpy.zeros((2, 3)), numpy.ones((2, 3)))
+    >>> watchdog.check(numpy.zeros((2, 3)), numpy.full((2, 3), numpy.nan))
+    'nan'
+
+    """
+
+    def __init__(self, interval=10, growth=100.0, mass=2.0, damping=2.0, restarts=10):
+        if interval < 1:
+            raise ValueError("The check interval should be at least 1.")
+        self.interval = interval
+        self.growth = growth
+        self.mass = mass
+        self.damping = damping
+        self.restarts = restarts
+        self.events = []
+        self._state = None
+        self._k = -1
+        self._norm = 0.0
+
+    def reset(self):
+        """Discard the events and the stored state of a previous solve.
+
+        Returns
+        -------
+        None
+
+        """
+        self.events = []
+        self._state = None
+        self._k = -1
+        self._norm = 0.0
+
+    def due(self, k):
+        """Verify if the state should be checked at an iteration.
+
+        Parameters
+        ----------
+        k : int
+            The index of the iteration.
+
+        Returns
+        -------
+        bool
+
+        """
+        return (k + 1) % self.interval == 0
+
+    def check(self, x, r):
+        """Check the state of a solver.
+
+        Parameters
+        ----------
+        x : array
+            The vertex coordinates.
+        r : array
+            The residual forces of the free vertices.
+
+        Returns
+        -------
+        str | None
+            ``"nan"`` if the coordinates or residual forces are not finite,
+            ``"growth"`` if the norm of the residual forces grew too much
+            with respect to a nonzero norm of the previous checks,
+            and None otherwise.
+
+        """
+        if not (numpy.isfinite(x).all() and numpy.isfinite(r).all()):
+            return "nan"
+        # relative to a zero norm, any round-off error would be a growth
+        if self._state is not None and self._norm > 0 and numpy.linalg.norm(r) > self.growth * self._norm:
+            return "growth"
+        return None
+
+    def save(self, k, r, **arrays):
+        """Store a copy of a valid state.
+
+        Parameters
+        ----------
+        k : int
+            The index of the iteration.
+        r : array
+            The residual forces of the free vertices.
+        **arrays : dict
+            The arrays of the state, by name.
+
+        Returns
+        -------
+        None
+
+        """
+        self._state = {name: array.copy() for name, array in arrays.items()}
+        self._k = k
+        self._norm = max(self._norm, float(numpy.linalg.norm(r)))
+
+    def rollback(self, k, reason, scale, c, **arrays):
+        """Restore the last valid state in place, and record the event.
+
+        Parameters
+        ----------
+        k : int
+            The index of the iteration.
+        reason : str
+            The reason of the rollback.
+        scale : float
+            The current scale factor of the masses.
+        c : float
+            The current damping coefficient.
+        **arrays : dict
+            The arrays of the state, by name, to be overwritten with the stored copies.
+
+        Returns
+        -------
+        tuple[float, float, bool]
+            The new scale factor of the masses and damping coefficient,
+            and True if the solver should continue.
+
+        """
+        for name, array in arrays.items():
+            array[:] = self._state[name]
+        proceed = len(self.events) < self.restarts
+        if proceed:
+            # the damping coefficient is at most 2, for which the velocities are not carried over
+            scale = scale * self.mass
+            c = min(c * self.damping, 2.0)
+        self.events.append(
+            {
+                "iteration": k,
+                "reason": reason,
+                "action": "restart" if proceed else "stop",
+                "rollback": self._k,
+                "mass": scale,
+                "c": c,
+            }
+        )
+        return scale, c, proceed
@@ -0,0 +1,22 @@
+"""This package defines the symmetries of networks, for solving one sector of a symmetric network."""
+
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import compas
+
+from .symmetry import Symmetry
+from .symmetry import RotationalSymmetry
+from .symmetry import MirrorSymmetry
+
+__all__ = [
+    "Symmetry",
+    "RotationalSymmetry",
+    "MirrorSymmetry",
+]
+
+if not compas.IPY:
+    from .sector import Sector
+
+    __all__ += ["Sector"]
@@ -0,0 +1,204 @@
+import numpy
+from scipy.spatial import cKDTree
+
+from compas_dr.numdata import ResultData
+
+
+class Sector:
+    """Class representing one sector of a symmetric network, and the images of its vertices in the other sectors.
+
+    Every vertex of the network is the image of a representative vertex in the sector, under one of the transformations of the symmetry.
+    The sector consists of the representative vertices, the edges connected to them,
+    and the ghost vertices at the other ends of these edges.
+    The ghost vertices are images of representative vertices,
+    and are moved together with them with :meth:`update`.
+
+    Parameters
+    ----------
+    indata : :class:`compas_dr.numdata.InputData`
+        The input data of the complete network.
+    symmetry : :class:`compas_dr.symmetry.Symmetry`
+        The symmetry of the network.
+    tol : float, optional
+        The tolerance for matching the vertices with their images.
+
+    Attributes
+    ----------
+    indata : :class:`compas_dr.numdata.InputData`
+        The input data of the complete network.
+    symmetry : :class:`compas_dr.symmetry.Symmetry`
+        The symmetry of the network.
+    tol : float
+        The tolerance for matching the vertices with their images.
+    vertices : array
+        The indices of the vertices of the sector in the complete network:
+        the representative vertices, followed by the ghost vertices.
+    owned : int
+        The number of representative vertices.
+    edges : array
+        The indices of the edges of the sector in the complete network.
+    rank : array
+        The index in the sector of every representative vertex of the complete network, or -1 for the other vertices.
+    orbits : array
+        The index in the sector of the representative of every vertex of the complete network.
+    images : array
+        The index of the transformation that maps its representative onto every vertex of the complete network.
+
+    Raises
+    ------
+    ValueError
+        If the vertices, edges, supports, loads or edge attributes are not symmetric.
+
+    """
+
+    def __init__(self, indata, symmetry, tol=1e-6):
+        self.indata = indata
+        self.symmetry = symmetry
+        self.tol = tol
+
+        x = indata.vertices
+        edges = numpy.asarray(indata.edges, dtype=int)
+        n = len(x)
+        m = len(edges)
+
+        matrices = numpy.array([transformation.matrix for transformation in symmetry.transformations()], dtype=float)
+        self._rotations = matrices[:, :3, :3]
+        self._translations = matrices[:, :3, 3]
+
+        # the image of every vertex under every transformation
+
+        tree = cKDTree(x)
+        perms = numpy.empty((len(matrices), n), dtype=int)
+        for i in range(len(matrices)):
+            distances, perms[i] = tree.query(x.dot(self._rotations[i].T) + self._translations[i])
+            if numpy.any(distances > tol):
+                raise ValueError("The vertices are not symmetric.")
+
+        # the representative of every vertex is the image with the smallest sector key
+        # with the index as tie breaker, such that all images have the same representative
+
+        keys = symmetry.keys(x)
+        position = numpy.empty(n, dtype=int)
+        position[numpy.lexsort((numpy.arange(n), keys))] = numpy.arange(n)
+        representatives = perms[numpy.argmin(position[perms], axis=0), numpy.arange(n)]
+
+        images = numpy.full(n, -1, dtype=int)
+        for i in range(len(matrices)):
+            match = (images < 0) & (perms[i][representatives] == numpy.arange(n))
+            images[match] = i
+
+        # the edges are identified by the sorted indices of their vertices
+
+        def pairs(u, v):
+            return numpy.minimum(u, v) * n + numpy.maximum(u, v)
+
+        codes = pairs(edges[:, 0], edges[:, 1])
+        order = numpy.argsort(codes)
+
+        def find(u, v):
+            index = numpy.searchsorted(codes, pairs(u, v), sorter=order)
+            index = order[numpy.minimum(index, m - 1)]
+            if numpy.any(codes[index] != pairs(u, v)):
+                raise ValueError("The edges are not symmetric.")
+            return index
+
+        fixed = numpy.zeros(n, dtype=bool)
+        fixed[numpy.asarray(indata.fixed, dtype=int)] = True
+        loads = indata.loads
+        attributes = numpy.hstack([indata.qpre, indata.fpre, indata.lpre, indata.linit, indata.E, indata.radius])
+
+        for i in range(1, len(matrices)):
+            perm = perms[i]
+            if numpy.any(fixed[perm] != fixed):
+                raise ValueError("The supports are not symmetric.")
+            if not numpy.allclose(loads[perm], loads.dot(self._rotations[i].T), atol=tol):
+                raise ValueError("The loads are not symmetric.")
+            if not numpy.allclose(attributes[find(perm[edges[:, 0]], perm[edges[:, 1]])], attributes):
+                raise ValueError("The edge attributes are not symmetric.")
+
+        # the sector
+
+        owned = numpy.unique(representatives)
+        is_owned = numpy.zeros(n, dtype=bool)
+        is_owned[owned] = True
+        sector = numpy.flatnonzero(is_owned[edges[:, 0]] | is_owned[edges[:, 1]])
+        ghosts = numpy.setdiff1d(edges[sector].ravel(), owned)
+
+        self.vertices = numpy.concatenate([owned, ghosts])
+        self.owned = len(owned)
+        self.edges = sector
+
+        local = numpy.full(n, -1, dtype=int)
+        local[self.vertices] = numpy.arange(len(self.vertices))
+        self.rank = numpy.where(is_owned, local, -1)
+        self.orbits = local[representatives]
+        self.images = images
+
+        # every edge of the network is the image of an edge of the sector
+        # connected to the representative of its first vertex
+
+        inverse = numpy.empty_like(perms)
+        for i in range(len(matrices)):
+            inverse[i][perms[i]] = numpy.arange(n)
+        u = representatives[edges[:, 0]]
+        v = inverse[images[edges[:, 0]], edges[:, 1]]
+        sector_index = numpy.full(m, -1, dtype=int)
+        sector_index[sector] = numpy.arange(len(sector))
+        self._edge_orbits = sector_index[find(u, v)]
+
+        self._sources = self.orbits[ghosts]
+        self._ghost_rotations = self._rotations[images[ghosts]]
+        self._ghost_translations = self._translations[images[ghosts]]
+
+    def update(self, x):
+        """Move the ghost vertices of the sector to the images of their representatives.
+
+        Parameters
+        ----------
+        x : array
+            The coordinates of the vertices of the sector.
+
+        Returns
+        -------
+        None
+
+        """
+        x[self.owned :] = numpy.einsum("ijk,ik->ij", self._ghost_rotations, x[self._sources]) + self._ghost_translations
+
+    def restore(self, result):
+        """Reconstruct the results of the complete network from the results of the sector.
+
+        Parameters
+        ----------
+        result : :class:`compas_dr.numdata.ResultData`
+            The results of the sector.
+
+        Returns
+        -------
+        :class:`compas_dr.numdata.ResultData`
+            The results of the complete network, in the original order of its input data.
+
+        """
+        rotations = self._rotations[self.images]
+        translations = self._translations[self.images]
+        xyz = numpy.einsum("ijk,ik->ij", rotations, result.xyz[self.orbits]) + translations
+        residuals = numpy.einsum("ijk,ik->ij", rotations, result.residuals[self.orbits])
+
+        contacts = None
+        if result.contacts is not None:
+            contacts = [numpy.flatnonzero(numpy.isin(self.orbits, contact[contact < self.owned])) for contact in result.contacts]
+        clashes = None
+        if result.clashes is not None:
+            clashes = self.edges[result.clashes]
+
+        result = ResultData(
+            xyz=xyz,
+            q=result.q[self._edge_orbits],
+            forces=result.forces[self._edge_orbits],
+            lengths=result.lengths[self._edge_orbits],
+            residuals=residuals,
+            contacts=contacts,
+            clashes=clashes,
+            events=result.events,
+        )
+        return self.indata.restore(result)
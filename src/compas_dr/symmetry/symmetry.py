@@ -0,0 +1,144 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import math
+
+from compas.data import Data
+from compas.geometry import Line
+from compas.geometry import Plane
+from compas.geometry import Reflection
+from compas.geometry import Rotation
+from compas.geometry import Transformation
+from compas.geometry import Vector
+
+
+class Symmetry(Data):
+    """Base class for the symmetries of a network.
+
+    A symmetry is a finite group of transformations that map the network onto itself.
+    The sector of the network that is relaxed by the solvers contains the vertices with the smallest sector keys.
+
+    Parameters
+    ----------
+    name : str, optional
+        The name of the symmetry.
+
+    """
+
+    def transformations(self):
+        """Compute the transformations of the symmetry group.
+
+        Returns
+        -------
+        list[:class:`compas.geometry.Transformation`]
+            The transformations, starting with the identity.
+
+        """
+        raise NotImplementedError
+
+    def keys(self, points):
+        """Compute the sector keys of points.
+
+        Of every set of points that are images of each other,
+        the point with the smallest key is in the sector that is relaxed by the solvers.
+
+        Parameters
+        ----------
+        points : array
+            The points, as an array of shape ``(n, 3)``.
+
+        Returns
+        -------
+        array
+            The keys.
+
+        """
+        raise NotImplementedError
+
+
+class RotationalSymmetry(Symmetry):
+    """Rotational symmetry of a network about an axis.
+
+    Parameters
+    ----------
+    n : int
+        The number of sectors.
+    axis : :class:`compas.geometry.Line`, optional
+        The axis of rotation.
+        Defaults to the Z axis.
+    name : str, optional
+        The name of the symmetry.
+
+    Examples
+    --------
+    >>> from compas_dr.symmetry import RotationalSymmetry
+    >>> symmetry = RotationalSymmetry(4)
+    >>> len(symmetry.transformations())
+    4
+
+    """
+
+    @property
+    def __data__(self):
+        return {"n": self.n, "axis": self.axis}
+
+    def __init__(self, n, axis=None, name=None):
+        super(RotationalSymmetry, self).__init__(name=name)
+        self.n = n
+        self.axis = axis or Line([0, 0, 0], [0, 0, 1])
+
+    def transformations(self):
+        return [Rotation.from_axis_and_angle(self.axis.direction, 2 * math.pi * i / self.n, point=self.axis.start) for i in range(self.n)]
+
+    def keys(self, points):
+        import numpy
+
+        # the angles of the points about the axis
+        # from an arbitrary direction perpendicular to the axis
+
+        direction = self.axis.direction.unitized()
+        first = direction.cross(Vector(1, 0, 0) if abs(direction[0]) < 0.9 else Vector(0, 1, 0)).unitized()
+        second = direction.cross(first)
+        vectors = numpy.asarray(points, dtype=float) - numpy.asarray(self.axis.start)
+        angles = numpy.arctan2(vectors.dot(numpy.asarray(second)), vectors.dot(numpy.asarray(first)))
+        return numpy.mod(angles, 2 * math.pi)
+
+
+class MirrorSymmetry(Symmetry):
+    """Mirror symmetry of a network about a plane.
+
+    Parameters
+    ----------
+    plane : :class:`compas.geometry.Plane`, optional
+        The mirror plane.
+        Defaults to the YZ plane.
+        The sector that is relaxed by the solvers is on the side of the normal of the plane.
+    name : str, optional
+        The name of the symmetry.
+
+    Examples
+    --------
+    >>> from compas_dr.symmetry import MirrorSymmetry
+    >>> symmetry = MirrorSymmetry()
+    >>> len(symmetry.transformations())
+    2
+
+    """
+
+    @property
+    def __data__(self):
+        return {"plane": self.plane}
+
+    def __init__(self, plane=None, name=None):
+        super(MirrorSymmetry, self).__init__(name=name)
+        self.plane = plane or Plane.worldYZ()
+
+    def transformations(self):
+        return [Transformation(), Reflection.from_plane(self.plane)]
+
+    def keys(self, points):
+        import numpy
+
+        normal = numpy.asarray(self.plane.normal.unitized())
+        return -(numpy.asarray(points, dtype=float) - numpy.asarray(self.plane.point)).dot(normal)
@@ -0,0 +1,47 @@
+import numpy
+from compas.datastructures import Mesh
+
+from compas_dr.numdata import InputData
+from compas_dr.solvers import SolverContext
+from compas_dr.solvers import dr_numpy
+
+
+def relaxed_grid():
+    # a grid with supports along every tenth line
+    # such that a local change only affects one of the compartments
+    mesh = Mesh.from_meshgrid(dx=30, nx=30)
+    index = mesh.vertex_index()
+    xyz = numpy.array(mesh.vertices_attributes("xyz"))
+    edges = [[index[u], index[v]] for u, v in mesh.edges()]
+    i, j = numpy.rint(xyz[:, :2]).astype(int).T
+    fixed = numpy.flatnonzero((i % 10 == 0) | (j % 10 == 0)).tolist()
+    loads = [[0, 0, -0.01]] * len(xyz)
+    qpre = [1.0] * len(edges)
+    context = SolverContext(InputData(xyz.tolist(), edges, fixed, loads, qpre))
+    dr_numpy(context, tol1=1e-8, kmax=10000)
+    vertex = int(numpy.flatnonzero((i == 15) & (j == 15))[0])
+    local = [e for e, (u, v) in enumerate(edges) if vertex in (u, v)]
+    context.update_edges(local, qpre=[5.0] * len(local))
+    return context
+
+
+def solve(**kwargs):
+    context = relaxed_grid()
+    x = context.x.copy()
+    updates = []
+
+    def callback(k, xyz, crit1, crit2, args):
+        updates.append(int((xyz != x).any(axis=1).sum()))
+        x[:] = xyz
+
+    result = dr_numpy(context, tol1=1e-5, kmax=10000, callback=callback, **kwargs)
+    return result, context, sum(updates)
+
+
+def test_active_set_updates_fewer_vertices():
+    full, context, updates = solve()
+    active, context, active_updates = solve(active_set=True)
+    residuals = numpy.asarray(active.residuals)[context.free]
+    assert numpy.linalg.norm(residuals) < 1e-5
+    assert numpy.allclose(active.xyz, full.xyz, atol=1e-4)
+    assert active_updates < 0.5 * updates
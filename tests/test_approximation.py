@@ -0,0 +1,76 @@
+import numpy
+
+from compas_dr.constraints.approximation import MeshApproximation
+from compas_dr.constraints.approximation import PolylineApproximation
+from compas_dr.constraints.bvh import closest_points_on_triangles
+
+
+class Curve:
+    domain = (0.0, 4 * numpy.pi)
+
+    def point_at(self, t):
+        return [numpy.cos(t), numpy.sin(t), 0.1 * t]
+
+
+class Surface:
+    domain_u = (0.0, 1.0)
+    domain_v = (0.0, 1.0)
+
+    def point_at(self, u, v):
+        return [10 * u, 10 * v, 3 * numpy.sin(3 * u) * numpy.cos(2 * v)]
+
+
+def test_mesh_approximation_closest_points():
+    approximation = MeshApproximation(Surface(), 1e-2)
+    points = numpy.random.default_rng(0).random((50, 3)) * [10, 10, 6] - [0, 0, 3]
+    closest, params, normals = approximation.closest_points(points)
+
+    # brute force over all triangles
+
+    a, b, c = (approximation.points[approximation.triangles[:, i]] for i in range(3))
+    for point, xyz in zip(points, closest):
+        candidates = closest_points_on_triangles(numpy.tile(point, (len(a), 1)), a, b, c)
+        distances = numpy.linalg.norm(candidates - point, axis=1)
+        assert numpy.isclose(numpy.linalg.norm(xyz - point), distances.min())
+
+    surface = Surface()
+    for (u, v), xyz in zip(params, closest):
+        assert numpy.allclose(surface.point_at(u, v), xyz, atol=0.05)
+    assert numpy.allclose(numpy.linalg.norm(normals, axis=1), 1.0)
+
+    xyz, (u, v), normal = approximation.closest_point(points[0])
+    assert numpy.allclose(xyz, closest[0])
+
+
+def test_polyline_approximation_closest_points():
+    approximation = PolylineApproximation(Curve(), 1e-3)
+    points = numpy.random.default_rng(0).random((50, 3)) * [4, 4, 2] - [2, 2, 0]
+
+    # a chunk size smaller than the number of segments times the number of points
+    # splits the query in chunks of a single point
+
+    closest, params, directions = approximation.closest_points(points)
+    for chunksize in (1, 3 * len(approximation.points)):
+        chunked = approximation.closest_points(points, chunksize=chunksize)
+        for expected, result in zip((closest, params, directions), chunked):
+            assert numpy.allclose(result, expected)
+
+    # brute force over all segments
+
+    a = approximation.points[:-1]
+    b = approximation.points[1:]
+    for point, xyz in zip(points, closest):
+        t = numpy.clip(numpy.einsum("ij,ij->i", point - a, b - a) / numpy.einsum("ij,ij->i", b - a, b - a), 0, 1)
+        distances = numpy.linalg.norm(a + t[:, None] * (b - a) - point, axis=1)
+        assert numpy.isclose(numpy.linalg.norm(xyz - point), distances.min())
+
+    curve = Curve()
+    for t, xyz in zip(params, closest):
+        assert numpy.allclose(curve.point_at(t), xyz, atol=2e-3)
+    assert numpy.allclose(numpy.linalg.norm(directions, axis=1), 1.0)
+
+    for point, xyz, t, direction in zip(points, closest, params, directions):
+        result = approximation.closest_point(point)
+        assert numpy.allclose(result[0], xyz)
+        assert numpy.isclose(result[1], t)
+        assert numpy.allclose(result[2], direction)
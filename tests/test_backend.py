@@ -0,0 +1,40 @@
+import pytest
+from compas.datastructures import Mesh
+
+from compas_dr.numdata import InputData
+from compas_dr.solvers import Backend
+from compas_dr.solvers import dr_components_numpy
+from compas_dr.solvers import dr_constrained_numpy
+from compas_dr.solvers import dr_multilevel_numpy
+from compas_dr.solvers import dr_partitioned_numpy
+
+
+class CountingBackend(Backend):
+    def __init__(self):
+        self.count = 0
+
+    def dot(self, A, x):
+        self.count += 1
+        return A.dot(x)
+
+
+def grid():
+    mesh = Mesh.from_meshgrid(dx=10, nx=20)
+    fixed = list(mesh.vertices_where(vertex_degree=2))
+    loads = [[0, 0, -0.1]] * mesh.number_of_vertices()
+    qpre = [1.0] * mesh.number_of_edges()
+    return InputData.from_mesh(mesh, fixed, loads, qpre)
+
+
+@pytest.mark.parametrize("solver", [dr_components_numpy, dr_partitioned_numpy, dr_multilevel_numpy])
+def test_backend(solver):
+    backend = CountingBackend()
+    solver(grid(), backend=backend)
+    assert backend.count > 0
+
+
+def test_backend_constrained():
+    backend = CountingBackend()
+    indata = grid()
+    dr_constrained_numpy(indata=indata, constraints=[None] * len(indata.vertices), backend=backend)
+    assert backend.count > 0
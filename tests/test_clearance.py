@@ -0,0 +1,73 @@
+import numpy
+
+from compas_dr.solvers import Clearance
+from compas_dr.solvers.clearance import closest_points_on_segments
+
+
+def test_clashing_pair():
+    clearance = Clearance(0.2)
+    clearance.setup([[0, 1], [2, 3]])
+    x = numpy.array([[0, 0, 0], [1, 0, 0], [0.5, -0.5, 0.1], [0.5, 0.5, 0.1]], dtype=float)
+    pairs, s, t = clearance.update(x)
+    assert pairs.tolist() == [[0, 1]]
+    assert numpy.allclose(clearance.distances, [0.1])
+    assert numpy.allclose(s, [0.5])
+    assert numpy.allclose(t, [0.5])
+
+    # without stiffness the violations are only recorded
+
+    assert not clearance.forces(x).any()
+    assert clearance.pairs.tolist() == [[0, 1]]
+
+
+def test_no_clash():
+    clearance = Clearance(0.2)
+    clearance.setup([[0, 1], [2, 3]])
+    x = numpy.array([[0, 0, 0], [1, 0, 0], [0.5, -0.5, 1.0], [0.5, 0.5, 1.0]], dtype=float)
+    pairs, _, _ = clearance.update(x)
+    assert not len(pairs)
+    assert not len(clearance.distances)
+
+
+def test_shared_vertex():
+    clearance = Clearance(0.2)
+    clearance.setup([[0, 1], [1, 2]])
+    x = numpy.array([[0, 0, 0], [1, 0, 0], [0, 0.1, 0]], dtype=float)
+    pairs, _, _ = clearance.update(x)
+    assert not len(pairs)
+
+
+def test_pairs_match_brute_force():
+    rng = numpy.random.default_rng(0)
+    x = rng.random((200, 3)) * 10
+    edges = numpy.array([rng.choice(200, 2, replace=False) for _ in range(300)])
+
+    clearance = Clearance(0.5)
+    clearance.setup(edges)
+    pairs, _, _ = clearance.update(x)
+
+    i, j = numpy.triu_indices(len(edges), k=1)
+    u = edges[i]
+    v = edges[j]
+    keep = (u[:, 0] != v[:, 0]) & (u[:, 0] != v[:, 1]) & (u[:, 1] != v[:, 0]) & (u[:, 1] != v[:, 1])
+    i, j, u, v = i[keep], j[keep], u[keep], v[keep]
+    s, t = closest_points_on_segments(x[u[:, 0]], x[u[:, 1]], x[v[:, 0]], x[v[:, 1]])
+    p = x[u[:, 0]] + s[:, None] * (x[u[:, 1]] - x[u[:, 0]])
+    q = x[v[:, 0]] + t[:, None] * (x[v[:, 1]] - x[v[:, 0]])
+    close = numpy.linalg.norm(p - q, axis=1) < 0.5
+    assert close.any()
+    assert pairs.tolist() == numpy.column_stack([i[close], j[close]]).tolist()
+
+
+def test_closest_points_on_segments():
+    rng = numpy.random.default_rng(1)
+    a, b, c, d = rng.random((4, 50, 3))
+    s, t = closest_points_on_segments(a, b, c, d)
+    distances = numpy.linalg.norm(a + s[:, None] * (b - a) - c - t[:, None] * (d - c), axis=1)
+
+    samples = numpy.linspace(0, 1, 201)
+    p = a[:, None, None] + samples[None, :, None, None] * (b - a)[:, None, None]
+    q = c[:, None, None] + samples[None, None, :, None] * (d - c)[:, None, None]
+    sampled = numpy.linalg.norm(p - q, axis=-1).min(axis=(1, 2))
+    assert numpy.all(distances <= sampled + 1e-12)
+    assert numpy.allclose(distances, sampled, atol=1e-2)
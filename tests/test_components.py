@@ -0,0 +1,48 @@
+import numpy
+from compas.datastructures import Mesh
+
+from compas_dr.numdata import InputData
+from compas_dr.solvers import SolverContext
+from compas_dr.solvers import dr_components_numpy
+from compas_dr.solvers import dr_numpy
+from compas_dr.solvers.dr_components_numpy import Component
+from compas_dr.solvers.dr_components_numpy import components
+
+
+def nets():
+    # two disconnected grids
+    # the edges of the second grid are reversed, such that their first vertex has the largest index
+
+    mesh = Mesh.from_meshgrid(dx=10, nx=6)
+    vertex_index = {vertex: index for index, vertex in enumerate(mesh.vertices())}
+    vertices = mesh.vertices_attributes("xyz")
+    edges = [(vertex_index[u], vertex_index[v]) for u, v in mesh.edges()]
+    fixed = [vertex_index[vertex] for vertex in mesh.vertices_where(vertex_degree=2)]
+    n = len(vertices)
+
+    vertices = vertices + [[x + 20, y, z] for x, y, z in vertices]
+    edges = edges + [(max(u, v) + n, min(u, v) + n) for u, v in edges]
+    fixed = fixed + [i + n for i in fixed]
+    loads = [[0, 0, -0.1]] * n + [[0, 0, -0.2]] * n
+    qpre = [1.0] * len(edges)
+    return InputData(vertices, edges, fixed, loads, qpre)
+
+
+def test_components_match_dr_numpy():
+    expected = dr_numpy(nets(), tol1=1e-6)
+    result = dr_components_numpy(nets(), tol1=1e-6)
+    for name in ("xyz", "q", "forces", "lengths", "residuals"):
+        assert numpy.allclose(getattr(result, name), getattr(expected, name), atol=1e-4)
+
+
+def test_component_edges_keep_their_orientation():
+    indata = nets()
+    context = SolverContext(indata)
+    parts = components(context.C)
+    assert len(parts) == 2
+    for part in parts:
+        component = Component(part, context)
+        expected = [tuple(edge) for edge in indata.edges[component.edges].tolist()]
+        edges = [(component.vertices[u], component.vertices[v]) for u, v in component.context.edges]
+        assert edges == expected
+    assert any(u > v for u, v in expected)
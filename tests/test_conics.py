@@ -0,0 +1,61 @@
+import numpy
+from compas.geometry import Circle
+from compas.geometry import Ellipse
+from compas.geometry import Frame
+
+from compas_dr.constraints import CircleConstraint
+from compas_dr.constraints import Constraint
+from compas_dr.constraints import EllipseConstraint
+
+
+def samples(geometry, n=100000):
+    frame = geometry.frame
+    t = numpy.linspace(0, 2 * numpy.pi, n, endpoint=False)[:, None]
+    if isinstance(geometry, Circle):
+        a = b = geometry.radius
+    else:
+        a, b = geometry.major, geometry.minor
+    return numpy.asarray(frame.point) + a * numpy.cos(t) * numpy.asarray(frame.xaxis) + b * numpy.sin(t) * numpy.asarray(frame.yaxis)
+
+
+def points():
+    # random points, the centre, and points on the axes inside and outside
+
+    frame = Frame([1, 2, 3], [1, 1, 0], [-1, 1, 1])
+    local = numpy.random.default_rng(0).random((50, 3)) * 12 - 6
+    local = numpy.concatenate([local, [[0, 0, 0], [0, 0, 2], [1, 0, 0], [7, 0, 0], [-1, 0, 1], [0, 1, 0], [0, -7, 0], [0, 0.5, -1]]])
+    xyz = numpy.asarray(frame.point) + local.dot([frame.xaxis, frame.yaxis, frame.zaxis])
+    return frame, xyz
+
+
+def check(constraint, xyz):
+    closest, params, frames = constraint.project_points(xyz)
+    brute = samples(constraint.geometry)
+    for point, p in zip(xyz, closest):
+        distances = numpy.linalg.norm(brute - point, axis=1)
+        assert numpy.isclose(numpy.linalg.norm(p - point), distances.min(), atol=1e-6)
+    assert numpy.allclose(closest, [constraint.geometry.point_at(t) for t in params])
+    assert numpy.allclose(numpy.linalg.norm(frames, axis=1), 1.0)
+    assert numpy.allclose([constraint.geometry.tangent_at(t).unitized().dot(f) for t, f in zip(params, frames)], 1.0)
+
+    # the projection of a single vertex matches the projection of all vertices at once
+    # up to the choice between equally close points, for example for the centre
+
+    for point, p in zip(xyz, closest):
+        constraint.location = point
+        assert numpy.isclose(constraint.location.distance_to_point(point), numpy.linalg.norm(p - point))
+        assert numpy.allclose(constraint.location, constraint.geometry.point_at(constraint.param))
+
+
+def test_circle_projection():
+    frame, xyz = points()
+    constraint = Constraint(Circle(5.0, frame=frame))
+    assert isinstance(constraint, CircleConstraint)
+    check(constraint, xyz)
+
+
+def test_ellipse_projection():
+    frame, xyz = points()
+    constraint = Constraint(Ellipse(4.0, 2.0, frame=frame))
+    assert isinstance(constraint, EllipseConstraint)
+    check(constraint, xyz)
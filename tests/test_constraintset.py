@@ -0,0 +1,36 @@
+from compas.data import json_dumps
+from compas.data import json_loads
+from compas.geometry import Line
+from compas.geometry import Plane
+
+from compas_dr.constraints import Constraint
+from compas_dr.constraints import ConstraintSet
+
+
+def constraintset():
+    constraints = ConstraintSet()
+    constraints.add(Constraint(Line([0, 0, 0], [1, 0, 0])), [0, 3, 7])
+    constraints.add(Constraint(Plane([0, 0, 0], [0, 0, 1])), [5])
+    return constraints
+
+
+def test_constraintset_survives_serialization():
+    constraints = constraintset()
+    data = json_loads(json_dumps(constraints))
+    assert len(data) == 4
+    assert [list(vertices) for _, vertices in data] == [[0, 3, 7], [5]]
+    assert data[3] is data[0]
+    assert data[3].geometry == constraints[3].geometry
+    assert data[5].geometry == constraints[5].geometry
+    assert list(data.vertices) == list(constraints.vertices)
+
+
+def test_remapped_constraintset():
+    constraints = constraintset()
+    mapping = [2, -1, -1, 0, -1, -1, -1, 1]
+    remapped = constraints.remapped(mapping)
+    assert len(remapped) == 3
+    assert list(remapped.vertices) == [2, 0, 1]
+    assert remapped[0] is constraints[3]
+    assert 5 not in remapped
+    assert len(remapped.constraints) == 1
@@ -0,0 +1,86 @@
+import numpy
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas.geometry import Cylinder
+from compas.geometry import Frame
+from compas.geometry import Plane
+
+from compas_dr.constraints import BoxContact
+from compas_dr.constraints import Contact
+from compas_dr.constraints import CylinderContact
+from compas_dr.constraints import PlaneContact
+from compas_dr.numdata import InputData
+from compas_dr.solvers import dr_constrained_numpy
+
+
+def test_plane_contact():
+    contact = Contact(Plane([0, 0, 1], [0, 0, 2]))
+    assert isinstance(contact, PlaneContact)
+
+    x = numpy.array([[0, 0, 2], [1, 0, 0], [2, 0, -1]], dtype=float)
+    v = numpy.array([[0, 0, -1], [0, 1, -1], [1, 0, 1]], dtype=float)
+    assert contact.resolve(x, v).tolist() == [1, 2]
+    assert numpy.allclose(x, [[0, 0, 2], [1, 0, 1], [2, 0, 1]])
+    assert numpy.allclose(v, [[0, 0, -1], [0, 1, 0], [1, 0, 1]])
+
+    # only the inward components of the residuals of the vertices in contact are removed
+
+    r = numpy.array([[0, 0, -1], [1, 0, -1], [0, 0, -1]], dtype=float)
+    contact.react(r)
+    assert numpy.allclose(r, [[0, 0, -1], [1, 0, 0], [0, 0, 0]])
+
+
+def test_plane_contact_evaluated_vertices():
+    contact = Contact(Plane([0, 0, 0], [0, 0, 1]))
+    x = numpy.array([[0, 0, -1], [1, 0, -1]], dtype=float)
+    assert contact.resolve(x, vertices=[1]).tolist() == [1]
+    assert numpy.allclose(x, [[0, 0, -1], [1, 0, 0]])
+
+
+def test_box_contact():
+    contact = Contact(Box(2, 2, 2, Frame([1, 0, 0], [1, 0, 0], [0, 1, 0])))
+    assert isinstance(contact, BoxContact)
+
+    x = numpy.array([[1, 0, 0], [3, 0, 0], [1, 0.5, -2], [3, 2, 0]], dtype=float)
+    assert contact.resolve(x).tolist() == [1, 2, 3]
+    assert numpy.allclose(x, [[1, 0, 0], [2, 0, 0], [1, 0.5, -1], [2, 1, 0]])
+    assert numpy.allclose(contact.normals[:2], [[-1, 0, 0], [0, 0, 1]])
+    assert numpy.allclose(contact.normals[2], [-(0.5**0.5), -(0.5**0.5), 0])
+
+
+def test_cylinder_contact():
+    contact = Contact(Cylinder(1.0, 4.0))
+    assert isinstance(contact, CylinderContact)
+
+    x = numpy.array([[0.5, 0, 0], [3, 0, 1], [0, 0.5, 3], [0, -2, -3]], dtype=float)
+    assert contact.resolve(x).tolist() == [1, 2, 3]
+    assert numpy.allclose(x, [[0.5, 0, 0], [1, 0, 1], [0, 0.5, 2], [0, -1, -2]])
+    assert numpy.allclose(contact.normals[:2], [[-1, 0, 0], [0, 0, -1]])
+    assert numpy.allclose(contact.normals[2], [0, 0.5**0.5, 0.5**0.5])
+
+
+def test_ground_contact():
+    # a sagging grid that is supported at the corners lands on a plane below the supports
+
+    mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    vertex_index = {vertex: index for index, vertex in enumerate(mesh.vertices())}
+    vertices = mesh.vertices_attributes("xyz")
+    edges = [(vertex_index[u], vertex_index[v]) for u, v in mesh.edges()]
+    fixed = [vertex_index[vertex] for vertex in mesh.vertices_where(vertex_degree=2)]
+    loads = [[0, 0, -1]] * len(vertices)
+    indata = InputData(vertices, edges, fixed, loads, [1.0] * len(edges))
+
+    free = dr_constrained_numpy(indata=indata, constraints=[])
+    below = numpy.flatnonzero(free.xyz[:, 2] < -1.0).tolist()
+    assert below
+
+    ground = Contact(Plane([0, 0, -1.0], [0, 0, 1]))
+    result = dr_constrained_numpy(indata=indata, constraints=[], contacts=[ground])
+    assert len(result.contacts) == 1
+
+    contacts = result.contacts[0]
+    assert len(contacts)
+    assert not set(contacts.tolist()) & set(fixed)
+    assert numpy.allclose(result.xyz[contacts, 2], -1.0)
+    assert result.xyz[:, 2].min() > -1.0 - 1e-9
+    assert set(contacts.tolist()) <= set(below)
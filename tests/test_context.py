@@ -0,0 +1,71 @@
+import numpy
+import pytest
+from compas.datastructures import Mesh
+
+from compas_dr.numdata import InputData
+from compas_dr.solvers import AssemblyPlan
+from compas_dr.solvers import SolverContext
+from compas_dr.solvers import dr_numpy
+
+
+def context():
+    mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    fixed = list(mesh.vertices_where(vertex_degree=2))
+    loads = [[0, 0, -0.1]] * mesh.number_of_vertices()
+    qpre = [1.0] * mesh.number_of_edges()
+    context = SolverContext(InputData.from_mesh(mesh, fixed, loads, qpre))
+    dr_numpy(context)
+    return context
+
+
+def assert_plans(context):
+    q = numpy.random.default_rng(0).random(context.C.shape[0])
+    for plan, Ca, Cb in (
+        (context.plan, context.Ci, context.C),
+        (context.plan_free, context.Ci, context.Ci),
+        (context.plan_fixed, context.Ci, context.Cf),
+    ):
+        expected = AssemblyPlan(Ca, Cb).assemble(q).toarray()
+        assert numpy.allclose(plan.assemble(q).toarray(), expected)
+
+
+def test_fixed_vertices_patch_the_plan():
+    ctx = context()
+    plan = ctx.plan
+    ctx.add_fixed([12, 13, 40])
+    assert ctx._plan is not None and ctx._plan is not plan
+    assert_plans(ctx)
+    ctx.remove_fixed([13, 40, 0])
+    assert_plans(ctx)
+    dr_numpy(ctx)
+
+
+def test_edges_patch_the_plan():
+    ctx = context()
+    ctx.plan
+    edges = ctx.add_edges([(12, 34), (56, 78)], qpre=[2.0, 2.0])
+    assert ctx._plan is not None
+    assert_plans(ctx)
+    ctx.remove_edges(edges[:1] + [0, 5])
+    assert ctx._plan is not None
+    assert_plans(ctx)
+    dr_numpy(ctx)
+
+
+def test_updates_use_the_original_indices():
+    expected = context()
+    reordered = InputData.from_mesh(Mesh.from_meshgrid(dx=10, nx=10), expected.indata.fixed, expected.indata.loads, expected.indata.qpre)
+    reordered.reorder()
+    ctx = SolverContext(reordered)
+    dr_numpy(ctx)
+    for c in (expected, ctx):
+        c.update_edges([3, 17], qpre=[5.0, 5.0])
+        c.add_fixed([12, 40])
+        c.remove_fixed([40])
+        c.add_edges([(12, 34), (56, 78)], qpre=[2.0, 2.0])
+    a = dr_numpy(expected)
+    b = dr_numpy(ctx)
+    assert numpy.allclose(a.xyz, b.xyz, atol=1e-6)
+    assert numpy.allclose(a.forces, b.forces, atol=1e-6)
+    with pytest.raises(ValueError):
+        ctx.remove_edges([0])
@@ -0,0 +1,67 @@
+import numpy
+import pytest
+from compas.datastructures import Mesh
+from compas.geometry import Line
+
+from compas_dr.constraints import Constraint
+from compas_dr.constraints import ConstraintSet
+from compas_dr.numdata import InputData
+from compas_dr.solvers import dr_constrained_numpy
+from compas_dr.solvers import dr_numpy
+from compas_dr.solvers.convergence import ConvergenceCriteria
+
+
+def grid():
+    mesh = Mesh.from_meshgrid(dx=10, nx=6)
+    fixed = list(mesh.vertices_where(vertex_degree=2))
+    loads = [[0, 0, -0.1]] * mesh.number_of_vertices()
+    qpre = [1.0] * mesh.number_of_edges()
+    return InputData.from_mesh(mesh, fixed, loads, qpre)
+
+
+@pytest.mark.parametrize("check_interval", [1, 10])
+@pytest.mark.parametrize("norm_type", ["l2", "max", "relative"])
+def test_criteria_reach_the_equilibrium(norm_type, check_interval):
+    expected = dr_numpy(grid(), tol1=1e-6)
+    iterations = []
+    result = dr_numpy(grid(), tol1=1e-6, norm_type=norm_type, check_interval=check_interval, callback=lambda k, *args: iterations.append(k))
+    assert numpy.allclose(result.xyz, expected.xyz, atol=1e-3)
+    assert all((k + 1) % check_interval == 0 for k in iterations)
+
+
+def test_criteria_are_validated():
+    with pytest.raises(ValueError):
+        dr_numpy(grid(), norm_type="l1")
+    with pytest.raises(ValueError):
+        dr_numpy(grid(), check_interval=0)
+
+
+def test_relative_criteria_are_scaled_by_the_loads():
+    indata = grid()
+    l2 = []
+    relative = []
+    dr_numpy(grid(), kmax=20, callback=lambda k, x, crit1, crit2, args: l2.append(crit1))
+    dr_numpy(grid(), kmax=20, norm_type="relative", callback=lambda k, x, crit1, crit2, args: relative.append(crit1))
+    assert numpy.allclose(numpy.array(l2) / numpy.linalg.norm(indata.loads[indata.free]), relative)
+
+
+def test_constraint_criteria():
+    criteria = ConvergenceCriteria(norm_type="max")
+    assert criteria.constraints(numpy.array([[0.0, -3.0, 0.0]])) == criteria.forces(numpy.array([[0.0, -3.0, 0.0]]))
+
+    # the residual forces along the constraints of the constrained vertices are compared with tol3
+    # the centre of the grid is constrained to a vertical line
+
+    indata = grid()
+    vertex = 24
+    x, y, z = indata.vertices[vertex]
+    counts = []
+    for tol3 in (1e-1, 1e-7):
+        iterations = []
+        constraints = ConstraintSet()
+        constraints.add(Constraint(Line([x, y, z - 100], [x, y, z + 100])), [vertex])
+        result = dr_constrained_numpy(indata=grid(), constraints=constraints, tol1=1e-2, tol2=0, tol3=tol3, callback=lambda k, *args: iterations.append(k))
+        assert numpy.allclose(result.xyz[vertex, :2], [x, y])
+        assert abs(result.residuals[vertex, 2]) < tol3
+        counts.append(len(iterations))
+    assert counts[0] < counts[1]
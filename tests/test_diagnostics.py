@@ -0,0 +1,80 @@
+import numpy
+from compas.datastructures import Mesh
+
+from compas_dr.numdata import InputData
+from compas_dr.solvers import diagnose_numpy
+
+
+def chain(qpre, fixed=(0,)):
+    vertices = [[i, 0, 0] for i in range(len(qpre) + 1)]
+    edges = [[i, i + 1] for i in range(len(qpre))]
+    loads = [[0, 0, -1]] * len(vertices)
+    return InputData(vertices, edges, list(fixed), loads, qpre)
+
+
+def test_floating_components():
+    vertices = [[0, 0, 0], [1, 0, 0], [2, 0, 0], [0, 1, 0], [1, 1, 0]]
+    edges = [[0, 1], [1, 2], [3, 4]]
+    loads = [[0, 0, -1]] * 5
+    diagnosis = diagnose_numpy(InputData(vertices, edges, [0, 2], loads, [1.0, 1.0, 1.0]))
+    assert [vertices.tolist() for vertices in diagnosis.floating] == [[3, 4]]
+    assert not len(diagnosis.massless)
+    assert not len(diagnosis.mechanisms)
+    assert not diagnosis.is_valid
+
+
+def test_massless_vertices():
+    diagnosis = diagnose_numpy(chain([0.0, 0.0, 1.0, 1.0], fixed=(0, 4)))
+    assert diagnosis.massless.tolist() == [1]
+    assert diagnosis.mechanisms.tolist() == [1]
+    assert not diagnosis.floating
+
+
+def test_mechanisms():
+    diagnosis = diagnose_numpy(chain([0.0, 1.0, 1.0]))
+    assert diagnosis.mechanisms.tolist() == [1, 2, 3]
+    assert not len(diagnosis.massless)
+    assert not diagnosis.floating
+
+
+def test_zero_length_edges():
+    indata = InputData([[0, 0, 0], [1, 0, 0], [1, 0, 0]], [[0, 1], [1, 2]], [0, 2], [[0, 0, -1]] * 3, [1.0, 1.0])
+    diagnosis = diagnose_numpy(indata)
+    assert diagnosis.degenerate.tolist() == [1]
+
+
+def test_valid_network():
+    diagnosis = diagnose_numpy(chain([1.0, 1.0], fixed=(0, 2)))
+    assert diagnosis.is_valid
+
+
+def problems():
+    # a supported grid with a strip of slack edges and an edge of zero length
+    # and a floating grid
+
+    mesh = Mesh.from_meshgrid(dx=10, nx=6)
+    vertex_index = {vertex: index for index, vertex in enumerate(mesh.vertices())}
+    vertices = mesh.vertices_attributes("xyz")
+    edges = [(vertex_index[u], vertex_index[v]) for u, v in mesh.edges()]
+    fixed = [vertex_index[vertex] for vertex in mesh.vertices_where(vertex_degree=2)]
+    n = len(vertices)
+    qpre = [0.0 if vertices[u][0] > 8 and vertices[v][0] > 8 else 1.0 for u, v in edges]
+
+    vertices = vertices + [[x + 20, y, z] for x, y, z in vertices] + [vertices[14]]
+    edges = edges + [(u + n, v + n) for u, v in edges] + [(14, 2 * n)]
+    qpre = qpre + [1.0] * (len(edges) - len(qpre))
+    loads = [[0, 0, -0.1]] * len(vertices)
+    return InputData(vertices, edges, fixed, loads, qpre)
+
+
+def test_reordered_diagnosis_uses_the_original_indices():
+    expected = diagnose_numpy(problems())
+    assert expected.floating and len(expected.massless) and len(expected.mechanisms) and len(expected.degenerate)
+    for method in ("rcm", "morton"):
+        indata = problems()
+        indata.reorder(method)
+        diagnosis = diagnose_numpy(indata)
+        assert [vertices.tolist() for vertices in diagnosis.floating] == [vertices.tolist() for vertices in expected.floating]
+        assert numpy.array_equal(diagnosis.massless, expected.massless)
+        assert numpy.array_equal(diagnosis.mechanisms, expected.mechanisms)
+        assert numpy.array_equal(diagnosis.degenerate, expected.degenerate)
@@ -0,0 +1,45 @@
+import numpy
+import pytest
+from compas.datastructures import Mesh
+
+from compas_dr.numdata import InputData
+from compas_dr.solvers import SolverContext
+from compas_dr.solvers import dr
+from compas_dr.solvers import dr_numpy
+
+
+def indata():
+    mesh = Mesh.from_meshgrid(dx=10, nx=6)
+    fixed = list(mesh.vertices_where(vertex_degree=2))
+    loads = [[0, 0, -0.1]] * mesh.number_of_vertices()
+    qpre = [1.0] * mesh.number_of_edges()
+    return InputData.from_mesh(mesh, fixed, loads, qpre)
+
+
+def test_context_caches_the_adjacency():
+    context = SolverContext(indata())
+    dr(context, kmax=500)
+    adjacency = context.adjacency
+    edge_index = context.edge_index
+    xyz = dr(context, kmax=500)[0]
+    assert context.adjacency is adjacency
+    assert context.edge_index is edge_index
+    assert numpy.allclose(context.x, xyz)
+    assert numpy.allclose(xyz, dr_numpy(indata(), kmax=500).xyz, atol=1e-2)
+
+
+def test_context_adjacency_follows_the_edges():
+    context = SolverContext(indata())
+    adjacency = context.adjacency
+    context.remove_edges([0])
+    assert context.adjacency is not adjacency
+    i, j = context.edges[0]
+    assert context.edge_index[(i, j)] == context.edge_index[(j, i)] == 0
+    dr(context)
+
+
+def test_context_rejects_reordered_input():
+    data = indata()
+    data.reorder()
+    with pytest.raises(ValueError):
+        dr(SolverContext(data))
@@ -0,0 +1,51 @@
+import numpy
+from compas.datastructures import Mesh
+
+from compas_dr.numdata import InputData
+from compas_dr.solvers import Clearance
+from compas_dr.solvers import dr_numpy
+
+
+MESH = Mesh.from_meshgrid(dx=10, nx=6)
+M = MESH.number_of_edges()
+
+
+def grid(**kwargs):
+    fixed = list(MESH.vertices_where(vertex_degree=2))
+    loads = [[0, 0, -0.1]] * MESH.number_of_vertices()
+    return InputData.from_mesh(MESH, fixed, loads, **kwargs)
+
+
+def test_fdm_without_prescribed_force_densities():
+    indata = grid(qpre=[0.0] * M, E=[1e4] * M, radius=[1.0] * M, linit=[1.5] * M)
+    expected = dr_numpy(indata)
+    result = dr_numpy(indata, method="fdm")
+    assert numpy.isfinite(result.xyz).all()
+    assert numpy.allclose(result.xyz, expected.xyz, atol=1e-2)
+
+
+def test_fdm_with_clearance_iterates():
+    iterations = []
+
+    def callback(k, x, crit1, crit2, args):
+        iterations.append(k)
+
+    dr_numpy(grid(qpre=[1.0] * M), method="fdm", clearance=Clearance(0.1), callback=callback)
+    assert iterations
+
+
+def test_fdm_with_prescribed_force_densities_is_linear():
+    iterations = []
+
+    def callback(k, x, crit1, crit2, args):
+        iterations.append(k)
+
+    expected = dr_numpy(grid(qpre=[1.0] * M), tol1=1e-6)
+    result = dr_numpy(grid(qpre=[1.0] * M), method="fdm", callback=callback)
+    assert not iterations
+    assert numpy.allclose(result.xyz, expected.xyz, atol=1e-3)
+
+    # the linear solution is exact, up to the loads at the supports
+
+    free = [index for index, vertex in enumerate(MESH.vertices()) if MESH.vertex_degree(vertex) > 2]
+    assert numpy.allclose(result.residuals[free], 0.0, atol=1e-9)
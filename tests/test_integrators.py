@@ -0,0 +1,40 @@
+import numpy
+import pytest
+from compas.datastructures import Mesh
+
+from compas_dr.numdata import InputData
+from compas_dr.solvers import dr_numpy
+
+
+def grid():
+    mesh = Mesh.from_meshgrid(dx=10, nx=6)
+    fixed = list(mesh.vertices_where(vertex_degree=2))
+    loads = [[0, 0, -0.1]] * mesh.number_of_vertices()
+    qpre = [1.0] * mesh.number_of_edges()
+    return InputData.from_mesh(mesh, fixed, loads, qpre)
+
+
+@pytest.mark.parametrize("integrator, dt", [("implicit", 1.0), ("implicit", 100.0), ("fire", 1.0), ("nesterov", 1.0)])
+def test_integrators_reach_the_rk_equilibrium(integrator, dt):
+    expected = dr_numpy(grid(), tol1=1e-6)
+    result = dr_numpy(grid(), tol1=1e-6, integrator=integrator, dt=dt)
+    assert numpy.allclose(result.xyz, expected.xyz, atol=1e-3)
+    assert numpy.linalg.norm(result.residuals[grid().free]) < 1e-3
+
+
+@pytest.mark.parametrize("integrator", ["rk", "implicit", "fire", "nesterov"])
+def test_integrators_start_from_equilibrium(integrator):
+    indata = InputData([[0, 0, 0], [1, 0, 0], [2, 0, 0]], [[0, 1], [1, 2]], [0, 2], [[0, 0, 0]] * 3, [1.0, 1.0])
+    result = dr_numpy(indata, tol1=0, integrator=integrator)
+    assert numpy.allclose(result.xyz, [[0, 0, 0], [1, 0, 0], [2, 0, 0]])
+
+
+@pytest.mark.parametrize("rk_steps", [2, 4])
+def test_reused_residuals_match_the_final_geometry(rk_steps):
+    indata = grid()
+    criteria = []
+    result = dr_numpy(indata, rk_steps=rk_steps, callback=lambda k, x, crit1, crit2, args: criteria.append(crit1))
+    C = indata.C
+    residuals = indata.loads - C.T.dot(result.q * C.dot(result.xyz))
+    assert numpy.allclose(result.residuals, residuals)
+    assert criteria[-1] == pytest.approx(numpy.linalg.norm(residuals[indata.free]))
@@ -0,0 +1,45 @@
+import numpy
+from compas.datastructures import Mesh
+
+from compas_dr.constraints import Constraint
+from compas_dr.constraints import MeshConstraint
+from compas_dr.constraints.bvh import closest_points_on_triangles
+
+
+def surface():
+    mesh = Mesh.from_meshgrid(dx=10, nx=12)
+    for vertex in mesh.vertices():
+        x, y, _ = mesh.vertex_coordinates(vertex)
+        mesh.vertex_attribute(vertex, "z", numpy.sin(0.5 * x) * numpy.cos(0.3 * y))
+    return mesh
+
+
+def test_mesh_projection_matches_brute_force():
+    constraint = Constraint(surface(), leaf_size=4)
+    assert isinstance(constraint, MeshConstraint)
+
+    points = numpy.random.default_rng(0).random((100, 3)) * [12, 12, 4] - [1, 1, 2]
+    closest, triangles, normals = constraint.project_points(points)
+
+    vertices, faces = constraint.geometry.to_vertices_and_faces()
+    vertices = numpy.array(vertices)
+    triangulated = numpy.array([[face[0], face[i], face[i + 1]] for face in faces for i in range(1, len(face) - 1)])
+    a, b, c = (vertices[triangulated[:, i]] for i in range(3))
+    for point, xyz, triangle in zip(points, closest, triangles):
+        candidates = closest_points_on_triangles(numpy.tile(point, (len(a), 1)), a, b, c)
+        distances = numpy.linalg.norm(candidates - point, axis=1)
+        assert numpy.isclose(numpy.linalg.norm(xyz - point), distances.min())
+        assert numpy.isclose(distances[triangle], distances.min())
+    assert numpy.allclose(numpy.linalg.norm(normals, axis=1), 1.0)
+
+    # starting from the triangles of the previous projections gives the same result
+
+    again, _, _ = constraint.project_points(points, triangles)
+    assert numpy.allclose(again, closest)
+
+
+def test_mesh_constraint_location():
+    constraint = Constraint(surface())
+    constraint.location = [3.0, 4.0, 2.0]
+    expected, _, _ = constraint.project_points([[3.0, 4.0, 2.0]])
+    assert numpy.allclose(constraint.location, expected[0])
@@ -0,0 +1,25 @@
+import numpy
+from compas.data import json_dumps
+from compas.data import json_loads
+from compas.geometry import Line
+from compas.geometry import Pointcloud
+
+from compas_dr.constraints import MultiConstraint
+
+
+def test_multiconstraint_survives_serialization():
+    cloud = Pointcloud([[0, 0, 0], [1, 0, 0], [2, 0, 0]])
+    constraint = MultiConstraint(cloud, tolerance=0.5, weight=0.5)
+    data = json_loads(json_dumps(constraint))
+    assert data.constraint.tolerance == 0.5
+    assert data.constraint.weight == 0.5
+    data.locations = [[0.2, 1.0, 0.0]]
+    assert numpy.allclose(data.locations, [[0.1, 0.5, 0.0]])
+
+
+def test_multiconstraint_serializes_the_current_tolerance():
+    constraint = MultiConstraint(Line([0, 0, 0], [1, 0, 0]))
+    constraint.constraint.tolerance = 0.25
+    data = json_loads(json_dumps(constraint))
+    assert data.constraint.tolerance == 0.25
+    assert data.geometry == constraint.geometry
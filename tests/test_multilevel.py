@@ -0,0 +1,46 @@
+import importlib
+
+import numpy
+from compas.datastructures import Mesh
+
+from compas_dr.numdata import InputData
+from compas_dr.solvers import SolverContext
+from compas_dr.solvers import dr_multilevel_numpy
+from compas_dr.solvers import dr_numpy
+from compas_dr.solvers.dr_multilevel_numpy import prolongate
+
+
+def grid():
+    mesh = Mesh.from_meshgrid(dx=10, nx=30)
+    fixed = list(mesh.vertices_where(vertex_degree=2))
+    loads = [[0, 0, -0.01]] * mesh.number_of_vertices()
+    qpre = [1.0] * mesh.number_of_edges()
+    return InputData.from_mesh(mesh, fixed, loads, qpre)
+
+
+def test_multilevel_matches_dr_numpy_in_fewer_iterations(monkeypatch):
+    iterations = []
+    expected = dr_numpy(grid(), tol1=1e-5, callback=lambda k, *args: iterations.append(k))
+
+    # the iterations on the original network are counted in all calls of dr_numpy
+
+    context = SolverContext(grid())
+    fine = []
+
+    def counted(indata, **kwargs):
+        if indata is context:
+            kwargs["callback"] = lambda k, *args: fine.append(k)
+        return dr_numpy(indata, **kwargs)
+
+    monkeypatch.setattr(importlib.import_module("compas_dr.solvers.dr_multilevel_numpy"), "dr_numpy", counted)
+    result = dr_multilevel_numpy(context, tol1=1e-5)
+
+    assert numpy.allclose(result.xyz, expected.xyz, atol=1e-3)
+    assert len(fine) < len(iterations) / 2
+
+
+def test_prolongate_vertex_without_edges():
+    context = SolverContext(InputData([[0, 0, 0], [1, 0, 0], [2, 0, 0], [5, 5, 0]], [(0, 1), (1, 2)], [0, 2], [[0, 0, 0]] * 4, [1.0, 1.0]))
+    d = prolongate(context, numpy.array([0, 1, 2, 3]), numpy.ones((4, 3)))
+    assert numpy.isfinite(d).all()
+    assert numpy.allclose(d[3], 1.0)
@@ -0,0 +1,27 @@
+import numpy
+import pytest
+from compas.datastructures import Mesh
+
+from compas_dr.numdata import InputData
+from compas_dr.solvers import dr_constrained_numpy
+from compas_dr.solvers import dr_numpy
+
+MESH = Mesh.from_meshgrid(dx=10, nx=6)
+M = MESH.number_of_edges()
+
+
+def grid():
+    fixed = list(MESH.vertices_where(vertex_degree=2))
+    loads = [[0, 0, -0.1]] * MESH.number_of_vertices()
+    return InputData.from_mesh(MESH, fixed, loads, qpre=[0.5] * M, fpre=[0.5] * M)
+
+
+@pytest.mark.parametrize("solver", ["dr_numpy", "dr_constrained_numpy"])
+def test_newton_polishes_prescribed_forces(solver):
+    indata = grid()
+    if solver == "dr_numpy":
+        result = dr_numpy(indata, tol1=1e-8, newton_tol=1e-2)
+    else:
+        result = dr_constrained_numpy(indata=indata, constraints=[], tol1=1e-8, newton_tol=1e-2)
+    assert numpy.allclose(result.forces, 0.5 + 0.5 * result.lengths)
+    assert numpy.linalg.norm(result.residuals[indata.free]) < 1e-8
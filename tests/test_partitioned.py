@@ -0,0 +1,43 @@
+import numpy
+import pytest
+from compas.datastructures import Mesh
+
+from compas_dr.numdata import InputData
+from compas_dr.solvers import dr_numpy
+from compas_dr.solvers import dr_partitioned_numpy
+
+
+def grid():
+    mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    fixed = list(mesh.vertices_where(vertex_degree=2))
+    loads = [[0, 0, -0.1]] * mesh.number_of_vertices()
+    qpre = [1.0] * mesh.number_of_edges()
+    return InputData.from_mesh(mesh, fixed, loads, qpre)
+
+
+@pytest.mark.parametrize("partition", ["bisection", "graph"])
+def test_partitioned_follows_the_global_trajectory(partition):
+    expected = dr_numpy(grid(), kmax=40, tol1=0, tol2=0)
+    result = dr_partitioned_numpy(grid(), partition=partition, kmax=40, exchange=5, tol1=0, tol2=0)
+    assert numpy.allclose(result.xyz, expected.xyz, atol=1e-12)
+    assert numpy.allclose(result.forces, expected.forces, atol=1e-12)
+
+
+@pytest.mark.parametrize("partition", ["bisection", "graph"])
+def test_partitioned_matches_dr_numpy(partition):
+    expected = dr_numpy(grid())
+    result = dr_partitioned_numpy(grid(), partition=partition)
+    assert numpy.allclose(result.xyz, expected.xyz, atol=1e-2)
+
+
+def test_partitioned_stops_at_kmax():
+    iterations = []
+    expected = dr_numpy(grid(), kmax=42, tol1=0, tol2=0)
+    result = dr_partitioned_numpy(grid(), kmax=42, exchange=5, tol1=0, tol2=0, callback=lambda k, *args: iterations.append(k))
+    assert iterations == [5, 10, 15, 20, 25, 30, 35, 40, 42]
+    assert numpy.allclose(result.xyz, expected.xyz, atol=1e-12)
+
+
+def test_partitioned_rejects_zero_exchange():
+    with pytest.raises(ValueError):
+        dr_partitioned_numpy(grid(), exchange=0)
@@ -0,0 +1,45 @@
+import numpy
+from compas.geometry import Pointcloud
+
+from compas_dr.constraints import Constraint
+from compas_dr.constraints import MultiConstraint
+from compas_dr.constraints import PointcloudConstraint
+
+
+def test_pointcloud_requery_beyond_tolerance():
+    cloud = Pointcloud([[0, 0, 0], [0.1, 0, 0], [1, 0, 0]])
+    constraint = Constraint(cloud, tolerance=0.5, weight=0.0)
+    assert isinstance(constraint, PointcloudConstraint)
+
+    _, params, _ = constraint.project_points([[0.04, 0, 0]])
+    assert params.tolist() == [0]
+
+    # within the tolerance the previous nearest point is kept, even if another point is nearer
+
+    _, params, _ = constraint.project_points([[0.09, 0, 0]], params)
+    assert params.tolist() == [0]
+
+    # beyond the tolerance the nearest point is searched again
+
+    _, params, _ = constraint.project_points([[0.9, 0, 0]], params)
+    assert params.tolist() == [2]
+
+
+def test_pointcloud_attraction_weight():
+    cloud = Pointcloud([[0, 0, 0], [5, 0, 0]])
+    points = numpy.array([[0, 1, 0], [5, 0, 2]], dtype=float)
+
+    pinned, params, _ = Constraint(cloud).project_points(points)
+    assert params.tolist() == [0, 1]
+    assert numpy.allclose(pinned, [[0, 0, 0], [5, 0, 0]])
+
+    attracted, _, _ = Constraint(cloud, weight=0.25).project_points(points)
+    assert numpy.allclose(attracted, points + 0.25 * (pinned - points))
+
+
+def test_pointcloud_multiconstraint():
+    cloud = Pointcloud([[0, 0, 0], [0.1, 0, 0], [1, 0, 0]])
+    constraint = MultiConstraint(cloud, tolerance=0.5, weight=0.5)
+    constraint.locations = [[0.04, 0, 0], [1, 1, 0]]
+    assert constraint.params.tolist() == [0, 2]
+    assert numpy.allclose(constraint.locations, [[0.02, 0, 0], [1, 0.5, 0]])
@@ -0,0 +1,161 @@
+import math
+
+import numpy
+from compas.data import json_dumps
+from compas.data import json_loads
+from compas.datastructures import Mesh
+from compas.geometry import Circle
+from compas.geometry import Ellipse
+from compas.geometry import Line
+from compas.geometry import NurbsCurve
+from compas.geometry import NurbsSurface
+from compas.geometry import Plane
+from compas.geometry import Point
+from compas.geometry import Pointcloud
+from compas.geometry import Vector
+
+from compas_dr.constraints import Constraint
+from compas_dr.constraints import CurveConstraint
+from compas_dr.constraints import SurfaceConstraint
+
+
+class Helix:
+    __data__ = {}
+    domain = (0.0, 4 * math.pi)
+
+    def __init__(self):
+        self.searches = 0
+
+    def point_at(self, t):
+        return Point(math.cos(t), math.sin(t), 0.1 * t)
+
+    def tangent_at(self, t):
+        return Vector(-math.sin(t), math.cos(t), 0.1)
+
+    def closest_point(self, point, return_parameter=False):
+        self.searches += 1
+        t = numpy.linspace(*self.domain, 20001)
+        xyz = numpy.column_stack([numpy.cos(t), numpy.sin(t), 0.1 * t])
+        i = numpy.argmin(numpy.linalg.norm(xyz - point, axis=1))
+        return Point(*xyz[i]), t[i]
+
+
+class Paraboloid:
+    __data__ = {}
+    domain_u = (-1.0, 1.0)
+    domain_v = (-1.0, 1.0)
+
+    def __init__(self):
+        self.searches = 0
+
+    def point_at(self, u, v):
+        return Point(u, v, u**2 + v**2)
+
+    def curvature_at(self, u, v):
+        return None, None, None, Vector(-2 * u, -2 * v, 1.0)
+
+    def closest_point(self, point, return_parameters=False):
+        self.searches += 1
+        u, v = numpy.meshgrid(numpy.linspace(-1, 1, 401), numpy.linspace(-1, 1, 401), indexing="ij")
+        xyz = numpy.stack([u, v, u**2 + v**2], axis=-1).reshape((-1, 3))
+        i = numpy.argmin(numpy.linalg.norm(xyz - point, axis=1))
+        return Point(*xyz[i]), (u.ravel()[i], v.ravel()[i])
+
+
+Constraint.register(Helix, CurveConstraint)
+Constraint.register(Paraboloid, SurfaceConstraint)
+
+
+def test_curve_projection_starts_from_params():
+    helix = Helix()
+    constraint = CurveConstraint(helix)
+    t = numpy.array([1.0, 2.0, 5.0, 9.0])
+    points = numpy.array([helix.point_at(x) for x in t]) * [1.05, 0.95, 1.0]
+    closest, params, frames = constraint.project_points(points, t + 0.05)
+    assert helix.searches == 0
+    expected, _, _ = constraint.project_points(points)
+    assert helix.searches == len(points)
+    assert numpy.allclose(closest, expected, atol=1e-3)
+    assert numpy.allclose(closest, [helix.point_at(x) for x in params])
+    assert numpy.allclose(numpy.linalg.norm(frames, axis=1), 1.0)
+
+
+def test_surface_projection_starts_from_params():
+    surface = Paraboloid()
+    constraint = SurfaceConstraint(surface)
+    uv = numpy.array([[0.1, 0.2], [-0.5, 0.3], [0.7, -0.6]])
+    points = numpy.array([surface.point_at(u, v) for u, v in uv]) + [0.0, 0.0, 0.05]
+    closest, params, frames = constraint.project_points(points, uv + 0.05)
+    assert surface.searches == 0
+    expected, _, _ = constraint.project_points(points)
+    assert surface.searches == len(points)
+    assert numpy.allclose(closest, expected, atol=1e-2)
+    assert numpy.allclose(closest, [surface.point_at(u, v) for u, v in params])
+
+    # the residual is normal to the surface at the projection
+
+    for point, xyz, (u, v) in zip(points, closest, params):
+        assert abs((point - xyz).dot([1.0, 0.0, 2 * u])) < 1e-6
+        assert abs((point - xyz).dot([0.0, 1.0, 2 * v])) < 1e-6
+
+
+def test_curve_projection_is_throttled_by_the_tolerance():
+    searches = []
+    for tolerance in (0.0, 0.1):
+        helix = Helix()
+        constraint = CurveConstraint(helix, tolerance=tolerance)
+        for t in numpy.linspace(1.0, 2.0, 101):
+            constraint.location = helix.point_at(t)
+            assert constraint.location.distance_to_point(helix.point_at(t)) < tolerance + 1e-3
+        searches.append(helix.searches)
+    assert searches[0] == 101
+    assert searches[1] < 20
+
+
+def test_tolerance_survives_serialization():
+    geometries = [Circle(5.0), Ellipse(4.0, 2.0), Line([0, 0, 0], [1, 0, 0]), Plane([0, 0, 0], [0, 0, 1]), Mesh.from_meshgrid(dx=1, nx=2), Pointcloud([[0, 0, 0]])]
+    for geometry in geometries:
+        constraint = json_loads(json_dumps(Constraint(geometry, tolerance=0.5)))
+        assert type(constraint) is type(Constraint(geometry))
+        assert constraint.tolerance == 0.5
+
+
+def test_projection_on_the_approximation():
+    helix = Helix()
+    constraint = CurveConstraint(helix, chord_tolerance=1e-4)
+    points = numpy.array([helix.point_at(t) for t in (1.0, 2.0, 5.0, 9.0)]) * [1.05, 0.95, 1.0]
+    closest, params, _ = constraint.project_points(points)
+    constraint.location = points[0]
+    assert helix.searches == 0
+    assert numpy.allclose(constraint.location, closest[0])
+    expected = CurveConstraint(Helix()).project_points(points)[0]
+    assert numpy.allclose(closest, expected, atol=1e-3)
+    assert numpy.allclose(closest, [helix.point_at(t) for t in params], atol=1e-3)
+
+    surface = Paraboloid()
+    constraint = SurfaceConstraint(surface, chord_tolerance=1e-4)
+    points = numpy.array([[0.1, 0.2, 0.3], [-0.5, 0.3, 0.2], [0.7, -0.6, 1.0]])
+    closest, params, _ = constraint.project_points(points)
+    constraint.location = points[0]
+    assert surface.searches == 0
+    assert numpy.allclose(constraint.location, closest[0])
+    expected = SurfaceConstraint(Paraboloid()).project_points(points)[0]
+    assert numpy.allclose(closest, expected, atol=1e-2)
+    assert numpy.allclose(closest, [surface.point_at(u, v) for u, v in params], atol=1e-3)
+
+
+def test_chord_tolerance_survives_serialization(monkeypatch):
+    # the NURBS geometry is replaced by the test geometry, which does not need a geometry plugin
+
+    monkeypatch.setattr(NurbsCurve, "__from_data__", staticmethod(lambda data: Helix()))
+    monkeypatch.setattr(NurbsSurface, "__from_data__", staticmethod(lambda data: Paraboloid()))
+    for constraint in (CurveConstraint(Helix(), tolerance=0.5, chord_tolerance=0.01), SurfaceConstraint(Paraboloid(), tolerance=0.5, chord_tolerance=0.01)):
+        data = json_loads(json_dumps(constraint.__data__))
+        assert data["chord_tolerance"] == 0.01
+        copy = type(constraint).__from_data__(data)
+        assert copy.tolerance == 0.5
+        assert copy.chord_tolerance == 0.01
+        assert copy.approximation is not None
+
+    assert "chord_tolerance" not in CurveConstraint(Helix()).__data__
+    assert CurveConstraint.__from_data__(CurveConstraint(Helix()).__data__).approximation is None
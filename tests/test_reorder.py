@@ -0,0 +1,48 @@
+import numpy
+import pytest
+from compas.data import json_dumps
+from compas.data import json_loads
+from compas.datastructures import Mesh
+from compas.geometry import Plane
+
+from compas_dr.numdata import InputData
+from compas_dr.solvers import dr_numpy
+from compas_dr.symmetry import MirrorSymmetry
+
+
+def grid():
+    mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    fixed = list(mesh.vertices_where(vertex_degree=2))
+    loads = [[0, 0, -0.1]] * mesh.number_of_vertices()
+    qpre = [1.0] * mesh.number_of_edges()
+    return InputData.from_mesh(mesh, fixed, loads, qpre)
+
+
+@pytest.mark.parametrize("method", ["rcm", "morton"])
+def test_reordered_solve_matches_the_original_order(method):
+    expected = dr_numpy(grid())
+    indata = grid()
+    indata.reorder(method)
+    result = dr_numpy(indata)
+    for name in ("xyz", "q", "forces", "lengths", "residuals"):
+        assert numpy.allclose(getattr(result, name), getattr(expected, name), atol=1e-12)
+
+
+@pytest.mark.parametrize("method", ["rcm", "morton"])
+def test_reordering_survives_serialization(method):
+    indata = grid()
+    indata.reorder(method)
+    data = json_loads(json_dumps(indata))
+    assert numpy.array_equal(data.vertex_order, indata.vertex_order)
+    assert numpy.array_equal(data.edge_order, indata.edge_order)
+    assert numpy.array_equal(data.vertices, indata.vertices)
+    assert numpy.allclose(dr_numpy(data).xyz, dr_numpy(grid()).xyz, atol=1e-12)
+
+
+def test_sector_survives_serialization():
+    indata = grid()
+    indata.reorder()
+    sector = indata.reduced(MirrorSymmetry(Plane([5, 0, 0], [1, 0, 0])))
+    data = json_loads(json_dumps(sector))
+    assert data.sector is not None
+    assert numpy.allclose(dr_numpy(data).xyz, dr_numpy(sector).xyz)
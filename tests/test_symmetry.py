@@ -0,0 +1,49 @@
+import numpy
+import pytest
+from compas.datastructures import Mesh
+from compas.geometry import Line
+from compas.geometry import Plane
+
+from compas_dr.numdata import InputData
+from compas_dr.solvers import dr_numpy
+from compas_dr.symmetry import MirrorSymmetry
+from compas_dr.symmetry import RotationalSymmetry
+
+MESH = Mesh.from_meshgrid(dx=10, nx=10)
+SYMMETRIES = [
+    MirrorSymmetry(Plane([5, 0, 0], [1, 0, 0])),
+    RotationalSymmetry(4, axis=Line([5, 5, 0], [5, 5, 1])),
+]
+
+
+def grid(fixed=None, loads=None):
+    if fixed is None:
+        fixed = list(MESH.vertices_where(vertex_degree=2))
+    if loads is None:
+        loads = [[0, 0, -0.1]] * MESH.number_of_vertices()
+    qpre = [1.0] * MESH.number_of_edges()
+    return InputData.from_mesh(MESH, fixed, loads, qpre)
+
+
+@pytest.mark.parametrize("symmetry", SYMMETRIES)
+def test_sector_reproduces_the_full_solve(symmetry):
+    expected = dr_numpy(grid(), tol1=1e-6)
+    result = dr_numpy(grid().reduced(symmetry), tol1=1e-6)
+    assert numpy.allclose(result.xyz, expected.xyz, atol=1e-4)
+    assert numpy.allclose(result.forces, expected.forces, atol=1e-4)
+    assert numpy.allclose(result.residuals, expected.residuals, atol=1e-4)
+
+
+@pytest.mark.parametrize("symmetry", SYMMETRIES)
+def test_asymmetric_loads_are_rejected(symmetry):
+    loads = [[0, 0, -0.1]] * MESH.number_of_vertices()
+    loads[12] = [0, 0, -1.0]
+    with pytest.raises(ValueError, match="loads"):
+        grid(loads=loads).reduced(symmetry)
+
+
+@pytest.mark.parametrize("symmetry", SYMMETRIES)
+def test_asymmetric_supports_are_rejected(symmetry):
+    fixed = list(MESH.vertices_where(vertex_degree=2)) + [12]
+    with pytest.raises(ValueError, match="supports"):
+        grid(fixed=fixed).reduced(symmetry)
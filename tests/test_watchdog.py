@@ -0,0 +1,61 @@
+import math
+
+import numpy
+
+from compas_dr.numdata import InputData
+from compas_dr.solvers import SolverContext
+from compas_dr.solvers import Watchdog
+from compas_dr.solvers import dr_numpy
+from compas_dr.solvers import fd_numpy
+
+
+def strut():
+    # a triangle of compressed edges, held by cables to the supports
+    # the fictitious masses underestimate the stiffness of the triangle
+    # and the explicit iterations diverge
+    vertices = [[math.cos(2 * math.pi * i / 3), math.sin(2 * math.pi * i / 3), 0.0] for i in range(3)]
+    edges = [[0, 1], [0, 2], [1, 2]]
+    qpre = [-0.9, -0.9, -0.9]
+    fixed = []
+    for i in range(3):
+        for d in (-0.5, 0.0, 0.5):
+            t = 2 * math.pi * i / 3 + d
+            fixed.append(len(vertices))
+            vertices.append([3 * math.cos(t), 3 * math.sin(t), 1.0])
+            edges.append([i, fixed[-1]])
+            qpre.append(1.0)
+    loads = [[0.0, 0.0, -1.0]] * len(vertices)
+    return InputData(vertices, edges, fixed, loads, qpre)
+
+
+def test_diverging_run_recovers():
+    result = dr_numpy(strut(), kmax=1000, tol1=1e-6)
+    assert not numpy.isfinite(result.xyz).all()
+
+    # without additional damping, only the larger masses stabilise the iterations
+
+    result = dr_numpy(strut(), kmax=1000, tol1=1e-6, watchdog=Watchdog(damping=1.0))
+    assert result.events
+    assert all(event["action"] == "restart" for event in result.events)
+    assert result.events[-1]["mass"] > 1.0
+    assert result.events[-1]["c"] == 0.1
+    expected = fd_numpy(SolverContext(strut()))
+    assert numpy.allclose(result.xyz, expected.xyz, atol=1e-4)
+
+
+def test_growth_from_zero_residuals():
+    # the growth is not checked against a reference norm of zero
+
+    watchdog = Watchdog(interval=1)
+    x = numpy.zeros((2, 3))
+    watchdog.save(0, numpy.zeros((2, 3)), x=x)
+    assert watchdog.check(x, numpy.full((2, 3), 1e-12)) is None
+    watchdog.save(1, numpy.full((2, 3), 1e-12), x=x)
+    assert watchdog.check(x, numpy.full((2, 3), 1e-9)) == "growth"
+
+
+def test_equilibrium_start():
+    indata = strut()
+    indata.vertices[:] = fd_numpy(SolverContext(strut())).xyz
+    result = dr_numpy(indata, kmax=100, watchdog=Watchdog(interval=1))
+    assert not result.events